@@ -0,0 +1,173 @@
+"""
+Throughput / tail latency: sync views under WSGI vs async views under ASGI.
+
+    python bench_asgi.py [--concurrency 64] [--seconds 10]
+
+Both variants run in uvicorn with one worker, so only the app interface
+changes:
+    wsgi: uvicorn --interface wsgi config.wsgi:application   (STORE_ASYNC_VIEWS=0)
+    asgi: uvicorn config.asgi:application                     (STORE_ASYNC_VIEWS=1)
+
+Uses a temporary SQLite database and DummyCache, so every request reaches
+the ORM instead of the view cache. The load generator is a small asyncio
+HTTP/1.1 keep-alive client, so no extra tools are needed (uvicorn is).
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BENCH_SETTINGS = """
+from config.settings import *  # noqa
+
+DEBUG = False
+ALLOWED_HOSTS = ['*']
+DATABASES['default']['NAME'] = {db!r}
+DATABASES['default']['CONN_MAX_AGE'] = 600
+CACHES = {{'default': {{'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}}}
+"""
+
+SEED = """
+import django
+django.setup()
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from store.models import Cart, CartItem, Product
+
+call_command('migrate', verbosity=0)
+user = get_user_model().objects.create_user('collin', 'collin@example.com', 'pw')
+products = Product.objects.bulk_create([
+    Product(sku=f'SKU-{i:04d}', name=f'Product {i}', price_cents=100 + i, stock=100) for i in range(500)
+])
+for c in range(20):
+    cart = Cart.objects.create(user=user)
+    CartItem.objects.bulk_create([CartItem(cart=cart, product=p, qty=1) for p in products[c:c + 20]])
+"""
+
+PATHS = [
+    '/api/products?page_size=20',
+    '/api/products/42',
+    '/api/carts/3',
+    '/api/users/1/carts',
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def read_response(reader) -> int:
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    headers = head.lower()
+    if b'content-length:' in headers:
+        length = int(headers.split(b'content-length:', 1)[1].split(b'\r\n', 1)[0])
+        await reader.readexactly(length)
+    else:  # chunked
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status
+
+
+async def client(port, deadline, latencies, errors, offset):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    i = offset
+    while time.perf_counter() < deadline:
+        path = PATHS[i % len(PATHS)]
+        i += 1
+        t0 = time.perf_counter()
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode())
+        status = await read_response(reader)
+        latencies.append(time.perf_counter() - t0)
+        if status != 200:
+            errors.append(status)
+    writer.close()
+
+
+async def load(port, concurrency, seconds):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(client(port, deadline, latencies, errors, n) for n in range(concurrency)))
+    return latencies, errors
+
+
+def wait_ready(port, proc, timeout=20):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if proc.poll() is not None:
+            raise RuntimeError('server exited early')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('server did not start')
+
+
+def run_variant(name, env, concurrency, seconds):
+    port = free_port()
+    if name == 'wsgi':
+        cmd = ['--interface', 'wsgi', 'config.wsgi:application']
+        env = dict(env, STORE_ASYNC_VIEWS='0')
+    else:
+        cmd = ['config.asgi:application']
+        env = dict(env, STORE_ASYNC_VIEWS='1')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', *cmd, '--port', str(port), '--workers', '1', '--log-level', 'warning'],
+        cwd=BASE_DIR, env=env,
+    )
+    try:
+        wait_ready(port, proc)
+        asyncio.run(load(port, concurrency, 1))  # warm-up
+        latencies, errors = asyncio.run(load(port, concurrency, seconds))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        'rps': n / seconds,
+        'p50_ms': latencies[n // 2] * 1000,
+        'p99_ms': latencies[int(n * 0.99)] * 1000,
+        'max_ms': latencies[-1] * 1000,
+        'errors': len(errors),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, 'bench_settings.py'), 'w') as f:
+            f.write(textwrap.dedent(BENCH_SETTINGS.format(db=os.path.join(tmp, 'bench.sqlite3'))))
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE='bench_settings',
+            PYTHONPATH=os.pathsep.join([tmp, BASE_DIR]),
+        )
+        subprocess.run([sys.executable, '-c', SEED], cwd=BASE_DIR, env=env, check=True)
+
+        print(f'concurrency={args.concurrency} seconds={args.seconds}')
+        print(f"{'variant':<6} {'req/s':>8} {'p50':>8} {'p99':>8} {'max':>8} {'errors':>7}")
+        for name in ('wsgi', 'asgi'):
+            r = run_variant(name, env, args.concurrency, args.seconds)
+            print(
+                f"{name:<6} {r['rps']:8.0f} {r['p50_ms']:6.1f}ms {r['p99_ms']:6.1f}ms "
+                f"{r['max_ms']:6.1f}ms {r['errors']:7d}"
+            )
@@ -0,0 +1,119 @@
+"""
+Request-latency comparison: config.settings (dev) vs config.settings_prod.
+
+    python bench_latency.py [--requests 2000]
+
+Each settings module runs in its own subprocess against a fresh temporary
+SQLite file and STATIC_ROOT. Requests go through Django's real WSGI
+handler (not the test Client, which keeps DB connections open and would
+hide CONN_MAX_AGE).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PATHS = ['/api/products?page_size=20', '/api/carts/1', '/admin/login/']
+
+
+def environ(path: str) -> dict:
+    path_info, _, query = path.partition('?')
+    return {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path_info,
+        'QUERY_STRING': query,
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'HTTP_HOST': 'localhost',
+        'wsgi.input': BytesIO(),
+        'wsgi.url_scheme': 'http',
+        'wsgi.errors': sys.stderr,
+    }
+
+
+def run_worker(n_requests: int) -> dict:
+    import django
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = os.path.join(os.environ['BENCH_DIR'], 'bench.sqlite3')
+    settings.STATIC_ROOT = os.path.join(os.environ['BENCH_DIR'], 'static')
+    django.setup()
+
+    from django.contrib.auth import get_user_model
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.core.management import call_command
+
+    from store.models import Cart, CartItem, Product
+
+    call_command('migrate', verbosity=0)
+    call_command('collectstatic', interactive=False, verbosity=0)  # prod needs the manifest
+    user = get_user_model().objects.create_user('collin', 'collin@example.com', 'pw')
+    products = Product.objects.bulk_create([
+        Product(sku=f'SKU-{i:04d}', name=f'Product {i}', price_cents=100 + i, stock=100)
+        for i in range(500)
+    ])
+    cart = Cart.objects.create(user=user)
+    CartItem.objects.bulk_create([CartItem(cart=cart, product=p, qty=1) for p in products[:30]])
+
+    from django.db import connections
+    connections.close_all()
+
+    app = WSGIHandler()
+
+    def start_response(status, headers, exc_info=None):
+        assert status.startswith('200'), status
+
+    results = {}
+    for path in PATHS:
+        for _ in range(20):  # warm-up
+            b''.join(app(environ(path), start_response))
+        timings = []
+        for _ in range(n_requests):
+            t0 = time.perf_counter()
+            b''.join(app(environ(path), start_response))
+            timings.append((time.perf_counter() - t0) * 1e6)
+        timings.sort()
+        results[path] = {
+            'mean_us': statistics.fmean(timings),
+            'p50_us': timings[len(timings) // 2],
+            'p99_us': timings[int(len(timings) * 0.99)],
+        }
+    return results
+
+
+def run(settings_module: str, n_requests: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module, BENCH_DIR=tmp)
+        out = subprocess.run(
+            [sys.executable, __file__, '--worker', '--requests', str(n_requests)],
+            cwd=BASE_DIR, env=env, check=True, capture_output=True, text=True,
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.requests)))
+        sys.exit(0)
+
+    dev = run('config.settings', args.requests)
+    prod = run('config.settings_prod', args.requests)
+
+    print(f"{'path':<28} {'dev p50':>9} {'prod p50':>9} {'dev p99':>9} {'prod p99':>9}  speedup(mean)")
+    for path in PATHS:
+        d, p = dev[path], prod[path]
+        print(
+            f"{path:<28} {d['p50_us']:8.0f}us {p['p50_us']:8.0f}us "
+            f"{d['p99_us']:8.0f}us {p['p99_us']:8.0f}us  x{d['mean_us'] / p['mean_us']:.2f}"
+        )
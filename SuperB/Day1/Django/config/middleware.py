@@ -0,0 +1,54 @@
+"""
+Trimmed middleware for the JSON API.
+
+The store API (/api/...) is stateless JSON: it never reads the session,
+request.user or messages, and its POST views are csrf_exempt. These
+subclasses of the stock middleware step aside for API paths, so an API
+request only goes through SecurityMiddleware and CommonMiddleware, while
+admin/HTML pages keep the full stack. They are subclasses so Django's
+admin system checks still recognise them.
+"""
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+API_PREFIX = '/api/'
+
+
+def is_api(request) -> bool:
+    return request.path_info.startswith(API_PREFIX)
+
+
+class SkipForAPIMixin:
+    def __call__(self, request):
+        if is_api(request):
+            # Works in sync and async mode: get_response is whatever the
+            # next layer is, we just hand the request straight to it
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SkipAPISessionMiddleware(SkipForAPIMixin, SessionMiddleware):
+    pass
+
+
+class SkipAPICsrfViewMiddleware(SkipForAPIMixin, CsrfViewMiddleware):
+    # process_view is called by the handler, not from __call__
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_api(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class SkipAPIAuthenticationMiddleware(SkipForAPIMixin, AuthenticationMiddleware):
+    pass
+
+
+class SkipAPIMessageMiddleware(SkipForAPIMixin, MessageMiddleware):
+    pass
+
+
+class SkipAPIXFrameOptionsMiddleware(SkipForAPIMixin, XFrameOptionsMiddleware):
+    pass
@@ -0,0 +1,49 @@
+"""
+ManifestStaticFilesStorage that also writes pre-compressed copies.
+
+After collectstatic hashes a file (app.css -> app.3f2a1b.css) it also
+writes app.3f2a1b.css.gz (and .br when the brotli package is installed),
+so nginx `gzip_static on` / `brotli_static on` can serve them without
+compressing on every request.
+"""
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.css', '.js', '.map', '.svg', '.html', '.txt', '.json', '.xml')
+MIN_SIZE = 256
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        # Only the final hashed names are listed in the manifest
+        for name in self.hashed_files.values():
+            if name.endswith(COMPRESSIBLE):
+                self._write_compressed(name)
+
+    def _write_compressed(self, name):
+        with self.open(name) as f:
+            data = f.read()
+        if len(data) < MIN_SIZE:
+            return
+
+        variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(data, quality=11)))
+
+        for suffix, blob in variants:
+            # Not worth it if compression barely helps
+            if len(blob) >= len(data) * 0.95:
+                continue
+            if self.exists(name + suffix):
+                self.delete(name + suffix)
+            self._save(name + suffix, ContentFile(blob))
@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from .models import Cart, CartItem, Order, Product
+
+
+@admin.register(Product)
+class ProductAdmin(admin.ModelAdmin):
+    list_display = ('sku', 'name', 'price_cents', 'stock', 'created_at')
+    search_fields = ('sku', 'name')
+
+
+class CartItemInline(admin.TabularInline):
+    model = CartItem
+    raw_id_fields = ('product',)
+
+
+@admin.register(Cart)
+class CartAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'status', 'created_at')
+    list_select_related = ('user',)
+    inlines = [CartItemInline]
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'cart', 'total_cents', 'created_at')
+    list_select_related = ('user', 'cart')
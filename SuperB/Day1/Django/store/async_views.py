@@ -0,0 +1,137 @@
+"""
+Async versions of the store API views (served through config/asgi.py).
+
+Same URLs, payloads, query budgets and cache entries as views.py; only
+the I/O is awaited, so a slow downstream call parks a coroutine instead
+of holding a worker thread. Enabled with STORE_ASYNC_VIEWS=1 (see
+settings.py / store/urls.py).
+
+Note: Django's async ORM still runs each query through sync_to_async in
+a shared thread, so for purely SQLite-bound endpoints this is slower than
+WSGI (see bench_asgi.py). It pays off once views await other I/O.
+
+Checkout needs transaction.atomic(), which has no async API yet, so it
+runs the shared sync transaction in a thread via sync_to_async.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .caching import acached_view
+from .models import Cart, CartItem, Product
+from .views import (
+    PRODUCT_FIELDS,
+    cart_detail_queryset,
+    cart_detail_response,
+    checkout_cart,
+    parse_cart_item,
+    product_list_params,
+    product_list_response,
+    product_to_dict,
+    read_json,
+    user_carts_queryset,
+    user_carts_response,
+    user_orders_params,
+    user_orders_response,
+)
+
+
+# -----------------------
+# 1) Products
+# -----------------------
+@require_GET
+@acached_view(timeout=60, tags=lambda request: ['catalog'])
+async def list_products(request):
+    page, page_size, qs, page_qs = product_list_params(request)
+    total = await qs.acount()
+    products = [p async for p in page_qs]
+    return product_list_response(page, page_size, total, products)
+
+
+@require_GET
+@acached_view(timeout=300, tags=lambda request, product_id: [f'product:{product_id}'])
+async def product_detail(request, product_id: int):
+    product = await Product.objects.only(*PRODUCT_FIELDS).filter(pk=product_id).afirst()
+    if product is None:
+        return JsonResponse({'error': 'Product not found'}, status=404)
+    return JsonResponse(product_to_dict(product))
+
+
+# -----------------------
+# 2) Carts
+# -----------------------
+@csrf_exempt
+@require_POST
+async def create_cart(request):
+    email = read_json(request).get('user_email')
+    if not email:
+        return JsonResponse({'error': 'user_email required'}, status=400)
+
+    user_id = await get_user_model().objects.filter(email=email).values_list('id', flat=True).afirst()
+    if user_id is None:
+        return JsonResponse({'error': 'User not found'}, status=404)
+
+    cart = await Cart.objects.acreate(user_id=user_id)
+    return JsonResponse({'cart_id': cart.id, 'status': cart.status}, status=201)
+
+
+@require_GET
+@acached_view(timeout=300, tags=lambda request, cart_id: [f'cart:{cart_id}'])
+async def cart_detail(request, cart_id: int):
+    # afirst() runs the prefetch too, so items are ready without more awaits
+    cart = await cart_detail_queryset().filter(pk=cart_id).afirst()
+    if cart is None:
+        return JsonResponse({'error': 'Cart not found'}, status=404)
+    return cart_detail_response(cart)
+
+
+@require_GET
+@acached_view(timeout=300, tags=lambda request, user_id: [f'user:{user_id}:carts'])
+async def user_carts(request, user_id: int):
+    return user_carts_response([c async for c in user_carts_queryset(user_id)])
+
+
+# -----------------------
+# 3) Add / update cart items
+# -----------------------
+@csrf_exempt
+@require_POST
+async def set_cart_item(request, cart_id: int):
+    product_id, qty, error = parse_cart_item(request)
+    if error:
+        return error
+
+    status = await Cart.objects.filter(pk=cart_id).values_list('status', flat=True).afirst()
+    if status is None:
+        return JsonResponse({'error': 'Cart not found'}, status=404)
+    if status != Cart.OPEN:
+        return JsonResponse({'error': 'Cart already checked out'}, status=409)
+    if not await Product.objects.filter(pk=product_id).aexists():
+        return JsonResponse({'error': 'Product not found'}, status=404)
+
+    await CartItem.objects.aupdate_or_create(cart_id=cart_id, product_id=product_id, defaults={'qty': qty})
+    return JsonResponse({'message': 'Item set', 'cart_id': cart_id, 'product_id': product_id, 'qty': qty})
+
+
+# -----------------------
+# 4) Checkout
+# -----------------------
+@csrf_exempt
+@require_POST
+async def checkout(request, cart_id: int):
+    payload, status = await sync_to_async(checkout_cart)(cart_id)
+    return JsonResponse(payload, status=status)
+
+
+# -----------------------
+# 5) Order history
+# -----------------------
+@require_GET
+@acached_view(timeout=300, tags=lambda request, user_id: [f'user:{user_id}:orders'])
+async def user_orders(request, user_id: int):
+    limit, qs, error = user_orders_params(request, user_id)
+    if error:
+        return error
+    return user_orders_response([o async for o in qs], limit)
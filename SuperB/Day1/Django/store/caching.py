@@ -0,0 +1,257 @@
+"""
+Tag-invalidated caching for store views and template fragments.
+
+Works with any Django cache backend (locmem, file, ...), it only uses
+get / get_many / set / add / incr / delete.
+
+How it works:
+- Each tag ("product:7", "cart:3", "catalog") has a version number in
+  the cache. Invalidating a tag just bumps that number.
+- A cached entry remembers the versions of its tags when it was built.
+  On read, if any tag version moved on, the entry counts as a miss.
+- Entries are kept a little past their timeout (stale_ttl). When an
+  entry goes stale, one request takes a lock and rebuilds it while
+  everyone else keeps getting the stale copy. On a cold miss the other
+  requests wait briefly for the lock holder instead of all hitting the DB.
+"""
+import asyncio
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+TAG_PREFIX = 'tagver:'
+LOCK_PREFIX = 'lock:'
+
+
+# -----------------------
+# Tags
+# -----------------------
+def tag_versions(tags) -> dict:
+    """Current version of each tag, creating missing ones."""
+    keys = [TAG_PREFIX + t for t in tags]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            # Unique, not 1: a tag that was evicted and is created again must
+            # not match the version stored in entries built before it went
+            seed = time.time_ns()
+            cache.add(key, seed, timeout=None)
+            found[key] = cache.get(key, seed)
+    return {key[len(TAG_PREFIX):]: found[key] for key in keys}
+
+
+def _bump(tags) -> None:
+    for tag in tags:
+        key = TAG_PREFIX + tag
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Not there (never used or evicted): anything cached against
+            # the old version will no longer match this one
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_tags(*tags) -> None:
+    """Invalidate tags once the current transaction commits (or right away)."""
+    tags = [t for t in tags if t]
+    if tags:
+        transaction.on_commit(lambda: _bump(tags))
+
+
+def _is_current(entry) -> bool:
+    tags = entry['tags']
+    if not tags:
+        return True
+    current = cache.get_many([TAG_PREFIX + t for t in tags])
+    return all(current.get(TAG_PREFIX + t) == v for t, v in tags.items())
+
+
+# -----------------------
+# Core: get or compute with stampede protection
+# -----------------------
+HIT, BUILD, WAIT = 'hit', 'build', 'wait'
+
+
+def _lookup(key, lock_timeout):
+    """
+    One cache round: (HIT, value), (BUILD, versions) when the caller now
+    holds the lock and must compute, or (WAIT, None) when someone else does.
+    """
+    entry = cache.get(key)
+    if entry is not None and _is_current(entry):
+        if time.time() < entry['fresh_until']:
+            return HIT, entry['value']
+        # Stale but valid: only the lock holder recomputes, the rest get stale
+        if not cache.add(LOCK_PREFIX + key, 1, lock_timeout):
+            return HIT, entry['value']
+        return BUILD, None
+    if cache.add(LOCK_PREFIX + key, 1, lock_timeout):
+        return BUILD, None
+    return WAIT, None
+
+
+def _peek(key):
+    entry = cache.get(key)
+    if entry is not None and _is_current(entry):
+        return entry['value']
+    return None
+
+
+def _store(key, value, versions, extra_tags, timeout, stale_ttl):
+    versions.update(tag_versions([t for t in extra_tags if t not in versions]))
+    cache.set(key, {
+        'value': value,
+        'tags': versions,
+        'fresh_until': time.time() + timeout,
+    }, timeout + stale_ttl)
+
+
+def _unlock(key):
+    cache.delete(LOCK_PREFIX + key)
+
+
+def get_or_compute(key, compute, timeout=300, tags=(), stale_ttl=30, lock_timeout=10, wait=2.0):
+    """
+    compute() -> (value, extra_tags). `tags` are known up front, extra_tags
+    are discovered while computing (e.g. the products inside a cart).
+    """
+    state, value = _lookup(key, lock_timeout)
+    if state == HIT:
+        return value
+
+    if state == BUILD:
+        try:
+            # Snapshot versions before computing, so an invalidation that lands
+            # while we compute makes this entry stale instead of being lost
+            versions = tag_versions(tags)
+            value, extra_tags = compute()
+            _store(key, value, versions, extra_tags, timeout, stale_ttl)
+            return value
+        finally:
+            _unlock(key)
+
+    # Someone else is building it: give them a moment before doing it ourselves
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(0.02)
+        value = _peek(key)
+        if value is not None:
+            return value
+    value, _ = compute()
+    return value
+
+
+async def aget_or_compute(key, acompute, timeout=300, tags=(), stale_ttl=30, lock_timeout=10, wait=2.0):
+    """
+    Async twin of get_or_compute(): acompute is a coroutine function.
+    Cache work is batched into one sync_to_async hop per step instead of
+    one per cache call.
+    """
+    state, value = await sync_to_async(_lookup)(key, lock_timeout)
+    if state == HIT:
+        return value
+
+    if state == BUILD:
+        try:
+            versions = await sync_to_async(tag_versions)(tags)
+            value, extra_tags = await acompute()
+            await sync_to_async(_store)(key, value, versions, extra_tags, timeout, stale_ttl)
+            return value
+        finally:
+            await sync_to_async(_unlock)(key)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.02)
+        value = await sync_to_async(_peek)(key)
+        if value is not None:
+            return value
+    value, _ = await acompute()
+    return value
+
+
+# -----------------------
+# Whole-view caching
+# -----------------------
+def user_role(request) -> str:
+    user = getattr(request, 'user', None)  # absent when auth middleware is skipped
+    if user is None or not user.is_authenticated:
+        return 'anon'
+    return 'staff' if user.is_staff else 'user'
+
+
+def view_cache_key(request) -> str:
+    query = '&'.join(sorted(request.GET.urlencode().split('&')))
+    raw = f'{request.path}?{query}|{user_role(request)}'
+    return 'view:' + hashlib.md5(raw.encode()).hexdigest()
+
+
+class _Uncacheable(Exception):
+    """Raised inside compute() to hand a non-200 response back uncached."""
+    def __init__(self, response):
+        self.response = response
+
+
+def cached_view(timeout=300, tags=None, stale_ttl=30):
+    """
+    Cache GET 200 responses per (path, sorted query, role).
+
+    tags: callable(request, **view_kwargs) -> list of tags.
+    A view can add tags it only knows after running by setting
+    `response.cache_tags = [...]`.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            def compute():
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise _Uncacheable(response)
+                stored = (response.status_code, response['Content-Type'], response.content)
+                return stored, getattr(response, 'cache_tags', ())
+
+            static_tags = tags(request, *args, **kwargs) if tags else ()
+            try:
+                status, content_type, content = get_or_compute(
+                    view_cache_key(request), compute, timeout, static_tags, stale_ttl
+                )
+            except _Uncacheable as e:
+                return e.response
+            return HttpResponse(content, status=status, content_type=content_type)
+        return wrapper
+    return decorator
+
+
+def acached_view(timeout=300, tags=None, stale_ttl=30):
+    """cached_view() for async views (same keys, so both share entries)."""
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return await view(request, *args, **kwargs)
+
+            async def acompute():
+                response = await view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise _Uncacheable(response)
+                stored = (response.status_code, response['Content-Type'], response.content)
+                return stored, getattr(response, 'cache_tags', ())
+
+            static_tags = tags(request, *args, **kwargs) if tags else ()
+            try:
+                status, content_type, content = await aget_or_compute(
+                    view_cache_key(request), acompute, timeout, static_tags, stale_ttl
+                )
+            except _Uncacheable as e:
+                return e.response
+            return HttpResponse(content, status=status, content_type=content_type)
+        return wrapper
+    return decorator
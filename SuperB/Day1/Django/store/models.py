@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import models
+
+
+class Product(models.Model):
+    sku = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=200)
+    price_cents = models.PositiveIntegerField()
+    stock = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # The product list sorts on these (id breaks ties for stable pages)
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['price_cents', 'id']),
+        ]
+
+    def __str__(self):
+        return f'{self.sku} - {self.name}'
+
+
+class Cart(models.Model):
+    OPEN = 'open'
+    CHECKED_OUT = 'checked_out'
+    STATUS_CHOICES = [(OPEN, 'Open'), (CHECKED_OUT, 'Checked out')]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='carts')
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=OPEN)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'Cart {self.pk} ({self.status})'
+
+
+class CartItem(models.Model):
+    cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.PROTECT, related_name='cart_items')
+    qty = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['cart', 'product'], name='unique_cart_product'),
+            models.CheckConstraint(condition=models.Q(qty__gt=0), name='cart_item_qty_gt_0'),
+        ]
+
+
+class Order(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name='orders')
+    cart = models.OneToOneField(Cart, on_delete=models.PROTECT, related_name='order')
+    total_cents = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'Order {self.pk}'
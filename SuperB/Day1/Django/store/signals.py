@@ -0,0 +1,26 @@
+"""Invalidate cache tags when store rows change (see caching.py)."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_tags
+from .models import Cart, CartItem, Order, Product
+
+
+@receiver([post_save, post_delete], sender=Product)
+def product_changed(sender, instance, **kwargs):
+    invalidate_tags(f'product:{instance.pk}', 'catalog')
+
+
+@receiver([post_save, post_delete], sender=Cart)
+def cart_changed(sender, instance, **kwargs):
+    invalidate_tags(f'cart:{instance.pk}', f'user:{instance.user_id}:carts')
+
+
+@receiver([post_save, post_delete], sender=CartItem)
+def cart_item_changed(sender, instance, **kwargs):
+    invalidate_tags(f'cart:{instance.cart_id}')
+
+
+@receiver([post_save, post_delete], sender=Order)
+def order_changed(sender, instance, **kwargs):
+    invalidate_tags(f'cart:{instance.cart_id}', f'user:{instance.user_id}:orders')
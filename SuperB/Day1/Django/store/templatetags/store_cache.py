@@ -0,0 +1,59 @@
+"""
+{% load store_cache %}
+{% cachetagged 300 "product-card" product.id tags=product_tags %}
+    ... expensive fragment ...
+{% endcachetagged %}
+
+Like Django's {% cache %} tag, but the fragment is also dropped when any
+of its tags is invalidated (see store.caching.invalidate_tags). `tags`
+may be a list or a space separated string.
+"""
+import hashlib
+
+from django import template
+
+from ..caching import get_or_compute, user_role
+
+register = template.Library()
+
+
+class CacheTaggedNode(template.Node):
+    def __init__(self, nodelist, timeout, key_parts, tags):
+        self.nodelist = nodelist
+        self.timeout = timeout
+        self.key_parts = key_parts
+        self.tags = tags
+
+    def render(self, context):
+        timeout = int(self.timeout.resolve(context))
+        parts = [str(p.resolve(context)) for p in self.key_parts]
+        request = context.get('request')
+        if request is not None:
+            parts.append(user_role(request))
+        key = 'frag:' + hashlib.md5('|'.join(parts).encode()).hexdigest()
+
+        tags = self.tags.resolve(context) if self.tags is not None else ()
+        if isinstance(tags, str):
+            tags = tags.split()
+
+        return get_or_compute(key, lambda: (self.nodelist.render(context), ()), timeout, list(tags))
+
+
+@register.tag('cachetagged')
+def do_cachetagged(parser, token):
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' needs a timeout and at least one key part")
+
+    tags = None
+    if bits[-1].startswith('tags='):
+        tags = parser.compile_filter(bits.pop()[len('tags='):])
+
+    nodelist = parser.parse(('endcachetagged',))
+    parser.delete_first_token()
+    return CacheTaggedNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(b) for b in bits[2:]],
+        tags,
+    )
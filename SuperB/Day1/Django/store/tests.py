@@ -0,0 +1,162 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+from django.urls import reverse
+
+from .caching import TAG_PREFIX, invalidate_tags, tag_versions
+from .models import Cart, CartItem, Order, Product
+
+# Query budget per endpoint. It must not depend on page or cart size.
+PRODUCT_LIST_QUERIES = 2   # COUNT + page
+CART_DETAIL_QUERIES = 2    # cart JOIN user (+ total) + items JOIN products
+USER_CARTS_QUERIES = 1
+USER_ORDERS_QUERIES = 1
+
+
+class StoreQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('collin', 'collin@example.com', 'pw')
+        cls.products = Product.objects.bulk_create([
+            Product(sku=f'SKU-{i:03d}', name=f'Product {i}', price_cents=100 * (i + 1), stock=50)
+            for i in range(60)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def make_cart(self, n_items: int) -> Cart:
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.bulk_create([
+            CartItem(cart=cart, product=p, qty=2) for p in self.products[:n_items]
+        ])
+        return cart
+
+    def test_product_list_query_count(self):
+        for page_size in (1, 50):
+            with self.assertNumQueries(PRODUCT_LIST_QUERIES):
+                resp = self.client.get(reverse('store:product-list'), {'page_size': page_size, 'q': 'Product'})
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(len(resp.json()['products']), page_size)
+
+    def test_cart_detail_query_count_is_independent_of_cart_size(self):
+        for n_items in (1, 10, 60):
+            cart = self.make_cart(n_items)
+            with self.assertNumQueries(CART_DETAIL_QUERIES):
+                resp = self.client.get(reverse('store:cart-detail', args=[cart.id]))
+            data = resp.json()
+            self.assertEqual(len(data['items']), n_items)
+            self.assertEqual(data['cart']['user_email'], 'collin@example.com')
+            self.assertEqual(data['total_cents'], sum(i['line_total_cents'] for i in data['items']))
+
+    def test_user_carts_query_count(self):
+        for _ in range(5):
+            self.make_cart(10)
+        with self.assertNumQueries(USER_CARTS_QUERIES):
+            resp = self.client.get(reverse('store:user-carts', args=[self.user.id]))
+        carts = resp.json()['carts']
+        self.assertEqual(len(carts), 5)
+        self.assertEqual(carts[0]['item_count'], 10)
+
+    def test_checkout_then_order_history(self):
+        cart = self.make_cart(3)
+        resp = self.client.post(reverse('store:cart-checkout', args=[cart.id]))
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(Product.objects.get(pk=self.products[0].pk).stock, 48)
+
+        resp = self.client.post(reverse('store:cart-checkout', args=[cart.id]))
+        self.assertEqual(resp.status_code, 409)
+
+        for _ in range(3):
+            Order.objects.create(user=self.user, cart=self.make_cart(1), total_cents=100)
+        with self.assertNumQueries(USER_ORDERS_QUERIES):
+            resp = self.client.get(reverse('store:user-orders', args=[self.user.id]), {'limit': 2})
+        data = resp.json()
+        self.assertEqual(len(data['orders']), 2)
+
+        resp = self.client.get(
+            reverse('store:user-orders', args=[self.user.id]),
+            {'limit': 2, 'before_id': data['next_before_id']},
+        )
+        self.assertEqual([o['item_count'] for o in resp.json()['orders']], [1, 3])
+
+
+class StoreCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('collin', 'collin@example.com', 'pw')
+        cls.product = Product.objects.create(sku='SKU-1', name='Sneaker', price_cents=999, stock=5)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_product_detail_is_cached_until_product_saved(self):
+        url = reverse('store:product-detail', args=[self.product.id])
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).json()['name'], 'Sneaker')
+
+        self.product.name = 'Runner'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).json()['name'], 'Runner')
+
+    def test_cart_detail_dropped_when_item_or_product_changes(self):
+        cart = Cart.objects.create(user=self.user)
+        url = reverse('store:cart-detail', args=[cart.id])
+        self.assertEqual(self.client.get(url).json()['items'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CartItem.objects.create(cart=cart, product=self.product, qty=2)
+        self.assertEqual(self.client.get(url).json()['total_cents'], 1998)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.filter(pk=self.product.pk).update(price_cents=500)
+            invalidate_tags(f'product:{self.product.pk}')
+        self.assertEqual(self.client.get(url).json()['total_cents'], 1000)
+
+    def test_checkout_invalidates_catalog(self):
+        url = reverse('store:product-list')
+        self.assertEqual(self.client.get(url).json()['products'][0]['stock'], 5)
+
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, product=self.product, qty=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('store:cart-checkout', args=[cart.id]))
+        self.assertEqual(self.client.get(url).json()['products'][0]['stock'], 3)
+
+    def test_errors_are_not_cached(self):
+        url = reverse('store:product-detail', args=[999])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        Product.objects.create(id=999, sku='SKU-999', name='Late', price_cents=1, stock=1)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_fragment_cache_tag(self):
+        template = Template(
+            '{% load store_cache %}'
+            '{% cachetagged 300 "card" product.id tags=tags %}{{ product.name }}{% endcachetagged %}'
+        )
+        context = {'product': self.product, 'tags': [f'product:{self.product.id}']}
+        self.assertEqual(template.render(Context(context)), 'Sneaker')
+
+        self.product.name = 'Runner'
+        self.assertEqual(template.render(Context(context)), 'Sneaker')  # still cached
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_tags(f'product:{self.product.id}')
+        self.assertEqual(template.render(Context(context)), 'Runner')
+
+    def test_evicted_tag_does_not_revive_old_fragments(self):
+        template = Template(
+            '{% load store_cache %}'
+            '{% cachetagged 300 "card" product.id tags=tags %}{{ product.name }}{% endcachetagged %}'
+        )
+        context = {'product': self.product, 'tags': [f'product:{self.product.id}']}
+        self.assertEqual(template.render(Context(context)), 'Sneaker')
+
+        # The tag is culled (locmem MAX_ENTRIES, file backend), then recreated
+        cache.delete(f'{TAG_PREFIX}product:{self.product.id}')
+        tag_versions([f'product:{self.product.id}'])
+        self.product.name = 'Runner'
+        self.assertEqual(template.render(Context(context)), 'Runner')
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.urls import path
+
+from . import async_views, views
+
+# Same routes either way; STORE_ASYNC_VIEWS picks the implementation
+api = async_views if settings.STORE_ASYNC_VIEWS else views
+
+app_name = 'store'
+
+urlpatterns = [
+    path('products', api.list_products, name='product-list'),
+    path('products/<int:product_id>', api.product_detail, name='product-detail'),
+    path('carts', api.create_cart, name='cart-create'),
+    path('carts/<int:cart_id>', api.cart_detail, name='cart-detail'),
+    path('carts/<int:cart_id>/items', api.set_cart_item, name='cart-item-set'),
+    path('carts/<int:cart_id>/checkout', api.checkout, name='cart-checkout'),
+    path('users/<int:user_id>/carts', api.user_carts, name='user-carts'),
+    path('users/<int:user_id>/orders', api.user_orders, name='user-orders'),
+]
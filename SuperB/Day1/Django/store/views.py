@@ -0,0 +1,361 @@
+"""
+JSON API for the store (port of Day2/app_day2_db.py).
+
+Every read view runs a fixed number of queries, whatever the page or cart
+size: related rows come from select_related() (JOIN) or prefetch_related()
+(one extra IN query), only() trims the columns, and totals are computed by
+the database with annotations instead of Python loops over related objects.
+
+GET views are cached per URL/query/role and dropped by tag when the rows
+behind them change (see caching.py and signals.py).
+"""
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Prefetch, Q, Sum
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .caching import cached_view, invalidate_tags
+from .models import Cart, CartItem, Order, Product
+
+PRODUCT_FIELDS = ('id', 'sku', 'name', 'price_cents', 'stock', 'created_at')
+
+SORTS = {
+    'created_desc': ('-created_at', '-id'),
+    'created_asc': ('created_at', 'id'),
+    'price_asc': ('price_cents', 'id'),
+    'price_desc': ('-price_cents', '-id'),
+}
+
+
+# -----------------------
+# Helpers
+# -----------------------
+def clamp_int(value, default, min_v, max_v):
+    try:
+        v = int(value)
+    except (TypeError, ValueError):
+        v = default
+    return max(min_v, min(max_v, v))
+
+
+def read_json(request) -> dict:
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def product_to_dict(p: Product) -> dict:
+    return {
+        'id': p.id,
+        'sku': p.sku,
+        'name': p.name,
+        'price_cents': p.price_cents,
+        'stock': p.stock,
+        'created_at': p.created_at.isoformat(),
+    }
+
+
+def cart_detail_queryset():
+    """Cart + user email + items + total in 2 queries, for any cart size."""
+    items = (
+        CartItem.objects
+        .select_related('product')
+        .only('id', 'cart_id', 'qty', 'product__id', 'product__sku', 'product__name', 'product__price_cents')
+        .annotate(line_total_cents=F('qty') * F('product__price_cents'))
+        .order_by('product__name')
+    )
+    return (
+        Cart.objects
+        .select_related('user')
+        .only('id', 'status', 'created_at', 'user__email')
+        .annotate(total_cents=Sum(F('items__qty') * F('items__product__price_cents'), default=0))
+        .prefetch_related(Prefetch('items', queryset=items))
+    )
+
+def product_list_params(request):
+    """(page, page_size, filtered queryset for COUNT, ordered queryset for the page)."""
+    page = clamp_int(request.GET.get('page'), default=1, min_v=1, max_v=10_000)
+    page_size = clamp_int(request.GET.get('page_size'), default=10, min_v=1, max_v=50)
+    q = (request.GET.get('q') or '').strip()
+    order_by = SORTS.get((request.GET.get('sort') or '').strip(), SORTS['created_desc'])
+
+    qs = Product.objects.all()
+    if q:
+        qs = qs.filter(Q(name__icontains=q) | Q(sku__icontains=q))
+
+    offset = (page - 1) * page_size
+    return page, page_size, qs, qs.only(*PRODUCT_FIELDS).order_by(*order_by)[offset:offset + page_size]
+
+
+def product_list_response(page, page_size, total, products) -> JsonResponse:
+    return JsonResponse({
+        'page': page,
+        'page_size': page_size,
+        'total': total,
+        'products': [product_to_dict(p) for p in products],
+    })
+
+
+def cart_detail_response(cart: Cart) -> JsonResponse:
+    items = cart.items.all()  # served from the prefetch cache
+    response = JsonResponse({
+        'cart': {
+            'id': cart.id,
+            'status': cart.status,
+            'user_email': cart.user.email,
+            'created_at': cart.created_at.isoformat(),
+        },
+        'items': [
+            {
+                'product_id': item.product.id,
+                'sku': item.product.sku,
+                'name': item.product.name,
+                'price_cents': item.product.price_cents,
+                'qty': item.qty,
+                'line_total_cents': item.line_total_cents,
+            }
+            for item in items
+        ],
+        'total_cents': cart.total_cents,
+    })
+    # Name / price changes of these products must drop this cart too
+    response.cache_tags = [f'product:{item.product.id}' for item in items]
+    return response
+
+
+def user_carts_queryset(user_id: int):
+    """One query, counts/totals done in SQL."""
+    return (
+        Cart.objects
+        .filter(user_id=user_id)
+        .only('id', 'status', 'created_at')
+        .annotate(
+            item_count=Count('items'),
+            total_cents=Sum(F('items__qty') * F('items__product__price_cents'), default=0),
+        )
+        .order_by('-id')
+    )
+
+
+def user_carts_response(carts) -> JsonResponse:
+    response = JsonResponse({'carts': [
+        {
+            'id': c.id,
+            'status': c.status,
+            'created_at': c.created_at.isoformat(),
+            'item_count': c.item_count,
+            'total_cents': c.total_cents,
+        }
+        for c in carts
+    ]})
+    # Item changes only touch cart:<id>, so depend on each listed cart
+    response.cache_tags = [f'cart:{c.id}' for c in carts]
+    return response
+
+
+def parse_cart_item(request):
+    """(product_id, qty, None) or (None, None, error response)."""
+    data = read_json(request)
+    try:
+        product_id = int(data['product_id'])
+        qty = int(data['qty'])
+    except KeyError:
+        return None, None, JsonResponse({'error': 'product_id and qty required'}, status=400)
+    except (TypeError, ValueError):
+        return None, None, JsonResponse({'error': 'product_id and qty must be integers'}, status=400)
+    if qty <= 0:
+        return None, None, JsonResponse({'error': 'qty must be >= 1'}, status=400)
+    return product_id, qty, None
+
+
+def user_orders_params(request, user_id: int):
+    """(limit, ordered queryset, None) or (None, None, error response)."""
+    limit = clamp_int(request.GET.get('limit'), default=20, min_v=1, max_v=100)
+    qs = Order.objects.filter(user_id=user_id)
+    before_id = request.GET.get('before_id')
+    if before_id is not None:
+        try:
+            qs = qs.filter(id__lt=int(before_id))
+        except ValueError:
+            return None, None, JsonResponse({'error': 'before_id must be an integer'}, status=400)
+
+    qs = (
+        qs.only('id', 'cart_id', 'total_cents', 'created_at')
+        .annotate(item_count=Count('cart__items'))
+        .order_by('-id')[:limit]
+    )
+    return limit, qs, None
+
+
+def user_orders_response(orders, limit) -> JsonResponse:
+    return JsonResponse({
+        'orders': [
+            {
+                'id': o.id,
+                'cart_id': o.cart_id,
+                'total_cents': o.total_cents,
+                'item_count': o.item_count,
+                'created_at': o.created_at.isoformat(),
+            }
+            for o in orders
+        ],
+        'limit': limit,
+        'next_before_id': orders[-1].id if len(orders) == limit else None,
+    })
+
+
+# -----------------------
+# 1) Products: pagination + search + ordering
+# -----------------------
+@require_GET
+@cached_view(timeout=60, tags=lambda request: ['catalog'])
+def list_products(request):
+    """GET /api/products?page=1&page_size=10&q=sneak&sort=created_desc"""
+    page, page_size, qs, page_qs = product_list_params(request)
+    return product_list_response(page, page_size, qs.count(), page_qs)
+
+
+@require_GET
+@cached_view(timeout=300, tags=lambda request, product_id: [f'product:{product_id}'])
+def product_detail(request, product_id: int):
+    product = Product.objects.only(*PRODUCT_FIELDS).filter(pk=product_id).first()
+    if product is None:
+        return JsonResponse({'error': 'Product not found'}, status=404)
+    return JsonResponse(product_to_dict(product))
+
+
+# -----------------------
+# 2) Carts
+# -----------------------
+@csrf_exempt
+@require_POST
+def create_cart(request):
+    """POST /api/carts  Body: { "user_email": "collin@example.com" }"""
+    email = read_json(request).get('user_email')
+    if not email:
+        return JsonResponse({'error': 'user_email required'}, status=400)
+
+    user_id = get_user_model().objects.filter(email=email).values_list('id', flat=True).first()
+    if user_id is None:
+        return JsonResponse({'error': 'User not found'}, status=404)
+
+    cart = Cart.objects.create(user_id=user_id)
+    return JsonResponse({'cart_id': cart.id, 'status': cart.status}, status=201)
+
+
+@require_GET
+@cached_view(timeout=300, tags=lambda request, cart_id: [f'cart:{cart_id}'])
+def cart_detail(request, cart_id: int):
+    cart = cart_detail_queryset().filter(pk=cart_id).first()
+    if cart is None:
+        return JsonResponse({'error': 'Cart not found'}, status=404)
+    return cart_detail_response(cart)
+
+
+@require_GET
+@cached_view(timeout=300, tags=lambda request, user_id: [f'user:{user_id}:carts'])
+def user_carts(request, user_id: int):
+    """GET /api/users/<id>/carts"""
+    return user_carts_response(list(user_carts_queryset(user_id)))
+
+
+# -----------------------
+# 3) Add / update cart items (UPSERT)
+# -----------------------
+@csrf_exempt
+@require_POST
+def set_cart_item(request, cart_id: int):
+    """POST /api/carts/<id>/items  Body: { "product_id": 1, "qty": 2 }"""
+    product_id, qty, error = parse_cart_item(request)
+    if error:
+        return error
+
+    status = Cart.objects.filter(pk=cart_id).values_list('status', flat=True).first()
+    if status is None:
+        return JsonResponse({'error': 'Cart not found'}, status=404)
+    if status != Cart.OPEN:
+        return JsonResponse({'error': 'Cart already checked out'}, status=409)
+    if not Product.objects.filter(pk=product_id).exists():
+        return JsonResponse({'error': 'Product not found'}, status=404)
+
+    CartItem.objects.update_or_create(cart_id=cart_id, product_id=product_id, defaults={'qty': qty})
+    return JsonResponse({'message': 'Item set', 'cart_id': cart_id, 'product_id': product_id, 'qty': qty})
+
+
+# -----------------------
+# 4) Checkout (atomic stock update + order creation)
+# -----------------------
+def checkout_cart(cart_id: int) -> tuple[dict, int]:
+    """The checkout transaction; returns (payload, status). Shared with async_views."""
+    with transaction.atomic():
+        cart = Cart.objects.select_for_update().only('id', 'user_id', 'status').filter(pk=cart_id).first()
+        if cart is None:
+            return {'error': 'Cart not found'}, 404
+        if cart.status != Cart.OPEN:
+            return {'error': 'Cart already checked out'}, 409
+
+        items = list(
+            CartItem.objects
+            .filter(cart_id=cart_id)
+            .values('product_id', 'qty', 'product__stock', 'product__price_cents')
+        )
+        if not items:
+            return {'error': 'Cart is empty'}, 400
+
+        for r in items:
+            if r['product__stock'] < r['qty']:
+                return {
+                    'error': 'Insufficient stock',
+                    'product_id': r['product_id'],
+                    'available': r['product__stock'],
+                    'requested': r['qty'],
+                }, 409
+
+        for r in items:
+            # Guarded decrement: never goes below zero even under concurrency
+            updated = Product.objects.filter(pk=r['product_id'], stock__gte=r['qty']).update(
+                stock=F('stock') - r['qty']
+            )
+            if not updated:
+                transaction.set_rollback(True)
+                return {'error': 'Insufficient stock', 'product_id': r['product_id']}, 409
+
+        total_cents = sum(r['product__price_cents'] * r['qty'] for r in items)
+        order = Order.objects.create(user_id=cart.user_id, cart_id=cart.id, total_cents=total_cents)
+        Cart.objects.filter(pk=cart.id).update(status=Cart.CHECKED_OUT)
+
+        # .update() sends no signals, so invalidate by hand (runs on commit)
+        invalidate_tags(
+            'catalog',
+            f'cart:{cart.id}',
+            f'user:{cart.user_id}:carts',
+            *(f'product:{r["product_id"]}' for r in items),
+        )
+
+    return {'message': 'Checked out', 'order_id': order.id, 'total_cents': total_cents}, 201
+
+
+@csrf_exempt
+@require_POST
+def checkout(request, cart_id: int):
+    payload, status = checkout_cart(cart_id)
+    return JsonResponse(payload, status=status)
+
+
+# -----------------------
+# 5) Order history
+# -----------------------
+@require_GET
+@cached_view(timeout=300, tags=lambda request, user_id: [f'user:{user_id}:orders'])
+def user_orders(request, user_id: int):
+    """GET /api/users/<id>/orders?limit=20&before_id=120 (keyset pagination)"""
+    limit, qs, error = user_orders_params(request, user_id)
+    if error:
+        return error
+    return user_orders_response(list(qs), limit)
@@ -1,17 +1,40 @@
 from flask import Flask, request, jsonify
 import sqlite3
-from db import get_conn, init_db, seed_db
+from datetime import date
+from bootstrap import NotBootstrapped, bootstrap, warm_worker, worker_conn
+from fast_json import FastJSONProvider, make_compressor
+from idempotency import IdempotencyStore, idempotent
+from rollups import apply_order
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
+app.after_request(make_compressor(min_size=1024))
 
-@app.before_first_request
-def setup():
-    init_db()
-    seed_db()
+# Retries with the same Idempotency-Key get the first response back, from
+# whichever worker they land on (keys live in store.db)
+idempotency_store = IdempotencyStore(worker_conn, ttl_seconds=24 * 60 * 60)
+
+# Schema + seed are prepared once with `python bootstrap.py`, not per worker.
+# Each worker does a cheap version check / warm-up when it imports the app;
+# if store.db isn't ready yet, requests retry it (and get a 503 until then).
+try:
+    warm_worker(at_boot=True)
+except NotBootstrapped:
+    pass
+
+@app.before_request
+def ensure_worker_ready():
+    warm_worker()
+
+@app.errorhandler(NotBootstrapped)
+def not_bootstrapped(e):
+    return jsonify({"error": "Database not bootstrapped", "details": str(e)}), 503
 
 # -----------------------
 # Helpers
 # -----------------------
+# Not needed any more (worker_conn() rows are already dicts), kept for
+# code that still has sqlite3.Row objects.
 def row_to_dict(row: sqlite3.Row) -> dict:
     return dict(row) if row else {}
 
@@ -40,15 +63,16 @@ def list_products():
 
     offset = (page - 1) * page_size
 
-    order_by = "created_at DESC"
+    # id breaks ties so pages are stable; matches the (col, id) indexes
+    order_by = "created_at DESC, id DESC"
     if sort == "price_asc":
-        order_by = "price_cents ASC"
+        order_by = "price_cents ASC, id ASC"
     elif sort == "price_desc":
-        order_by = "price_cents DESC"
+        order_by = "price_cents DESC, id DESC"
     elif sort == "created_asc":
-        order_by = "created_at ASC"
+        order_by = "created_at ASC, id ASC"
 
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     params = []
@@ -81,24 +105,26 @@ def list_products():
         "page": page,
         "page_size": page_size,
         "total": total,
-        "products": rows_to_list(rows)
+        "products": rows
     }), 200
 
 # -----------------------
 # 2) Create cart for a user
 # -----------------------
 @app.post("/api/carts")
+@idempotent(idempotency_store)
 def create_cart():
     """
     POST /api/carts
     Body: { "user_email": "collin@example.com" }
+    Header (optional): Idempotency-Key: <uuid>
     """
     data = request.get_json(silent=True) or {}
     email = data.get("user_email")
     if not email:
         return jsonify({"error": "user_email required"}), 400
 
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     user = cur.execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()
@@ -136,7 +162,7 @@ def add_or_update_item(cart_id: int):
     if qty <= 0:
         return jsonify({"error": "qty must be >= 1"}), 400
 
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     cart = cur.execute("SELECT id, status FROM carts WHERE id = ?", (cart_id,)).fetchone()
@@ -173,7 +199,7 @@ def add_or_update_item(cart_id: int):
 # -----------------------
 @app.get("/api/carts/<int:cart_id>")
 def view_cart(cart_id: int):
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     cart = cur.execute(
@@ -212,8 +238,8 @@ def view_cart(cart_id: int):
     conn.close()
 
     return jsonify({
-        "cart": row_to_dict(cart),
-        "items": rows_to_list(items),
+        "cart": cart,
+        "items": items,
         "total_cents": total
     }), 200
 
@@ -221,6 +247,7 @@ def view_cart(cart_id: int):
 # 5) Checkout with TRANSACTION (atomic stock update + order creation)
 # -----------------------
 @app.post("/api/carts/<int:cart_id>/checkout")
+@idempotent(idempotency_store)
 def checkout(cart_id: int):
     """
     This demonstrates a transaction:
@@ -229,8 +256,11 @@ def checkout(cart_id: int):
     - create order
     - mark cart checked_out
     If any step fails => rollback.
+
+    Send an Idempotency-Key header so a retried checkout returns the
+    original order instead of "Cart already checked out".
     """
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     try:
@@ -289,7 +319,10 @@ def checkout(cart_id: int):
         )
         order_id = cur.lastrowid
 
-        # 4) Mark cart checked out
+        # 4) Update sales rollups in the same transaction
+        apply_order(cur, order_id, items)
+
+        # 5) Mark cart checked out
         cur.execute("UPDATE carts SET status = 'checked_out' WHERE id = ?", (cart_id,))
 
         # COMMIT transaction
@@ -315,7 +348,7 @@ def explain_products_search():
     q = (request.args.get("q") or "").strip()
     like = f"%{q}%"
 
-    conn = get_conn()
+    conn = worker_conn()
     cur = conn.cursor()
 
     plan = cur.execute(
@@ -330,8 +363,154 @@ def explain_products_search():
     ).fetchall()
 
     conn.close()
-    return jsonify({"query": "products search", "plan": [dict(r) for r in plan]}), 200
+    return jsonify({"query": "products search", "plan": plan}), 200
+
+# -----------------------
+# 7) Order history with keyset pagination
+# -----------------------
+@app.get("/api/users/<int:user_id>/orders")
+def list_user_orders(user_id: int):
+    """
+    GET /api/users/2/orders?limit=20&before_id=120
+    Newest first. Pass next_before_id from the previous page to continue;
+    unlike OFFSET this stays fast however deep you page.
+    """
+    limit = clamp_int(request.args.get("limit"), default=20, min_v=1, max_v=100)
+    before_id = request.args.get("before_id")
+
+    params = [user_id]
+    where = "WHERE user_id = ?"
+    if before_id is not None:
+        try:
+            params.append(int(before_id))
+        except ValueError:
+            return jsonify({"error": "before_id must be an integer"}), 400
+        where += " AND id < ?"
+
+    conn = worker_conn()
+    rows = conn.execute(
+        f"""
+        SELECT id, cart_id, total_cents, created_at
+        FROM orders
+        {where}
+        ORDER BY id DESC
+        LIMIT ?
+        """,
+        params + [limit]
+    ).fetchall()
+    conn.close()
+
+    next_before_id = rows[-1]["id"] if len(rows) == limit else None
+    return jsonify({"orders": rows, "limit": limit, "next_before_id": next_before_id}), 200
+
+# -----------------------
+# 8) Sales reports (served from rollup tables, see rollups.py)
+# -----------------------
+def parse_day_range():
+    """?from=YYYY-MM-DD&to=YYYY-MM-DD (both optional, inclusive). None if invalid."""
+    bounds = []
+    for name, default in (("from", "0000-01-01"), ("to", "9999-12-31")):
+        value = (request.args.get(name) or "").strip()
+        if value:
+            try:
+                value = date.fromisoformat(value).isoformat()
+            except ValueError:
+                return None
+        bounds.append(value or default)
+    return bounds
+
+@app.get("/api/reports/revenue/daily")
+def revenue_per_day():
+    """GET /api/reports/revenue/daily?from=2026-01-01&to=2026-01-31"""
+    day_range = parse_day_range()
+    if day_range is None:
+        return jsonify({"error": "from/to must be YYYY-MM-DD"}), 400
+
+    conn = worker_conn()
+    rows = conn.execute(
+        """
+        SELECT day, orders, revenue_cents
+        FROM sales_daily
+        WHERE day BETWEEN ? AND ?
+        ORDER BY day ASC
+        """,
+        day_range
+    ).fetchall()
+    conn.close()
+
+    return jsonify({"days": rows}), 200
+
+@app.get("/api/reports/revenue/products")
+def revenue_per_product():
+    """
+    GET /api/reports/revenue/products                  (all time)
+    GET /api/reports/revenue/products?from=...&to=...  (date range)
+    """
+    day_range = parse_day_range()
+    if day_range is None:
+        return jsonify({"error": "from/to must be YYYY-MM-DD"}), 400
+
+    conn = worker_conn()
+    if request.args.get("from") or request.args.get("to"):
+        # Work is bounded by days x products sold, never by number of orders
+        rows = conn.execute(
+            """
+            SELECT s.product_id, p.sku, p.name,
+                   SUM(s.units) AS units, SUM(s.revenue_cents) AS revenue_cents
+            FROM sales_product_daily s
+            JOIN products p ON p.id = s.product_id
+            WHERE s.day BETWEEN ? AND ?
+            GROUP BY s.product_id
+            ORDER BY revenue_cents DESC
+            """,
+            day_range
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            """
+            SELECT s.product_id, p.sku, p.name, s.units, s.revenue_cents
+            FROM sales_product s
+            JOIN products p ON p.id = s.product_id
+            ORDER BY s.revenue_cents DESC
+            """
+        ).fetchall()
+    conn.close()
+
+    return jsonify({"products": rows}), 200
+
+@app.get("/api/reports/top-sellers")
+def top_sellers():
+    """GET /api/reports/top-sellers?limit=10&by=units   (by=units|revenue)"""
+    limit = clamp_int(request.args.get("limit"), default=10, min_v=1, max_v=100)
+    by = (request.args.get("by") or "units").strip()
+    # Whitelisted column name only (never format user input into SQL)
+    order_col = "revenue_cents" if by == "revenue" else "units"
+
+    conn = worker_conn()
+    rows = conn.execute(
+        f"""
+        SELECT s.product_id, p.sku, p.name, s.units, s.revenue_cents
+        FROM sales_product s
+        JOIN products p ON p.id = s.product_id
+        ORDER BY s.{order_col} DESC
+        LIMIT ?
+        """,
+        (limit,)
+    ).fetchall()
+    conn.close()
+
+    return jsonify({"by": order_col, "products": rows}), 200
+
+@app.get("/debug/worker")
+def debug_worker():
+    """Cold-start numbers for this worker process."""
+    return jsonify(warm_worker()), 200
 
 
 if __name__ == "__main__":
+    # Dev server: bootstrap inline (production runs bootstrap.py once at deploy)
+    problems = bootstrap()
+    if problems:
+        raise SystemExit(f"store.db not ready: {problems}")
+    warm_worker(at_boot=True)
     app.run(host="127.0.0.1", port=5001, debug=True)
\ No newline at end of file
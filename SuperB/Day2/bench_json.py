@@ -0,0 +1,90 @@
+"""
+Benchmark: old jsonify path vs FastJSONProvider on list_products()/view_cart() payloads.
+
+Run: python bench_json.py
+Uses an in-memory copy of the schema, so store.db is not touched. Both
+paths are timed from fetch to bytes: the old one fetches sqlite3.Row and
+converts it, the new one fetches dicts (dp.dict_row, as worker_conn()
+does) that the encoder writes directly.
+"""
+import json
+import sqlite3
+import timeit
+
+from dp import dict_row
+from fast_json import dumps_bytes, orjson
+
+
+def build_db(n_products: int = 5_000) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+    CREATE TABLE products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sku TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        price_cents INTEGER NOT NULL,
+        stock INTEGER NOT NULL,
+        created_at TEXT NOT NULL DEFAULT (datetime('now'))
+    );
+    CREATE TABLE cart_items (
+        cart_id INTEGER NOT NULL,
+        product_id INTEGER NOT NULL,
+        qty INTEGER NOT NULL
+    );
+    """)
+    conn.executemany(
+        "INSERT INTO products (sku, name, price_cents, stock) VALUES (?, ?, ?, ?)",
+        [(f"SKU-{i:06d}", f"Product {i}", 1000 + i, i % 50) for i in range(n_products)]
+    )
+    conn.executemany(
+        "INSERT INTO cart_items (cart_id, product_id, qty) VALUES (1, ?, ?)",
+        [(i, 1 + i % 3) for i in range(1, n_products + 1)]
+    )
+    return conn
+
+
+def products_rows(conn, page_size):
+    return conn.execute(
+        "SELECT id, sku, name, price_cents, stock, created_at FROM products "
+        "ORDER BY created_at DESC LIMIT ?",
+        (page_size,)
+    ).fetchall()
+
+
+def cart_rows(conn):
+    return conn.execute(
+        """
+        SELECT ci.product_id, p.sku, p.name, p.price_cents, ci.qty,
+               (p.price_cents * ci.qty) AS line_total_cents
+        FROM cart_items ci JOIN products p ON p.id = ci.product_id
+        WHERE ci.cart_id = 1 ORDER BY p.name ASC
+        """
+    ).fetchall()
+
+
+def old_path(conn, query, key):
+    # What the handlers did before: rows_to_list() + stdlib encoder (jsonify defaults)
+    conn.row_factory = sqlite3.Row
+    return json.dumps({key: [dict(r) for r in query(conn)]}).encode()
+
+
+def new_path(conn, query, key):
+    conn.row_factory = dict_row
+    return dumps_bytes({key: query(conn)})
+
+
+def bench(label, conn, query, key, number):
+    assert json.loads(old_path(conn, query, key)) == json.loads(new_path(conn, query, key))
+    old = min(timeit.repeat(lambda: old_path(conn, query, key), number=number, repeat=5)) / number
+    new = min(timeit.repeat(lambda: new_path(conn, query, key), number=number, repeat=5)) / number
+    rows = len(query(conn))
+    print(f"{label:<28} rows={rows:>5}  old={old * 1e6:9.1f}us  new={new * 1e6:9.1f}us  x{old / new:5.2f}")
+
+
+if __name__ == "__main__":
+    conn = build_db()
+    print(f"encoder: {'orjson' if orjson else 'stdlib json'}")
+    bench("list_products page_size=50", conn, lambda c: products_rows(c, 50), "products", 2_000)
+    bench("list_products 1000 rows", conn, lambda c: products_rows(c, 1_000), "products", 100)
+    bench("view_cart 5000 items", conn, cart_rows, "items", 20)
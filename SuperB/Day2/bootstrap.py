@@ -0,0 +1,203 @@
+"""
+One-time database bootstrap + cheap per-worker startup.
+
+Deploy step (run once, not in every worker):
+    python bootstrap.py            # migrate + seed + verify, exit 1 on failure
+    python bootstrap.py --verify   # verify only
+
+Workers call warm_worker() when the app module is imported (and again,
+cheaply, on every request): it checks the schema version and opens this
+process's first pooled connection, never running DDL or seed queries.
+
+Request handlers take connections from worker_conn(). Their close() puts
+them back in a small per-process pool, so a connection keeps its parsed
+schema, page cache and prepared-statement cache (sqlite3 caches
+statements per connection) from one request to the next. Every new
+connection checks the schema version, is warmed by compiling
+WARM_STATEMENTS once, and returns rows as plain dicts (dp.dict_row) so
+responses serialize without a per-row conversion.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from dp import dict_row, get_conn, init_db, seed_db
+from migrations import LATEST_VERSION, current_version
+
+REQUIRED_TABLES = {"users", "products", "carts", "cart_items", "orders", "idempotency_keys"}
+
+POOL_SIZE = 8  # idle connections kept per worker process
+
+# Hot queries compiled on every new pooled connection, so its schema is
+# loaded before the first real request uses it
+WARM_STATEMENTS = [
+    "SELECT id, sku, name, price_cents, stock, created_at FROM products "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+    "SELECT id FROM users WHERE email = ?",
+    "SELECT id, status FROM carts WHERE id = ?",
+    "SELECT ci.product_id, p.sku, p.name, p.price_cents, ci.qty FROM cart_items ci "
+    "JOIN products p ON p.id = ci.product_id WHERE ci.cart_id = ?",
+]
+
+
+class NotBootstrapped(RuntimeError):
+    pass
+
+
+# -----------------------
+# One-time bootstrap
+# -----------------------
+def verify(conn: sqlite3.Connection) -> list[str]:
+    """Return a list of problems (empty list = database is ready)."""
+    problems = []
+    version = current_version(conn)
+    if version != LATEST_VERSION:
+        problems.append(f"schema version is {version}, expected {LATEST_VERSION}")
+
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    missing = REQUIRED_TABLES - tables
+    if missing:
+        problems.append(f"missing tables: {sorted(missing)}")
+
+    check = conn.execute("PRAGMA quick_check").fetchone()[0]
+    if check != "ok":
+        problems.append(f"quick_check: {check}")
+    return problems
+
+
+def bootstrap() -> list[str]:
+    init_db()
+    seed_db()
+    conn = get_conn()
+    try:
+        return verify(conn)
+    finally:
+        conn.close()
+
+
+# -----------------------
+# Per-worker connection pool
+# -----------------------
+class PooledConnection(sqlite3.Connection):
+    """close() hands the connection back to this process's pool."""
+
+    pooled = False
+
+    def close(self):
+        _release(self)
+
+
+_pool: list = []
+_pool_pid = os.getpid()
+_pool_lock = threading.Lock()
+
+
+def _open_warm() -> PooledConnection:
+    conn = get_conn(factory=PooledConnection, check_same_thread=False)
+    try:
+        version = current_version(conn)
+        if version != LATEST_VERSION:
+            raise NotBootstrapped(
+                f"store.db schema version {version} != {LATEST_VERSION}; run `python bootstrap.py` first"
+            )
+        for sql in WARM_STATEMENTS:
+            conn.execute(f"EXPLAIN {sql}", (0,) * sql.count("?")).fetchall()
+    except BaseException:
+        sqlite3.Connection.close(conn)
+        raise
+    conn.row_factory = dict_row
+    return conn
+
+
+def _check_pid() -> None:
+    """A forked worker must not use its parent's connections (call with _pool_lock held)."""
+    global _pool_pid
+    if _pool_pid != os.getpid():
+        _pool.clear()
+        _pool_pid = os.getpid()
+
+
+def worker_conn() -> PooledConnection:
+    """A warm connection for one request; call close() when done, as with get_conn()."""
+    with _pool_lock:
+        _check_pid()
+        if _pool:
+            conn = _pool.pop()
+            conn.pooled = False
+            return conn
+    return _open_warm()
+
+
+def _release(conn: PooledConnection) -> None:
+    if conn.pooled:
+        return  # closed twice
+    if conn.in_transaction:
+        conn.rollback()
+    with _pool_lock:
+        _check_pid()
+        if len(_pool) < POOL_SIZE:
+            conn.pooled = True
+            _pool.append(conn)
+            return
+    sqlite3.Connection.close(conn)
+
+
+# -----------------------
+# Per-worker startup
+# -----------------------
+_IMPORTED_AT = time.perf_counter()
+_warm_lock = threading.Lock()
+worker_stats: dict = {}
+
+
+def warm_worker(at_boot: bool = False) -> dict:
+    """
+    Cheap and idempotent: only the first call in a process does work.
+    The app calls it with at_boot=True on import, then on every request.
+    Raises NotBootstrapped if `python bootstrap.py` hasn't been run.
+    """
+    if worker_stats.get("pid") == os.getpid():
+        return worker_stats
+    with _warm_lock:
+        if worker_stats.get("pid") == os.getpid():
+            return worker_stats
+
+        t0 = time.perf_counter()
+        worker_conn().close()  # checked and warmed, it stays in the pool for the first request
+
+        done = time.perf_counter()
+        worker_stats.clear()
+        worker_stats.update({
+            "pid": os.getpid(),
+            "warmed": "boot" if at_boot else "first_request",
+            "warmup_ms": round((done - t0) * 1000, 3),
+            # wall time from importing this module to ready; only meaningful
+            # when warmed at boot (otherwise it would include idle time
+            # before the first request)
+            "cold_start_ms": round((done - _IMPORTED_AT) * 1000, 3) if at_boot else None,
+            # CPU the process has burned so far (interpreter + imports + warmup)
+            "process_cpu_ms": round(time.process_time() * 1000, 3),
+        })
+        return worker_stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prepare and verify store.db once per deploy")
+    parser.add_argument("--verify", action="store_true", help="only verify, don't migrate or seed")
+    args = parser.parse_args()
+
+    if args.verify:
+        conn = get_conn()
+        problems = verify(conn)
+        conn.close()
+    else:
+        problems = bootstrap()
+
+    if problems:
+        for p in problems:
+            print(f"❌ {p}")
+        sys.exit(1)
+    print(f"✅ store.db ready (schema version {LATEST_VERSION})")
@@ -1,66 +1,36 @@
 import sqlite3
 from pathlib import Path
 
+from migrations import migrate
+
 DB_PATH =Path("store.db")
 
-def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+def get_conn(**connect_kwargs) -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, **connect_kwargs)
     conn.row_factory = sqlite3.Row # results behave like dicts
     # Enforce foreing keys in SQLite
     conn.execute("PRAGMA foreing_keys = ON;")
     return conn
 
-def init_db() -> None:
-    conn = get_conn()
-    cur = conn.cursor()
-
-    # --- Tables ---
-    cur.executescript("""
-    CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        email TEXT NOT NULL UNIQUE,
-        password_hash TEXT NOT NULL,
-        role TEXT NOT NULL CHECK(role IN ('user','admin'))
-    );
+# (description, column names) of the last query; each execute() gets a new
+# description tuple, so the names are built once per query, not per row.
+# Keeping the tuple alive makes the `is` check safe across queries.
+_last_columns: tuple = (None, ())
 
-    CREATE TABLE IF NOT EXISTS products (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        sku TEXT NOT NULL UNIQUE,
-        name TEXT NOT NULL,
-        price_cents INTEGER NOT NULL CHECK(price_cents >= 0),
-        stock INTEGER NOT NULL CHECK(stock >= 0),
-        created_at TEXT NOT NULL DEFAULT (datetime('now'))
-    );
+def dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory for plain dicts, which JSON encoders write natively (unlike sqlite3.Row)."""
+    global _last_columns
+    memo = _last_columns
+    if memo[0] is not cursor.description:
+        memo = _last_columns = (cursor.description, tuple(col[0] for col in cursor.description))
+    return dict(zip(memo[1], row))
 
-    CREATE TABLE IF NOT EXISTS carts (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        status TEXT NOT NULL DEFAULT 'open' CHECK(status IN ('open','checked_out')),
-        created_at TEXT NOT NULL DEFAULT (datetime('now')),
-        FOREIGN KEY (user_id) REFERENCES users(id)
-    );
-
-    CREATE TABLE IF NOT EXISTS cart_items (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        cart_id INTEGER NOT NULL,
-        product_id INTEGER NOT NULL,
-        qty INTEGER NOT NULL CHECK(qty > 0),
-        UNIQUE(cart_id, product_id),
-        FOREIGN KEY (cart_id) REFERENCES carts(id) ON DELETE CASCADE,
-        FOREIGN KEY (product_id) REFERENCES products(id)
-    );
+def init_db() -> None:
+    """Bring the schema up to the latest version (see migrations.py)."""
+    conn = get_conn()
+    migrate(conn)
+    conn.close()
 
-    CREATE TABLE IF NOT EXISTS orders (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        cart_id INTEGER NOT NULL UNIQUE,
-        total_cents INTEGER NOT NULL CHECK(total_cents >= 0),
-        created_at TEXT NOT NULL DEFAULT (datetime('now')),
-        FOREIGN KEY (user_id) REFERENCES users(id),
-        FOREIGN KEY (cart_id) REFERENCES carts(id)
-    );
-""")
-    
 def seed_db() -> None:
     """Idempotent-ish seed: inserts only if tables are empty."""
     conn = get_conn()
@@ -0,0 +1,91 @@
+import gzip
+import json
+import sqlite3
+
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+
+# -----------------------
+# Encoding
+# -----------------------
+def _default(obj):
+    # Only for sqlite3.Row from connections outside the app's pool (which
+    # return dicts via dp.dict_row, so orjson never calls back here per row).
+    if isinstance(obj, sqlite3.Row):
+        return dict(zip(obj.keys(), obj))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Drop-in JSON provider: app.json = FastJSONProvider(app)
+
+    jsonify() keeps working everywhere, it just goes through
+    dumps_bytes() and knows how to write sqlite3.Row.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is not None:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Skip the bytes -> str -> bytes round trip of the default provider
+        return self._app.response_class(dumps_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+
+# -----------------------
+# Compression
+# -----------------------
+def make_compressor(min_size: int = 1024, gzip_level: int = 5, brotli_quality: int = 4):
+    """
+    Returns an after_request hook that compresses JSON bodies >= min_size
+    when the client sends Accept-Encoding (br preferred, then gzip).
+    """
+    def compress_response(resp):
+        if (
+            resp.direct_passthrough
+            or resp.status_code < 200
+            or resp.status_code in (204, 304)
+            or resp.mimetype != "application/json"
+            or "Content-Encoding" in resp.headers
+        ):
+            return resp
+
+        resp.vary.add("Accept-Encoding")
+        body = resp.get_data()
+        if len(body) < min_size:
+            return resp
+
+        accepted = request.accept_encodings
+        if brotli is not None and accepted["br"]:
+            resp.set_data(brotli.compress(body, quality=brotli_quality))
+            resp.headers["Content-Encoding"] = "br"
+        elif accepted["gzip"]:
+            resp.set_data(gzip.compress(body, compresslevel=gzip_level))
+            resp.headers["Content-Encoding"] = "gzip"
+        return resp
+
+    return compress_response
@@ -0,0 +1,197 @@
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable
+
+from flask import Response, jsonify, make_response, request
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+@dataclass
+class StoredResponse:
+    """What we keep per key: just enough bytes to rebuild the response."""
+    body_hash: bytes
+    status: int
+    mimetype: str
+    body: bytes
+    expires_at: float
+
+
+class IdempotencyStore:
+    """
+    (method, path, key) -> stored response, with TTL, in the shared
+    idempotency_keys table (migration 4), so every worker process sees the
+    same keys and they survive restarts.
+
+    - Finished responses are kept for `ttl_seconds` and replayed as-is.
+    - The first request for a key claims it by inserting a row with no
+      status yet. A duplicate that arrives meanwhile, in any worker, waits
+      for that row instead of running the handler a second time.
+    - A claim expires after `lease_seconds`, so a worker that died
+      mid-request doesn't hold its key forever.
+
+    `connect` returns a connection to store.db (e.g. bootstrap.worker_conn);
+    it is closed after every call. Expiry uses wall-clock time, which all
+    processes share.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection],
+                 ttl_seconds: float = 24 * 60 * 60, lease_seconds: float = 60.0,
+                 poll_interval: float = 0.05):
+        self.connect = connect
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+
+    def begin(self, slot: tuple, body_hash: bytes):
+        """
+        Returns one of:
+          ("replay", StoredResponse)  - answer from the store
+          ("wait", bytes)             - same key is running (its body hash), wait_done() on it
+          ("run", None)               - caller owns the key and must finish()/abort()
+        """
+        now = time.time()
+        conn = self.connect()
+        try:
+            # IMMEDIATE: the expiry check and the claim are one atomic step
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM idempotency_keys WHERE method = ? AND path = ? AND key = ? AND expires_at <= ?",
+                (*slot, now),
+            )
+            claimed = conn.execute(
+                "INSERT OR IGNORE INTO idempotency_keys (method, path, key, body_hash, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*slot, body_hash, now + self.lease_seconds),
+            ).rowcount
+            row = None if claimed else conn.execute(
+                "SELECT body_hash, status, mimetype, body, expires_at FROM idempotency_keys "
+                "WHERE method = ? AND path = ? AND key = ?",
+                slot,
+            ).fetchone()
+            conn.commit()
+        finally:
+            conn.close()
+
+        if row is None:
+            return "run", None
+        if row["status"] is None:
+            return "wait", row["body_hash"]
+        return "replay", StoredResponse(row["body_hash"], row["status"], row["mimetype"],
+                                        row["body"], row["expires_at"])
+
+    def wait_done(self, slot: tuple, timeout: float) -> bool:
+        """Poll until the claim on `slot` is finished or released; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            conn = self.connect()
+            try:
+                row = conn.execute(
+                    "SELECT status FROM idempotency_keys WHERE method = ? AND path = ? AND key = ?",
+                    slot,
+                ).fetchone()
+            finally:
+                conn.close()
+            if row is None or row["status"] is not None:
+                return True
+        return False
+
+    def finish(self, slot: tuple, body_hash: bytes, status: int, mimetype: str, body: bytes) -> None:
+        conn = self.connect()
+        try:
+            conn.execute(
+                "UPDATE idempotency_keys SET status = ?, mimetype = ?, body = ?, expires_at = ? "
+                "WHERE method = ? AND path = ? AND key = ? AND status IS NULL",
+                (status, mimetype, body, time.time() + self.ttl_seconds, *slot),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def abort(self, slot: tuple) -> None:
+        """Release the key without storing anything (handler crashed / 5xx)."""
+        conn = self.connect()
+        try:
+            conn.execute(
+                "DELETE FROM idempotency_keys WHERE method = ? AND path = ? AND key = ? AND status IS NULL",
+                slot,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def purge_expired(self) -> int:
+        conn = self.connect()
+        try:
+            purged = conn.execute("DELETE FROM idempotency_keys WHERE expires_at <= ?", (time.time(),)).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return purged
+
+
+def _replay(entry: StoredResponse) -> Response:
+    resp = Response(entry.body, status=entry.status, mimetype=entry.mimetype)
+    resp.headers[REPLAYED_HEADER] = "true"
+    return resp
+
+
+def _key_mismatch():
+    return jsonify({"error": f"{IDEMPOTENCY_HEADER} already used with a different request"}), 422
+
+
+def idempotent(store: IdempotencyStore, wait_timeout: float = 30.0):
+    """
+    Decorator for POST views. Without the header the view runs as normal.
+
+    With `Idempotency-Key: <key>`:
+    - first request runs the view and its response (< 500) is stored
+    - retries with the same key + body get the stored response back,
+      without running the view (so no DB reads/writes at all)
+    - same key with a different body => 422
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return fn(*args, **kwargs)
+
+            slot = (request.method, request.path, key)
+            body_hash = hashlib.sha256(request.get_data()).digest()
+
+            while True:
+                state, value = store.begin(slot, body_hash)
+                if state == "replay":
+                    if value.body_hash != body_hash:
+                        return _key_mismatch()
+                    return _replay(value)
+                if state == "wait":
+                    if value != body_hash:
+                        return _key_mismatch()
+                    if not store.wait_done(slot, wait_timeout):
+                        return jsonify({"error": "Request with this key is still in progress"}), 409
+                    # Loop: the first request either stored a response or aborted
+                    continue
+                break
+
+            try:
+                resp = make_response(fn(*args, **kwargs))
+            except Exception:
+                store.abort(slot)
+                raise
+
+            if resp.status_code >= 500:
+                # Server errors are not a final answer: let the client retry for real
+                store.abort(slot)
+                return resp
+
+            store.finish(slot, body_hash, resp.status_code, resp.mimetype, resp.get_data())
+            return resp
+        return wrapper
+    return decorator
@@ -0,0 +1,205 @@
+"""
+Versioned schema migrations for store.db.
+
+The applied version lives in SQLite's own header (PRAGMA user_version),
+so there is no extra bookkeeping table. Each migration runs in its own
+short write transaction, and the database is switched to WAL mode first
+so readers keep working while an index is being built.
+
+Usage:
+    python migrations.py            # apply pending migrations to store.db
+    python migrations.py --status   # show current / latest version
+"""
+import argparse
+import sqlite3
+
+# -----------------------
+# Migrations (append only, never edit an applied one)
+# -----------------------
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (1, "base tables", [
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL UNIQUE,
+            password_hash TEXT NOT NULL,
+            role TEXT NOT NULL CHECK(role IN ('user','admin'))
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sku TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            price_cents INTEGER NOT NULL CHECK(price_cents >= 0),
+            stock INTEGER NOT NULL CHECK(stock >= 0),
+            created_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS carts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'open' CHECK(status IN ('open','checked_out')),
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cart_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cart_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            qty INTEGER NOT NULL CHECK(qty > 0),
+            UNIQUE(cart_id, product_id),
+            FOREIGN KEY (cart_id) REFERENCES carts(id) ON DELETE CASCADE,
+            FOREIGN KEY (product_id) REFERENCES products(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            cart_id INTEGER NOT NULL UNIQUE,
+            total_cents INTEGER NOT NULL CHECK(total_cents >= 0),
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (cart_id) REFERENCES carts(id)
+        )
+        """,
+    ]),
+    (2, "secondary indexes", [
+        # list_products() sorts on these (id breaks ties for stable pages)
+        "CREATE INDEX IF NOT EXISTS idx_products_created_at ON products(created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_products_price_cents ON products(price_cents, id)",
+        # carts / orders are looked up per user
+        "CREATE INDEX IF NOT EXISTS idx_carts_user_id ON carts(user_id)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders(user_id)",
+        "ANALYZE",
+    ]),
+    (3, "sales rollup tables", [
+        # Kept up to date by rollups.apply_order() inside the checkout transaction
+        """
+        CREATE TABLE IF NOT EXISTS sales_daily (
+            day TEXT PRIMARY KEY,
+            orders INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sales_product_daily (
+            day TEXT NOT NULL,
+            product_id INTEGER NOT NULL,
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, product_id)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sales_product (
+            product_id INTEGER PRIMARY KEY,
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_sales_product_units ON sales_product(units DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_sales_product_revenue ON sales_product(revenue_cents DESC)",
+        # Backfill from orders that already exist. Line revenue uses the
+        # current product price (orders don't store per-line prices).
+        """
+        INSERT INTO sales_daily (day, orders, revenue_cents)
+        SELECT date(created_at), COUNT(*), SUM(total_cents)
+        FROM orders GROUP BY date(created_at)
+        """,
+        """
+        INSERT INTO sales_product_daily (day, product_id, units, revenue_cents)
+        SELECT date(o.created_at), ci.product_id, SUM(ci.qty), SUM(ci.qty * p.price_cents)
+        FROM orders o
+        JOIN cart_items ci ON ci.cart_id = o.cart_id
+        JOIN products p ON p.id = ci.product_id
+        GROUP BY date(o.created_at), ci.product_id
+        """,
+        """
+        INSERT INTO sales_product (product_id, units, revenue_cents)
+        SELECT product_id, SUM(units), SUM(revenue_cents)
+        FROM sales_product_daily GROUP BY product_id
+        """,
+    ]),
+    (4, "idempotency keys", [
+        # Shared by every worker: a row with status NULL is a request still
+        # running (its claim expires at expires_at), otherwise a stored response
+        """
+        CREATE TABLE IF NOT EXISTS idempotency_keys (
+            method TEXT NOT NULL,
+            path TEXT NOT NULL,
+            key TEXT NOT NULL,
+            body_hash BLOB NOT NULL,
+            status INTEGER,
+            mimetype TEXT,
+            body BLOB,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (method, path, key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys(expires_at)",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target: int = LATEST_VERSION, busy_timeout_ms: int = 5000) -> list[int]:
+    """
+    Apply every migration above the current version, up to `target`.
+    Returns the versions that were applied (empty list = already up to date).
+    """
+    old_isolation = conn.isolation_level
+    conn.isolation_level = None  # we manage BEGIN/COMMIT ourselves
+    applied = []
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        # WAL: readers are not blocked by the migration's write transaction
+        conn.execute("PRAGMA journal_mode = WAL")
+
+        for version, _name, statements in MIGRATIONS:
+            if version > target:
+                break
+            # IMMEDIATE takes the write lock up front, so two processes
+            # migrating at once serialise here instead of failing halfway
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if version <= current_version(conn):
+                    conn.execute("COMMIT")
+                    continue
+                for sql in statements:
+                    conn.execute(sql)
+                conn.execute(f"PRAGMA user_version = {version}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            applied.append(version)
+    finally:
+        conn.isolation_level = old_isolation
+    return applied
+
+
+if __name__ == "__main__":
+    from dp import get_conn
+
+    parser = argparse.ArgumentParser(description="Apply store.db schema migrations")
+    parser.add_argument("--status", action="store_true", help="only print the schema version")
+    args = parser.parse_args()
+
+    conn = get_conn()
+    if args.status:
+        print(f"schema version {current_version(conn)} (latest {LATEST_VERSION})")
+    else:
+        applied = migrate(conn)
+        print(f"✅ Applied {applied}" if applied else "✅ Already up to date")
+        print(f"schema version {current_version(conn)}")
+    conn.close()
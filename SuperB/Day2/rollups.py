@@ -0,0 +1,46 @@
+"""
+Incremental sales rollups (tables created by migration 3).
+
+apply_order() is called inside the checkout transaction, so the rollups
+commit (or roll back) together with the order. Reports then read a few
+pre-aggregated rows instead of scanning `orders`.
+"""
+import sqlite3
+
+
+def apply_order(cur: sqlite3.Cursor, order_id: int, items) -> None:
+    """
+    items: rows with product_id, qty, price_cents (what checkout() already loaded)
+    """
+    day = cur.execute("SELECT date(created_at) AS d FROM orders WHERE id = ?", (order_id,)).fetchone()["d"]
+    total_cents = sum(r["price_cents"] * r["qty"] for r in items)
+
+    cur.execute(
+        """
+        INSERT INTO sales_daily (day, orders, revenue_cents) VALUES (?, 1, ?)
+        ON CONFLICT(day) DO UPDATE SET
+            orders = orders + 1,
+            revenue_cents = revenue_cents + excluded.revenue_cents
+        """,
+        (day, total_cents)
+    )
+
+    lines = [(r["product_id"], r["qty"], r["price_cents"] * r["qty"]) for r in items]
+    cur.executemany(
+        """
+        INSERT INTO sales_product_daily (day, product_id, units, revenue_cents) VALUES (?, ?, ?, ?)
+        ON CONFLICT(day, product_id) DO UPDATE SET
+            units = units + excluded.units,
+            revenue_cents = revenue_cents + excluded.revenue_cents
+        """,
+        [(day, pid, qty, cents) for pid, qty, cents in lines]
+    )
+    cur.executemany(
+        """
+        INSERT INTO sales_product (product_id, units, revenue_cents) VALUES (?, ?, ?)
+        ON CONFLICT(product_id) DO UPDATE SET
+            units = units + excluded.units,
+            revenue_cents = revenue_cents + excluded.revenue_cents
+        """,
+        lines
+    )
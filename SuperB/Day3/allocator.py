@@ -0,0 +1,209 @@
+from __future__ import annotations
+import heapq
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+# Multi-order inventory allocation.
+#
+# can_fulfill_order() in day3_dsa.py answers "does this one order fit?"
+# against a stock dict that never changes. Here a stream of orders competes
+# for the same stock: each allocation decrements stock in place, quantities
+# that cannot be served become back-orders, and restock() hands new stock to
+# the waiting back-orders in policy order.
+#
+# Stock lives in an array('q') indexed by product id (ids are small ints,
+# like the rest of Day 3), so a line costs one index + one subtraction.
+
+FIFO = "fifo"
+PRIORITY = "priority"  # lower number = served first, FIFO within a priority
+
+FILLED = "filled"
+PARTIAL = "partial"
+BACKORDERED = "backordered"
+REJECTED = "rejected"
+
+
+@dataclass
+class Order:
+    order_id: int
+    lines: Dict[int, int]  # product_id -> requested quantity
+    priority: int = 0
+
+
+@dataclass
+class Allocation:
+    order_id: int
+    status: str
+    filled: Dict[int, int] = field(default_factory=dict)
+    backordered: Dict[int, int] = field(default_factory=dict)
+
+
+class InventoryAllocator:
+    """
+    partial=True:  fill what is in stock now, back-order the rest.
+    partial=False: all-or-nothing (can_fulfill_order semantics), orders
+                   that do not fit are rejected and leave stock untouched.
+
+    Products are 0 .. len(stock) - 1 (restock() can add new ones). In both
+    modes an order with a line for any other id, or a quantity < 1, is
+    rejected before anything is filled or back-ordered.
+
+    Invariant: a product with waiting back-orders has 0 stock, so a new
+    order can never overtake the back-order queue.
+    """
+
+    def __init__(self, stock: Dict[int, int], policy: str = FIFO, partial: bool = True):
+        if policy not in (FIFO, PRIORITY):
+            raise ValueError(f"unknown policy: {policy!r}")
+        self.policy = policy
+        self.partial = partial
+        self.stock = array("q", bytes(8 * (max(stock, default=-1) + 1)))
+        for pid, qty in stock.items():
+            self.stock[pid] = qty
+        # product_id -> heap of [priority, seq, order_id, remaining]
+        self.backorders: Dict[int, list] = {}
+        self._seq = 0
+
+    # -----------------------
+    # Allocation
+    # -----------------------
+    def allocate(self, orders: Iterable[Order]) -> List[Allocation]:
+        """
+        Allocate a batch of orders. With the priority policy the batch is
+        served in priority order (stable, so FIFO within a priority).
+
+        Time: O(total lines) for FIFO, plus O(b log b) to sort a batch of b
+              orders by priority; back-orders cost O(log q) each
+        """
+        if self.policy == PRIORITY:
+            orders = sorted(orders, key=lambda o: o.priority)
+        allocate_one = self.allocate_one
+        return [allocate_one(o) for o in orders]
+
+    def allocate_one(self, order: Order) -> Allocation:
+        stock = self.stock
+        n = len(stock)
+        lines = order.lines
+
+        if not self.partial:
+            for pid, qty in lines.items():
+                if not 0 <= pid < n or qty < 1 or stock[pid] < qty:
+                    return Allocation(order.order_id, REJECTED)
+            for pid, qty in lines.items():
+                stock[pid] -= qty
+            return Allocation(order.order_id, FILLED, dict(lines))
+
+        for pid, qty in lines.items():
+            if not 0 <= pid < n or qty < 1:
+                return Allocation(order.order_id, REJECTED)
+
+        filled: Dict[int, int] = {}
+        backordered: Dict[int, int] = {}
+        for pid, qty in lines.items():
+            have = stock[pid]
+            if have >= qty:
+                stock[pid] = have - qty
+                filled[pid] = qty
+                continue
+            if have > 0:
+                stock[pid] = 0
+                filled[pid] = have
+            backordered[pid] = qty - have
+            self._enqueue(pid, order, qty - have)
+
+        if not backordered:
+            status = FILLED
+        elif filled:
+            status = PARTIAL
+        else:
+            status = BACKORDERED
+        return Allocation(order.order_id, status, filled, backordered)
+
+    def _enqueue(self, pid: int, order: Order, qty: int) -> None:
+        rank = order.priority if self.policy == PRIORITY else 0
+        self._seq += 1
+        heapq.heappush(self.backorders.setdefault(pid, []), [rank, self._seq, order.order_id, qty])
+
+    # -----------------------
+    # Restock: serve back-orders first
+    # -----------------------
+    def restock(self, pid: int, qty: int) -> List[Tuple[int, int]]:
+        """
+        Add stock for one product and hand it to waiting back-orders.
+        Return [(order_id, qty_filled), ...] in the order they were served.
+
+        Time: O(k log q) for k back-orders served out of q waiting
+        """
+        if qty <= 0:
+            raise ValueError("qty must be >= 1")
+        if pid < 0:
+            raise ValueError("product id must be >= 0")
+        if pid >= len(self.stock):
+            self.stock.extend([0] * (pid + 1 - len(self.stock)))
+
+        available = self.stock[pid] + qty
+        served: List[Tuple[int, int]] = []
+        queue = self.backorders.get(pid)
+        while queue and available:
+            entry = queue[0]
+            take = min(entry[3], available)
+            available -= take
+            served.append((entry[2], take))
+            if take == entry[3]:
+                heapq.heappop(queue)
+            else:
+                entry[3] -= take
+        if queue == []:
+            del self.backorders[pid]
+
+        self.stock[pid] = available
+        return served
+
+    def backorder_qty(self, pid: int) -> int:
+        return sum(entry[3] for entry in self.backorders.get(pid, ()))
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    from day3_dsa import can_fulfill_order
+
+    print("Running allocator tests...")
+
+    # All-or-nothing matches can_fulfill_order on the first order
+    stock = {1: 5, 2: 0, 3: 10}
+    alloc = InventoryAllocator(stock, partial=False)
+    assert (alloc.allocate_one(Order(1, {1: 2, 3: 5})).status == FILLED) == can_fulfill_order(stock, {1: 2, 3: 5})
+    assert alloc.allocate_one(Order(2, {2: 1})).status == REJECTED
+    assert alloc.allocate_one(Order(3, {1: 4})).status == REJECTED  # only 3 left, untouched
+    assert list(alloc.stock) == [0, 3, 0, 5]
+
+    # Unknown products and non-positive quantities are rejected, never queued
+    for partial in (False, True):
+        alloc = InventoryAllocator({0: 5, 1: 5}, partial=partial)
+        for lines in ({2: 0}, {-1: 1}, {0: 1, 7: 2}, {0: 0}, {1: -3}):
+            assert alloc.allocate_one(Order(1, lines)).status == REJECTED
+        assert list(alloc.stock) == [5, 5] and not alloc.backorders
+
+    # Partial fills + FIFO back-orders
+    alloc = InventoryAllocator({1: 5, 2: 1, 9: 0})
+    a, b, c = alloc.allocate([Order(1, {1: 3}), Order(2, {1: 4, 2: 1}), Order(3, {1: 2, 9: 1})])
+    assert (a.status, a.filled) == (FILLED, {1: 3})
+    assert (b.status, b.filled, b.backordered) == (PARTIAL, {1: 2, 2: 1}, {1: 2})
+    assert (c.status, c.backordered) == (BACKORDERED, {1: 2, 9: 1})
+    assert alloc.backorder_qty(1) == 4
+    assert alloc.restock(1, 3) == [(2, 2), (3, 1)]
+    assert alloc.restock(1, 5) == [(3, 1)]
+    assert alloc.stock[1] == 4 and alloc.backorder_qty(1) == 0
+    assert alloc.restock(9, 1) == [(3, 1)]
+
+    # Priority: lower number first, FIFO within a priority
+    alloc = InventoryAllocator({1: 1}, policy=PRIORITY)
+    result = alloc.allocate([Order(1, {1: 1}, priority=5), Order(2, {1: 1}, priority=1), Order(3, {1: 1}, priority=5)])
+    assert [(r.order_id, r.status) for r in result] == [(2, FILLED), (1, BACKORDERED), (3, BACKORDERED)]
+    alloc.allocate_one(Order(4, {1: 1}, priority=0))
+    assert alloc.restock(1, 2) == [(4, 1), (1, 1)]
+
+    print("✅ All allocator tests passed!")
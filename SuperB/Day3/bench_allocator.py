@@ -0,0 +1,50 @@
+"""
+Benchmark: InventoryAllocator throughput (orders/s) in one process.
+
+Run: python bench_allocator.py [--orders 500000]
+Stock is sized so roughly a third of the lines end up back-ordered, then
+every product is restocked to drain the back-order queues.
+"""
+import argparse
+import random
+import time
+
+from allocator import FIFO, PRIORITY, InventoryAllocator, Order
+
+
+def make_orders(n_orders, n_products, seed=0):
+    rng = random.Random(seed)
+    return [
+        Order(i, {rng.randrange(n_products): rng.randint(1, 4) for _ in range(rng.randint(1, 5))}, rng.randrange(10))
+        for i in range(n_orders)
+    ]
+
+
+def run(policy, partial, orders, n_products):
+    stock = {pid: len(orders) * 5 // n_products for pid in range(n_products)}
+    alloc = InventoryAllocator(stock, policy=policy, partial=partial)
+    t0 = time.perf_counter()
+    alloc.allocate(orders)
+    t_alloc = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    served = sum(len(alloc.restock(pid, 10**9)) for pid in range(n_products))
+    t_restock = time.perf_counter() - t0
+
+    mode = "partial" if partial else "all-or-nothing"
+    print(
+        f"{policy:<8} {mode:<15} {len(orders) / t_alloc:>10,.0f} orders/s"
+        f"   back-orders served={served:>7,} in {t_restock:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=500_000)
+    parser.add_argument("--products", type=int, default=2_000)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders, args.products)
+    for policy in (FIFO, PRIORITY):
+        for partial in (True, False):
+            run(policy, partial, orders, args.products)
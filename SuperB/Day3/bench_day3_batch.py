@@ -0,0 +1,80 @@
+"""
+Benchmark: per-cart count_cart_items()/can_fulfill_order() loops vs the
+batched NumPy versions in day3_batch.py.
+
+Run: python bench_day3_batch.py [--carts 1000000]
+Timings for the batch path exclude packing (the nightly job already has
+the data as arrays); packing is reported separately.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from day3_batch import (
+    can_fulfill_orders_batch,
+    count_cart_items_batch,
+    pack_carts,
+    pack_orders,
+    stock_vector,
+)
+from day3_dsa import can_fulfill_order, count_cart_items
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def make_data(n_carts, n_products, max_items, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(0, max_items + 1, n_carts)
+    offsets = np.zeros(n_carts + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    product_ids = rng.integers(0, n_products, int(offsets[-1]))
+    qtys = rng.integers(1, 6, int(offsets[-1]))
+    stock = rng.integers(0, 50, n_products)
+    return product_ids, qtys, offsets, stock
+
+
+def report(label, scalar, batch):
+    print(f"{label:<24} loop={scalar:8.2f}s  batch={batch:7.3f}s  x{scalar / batch:6.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carts", type=int, default=1_000_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--max-items", type=int, default=10)
+    args = parser.parse_args()
+
+    product_ids, qtys, offsets, stock_arr = make_data(args.carts, args.products, args.max_items)
+    print(f"carts={args.carts:,}  lines={product_ids.size:,}  products={args.products:,}")
+
+    # Python-side inputs the scalar functions take
+    bounds = offsets.tolist()
+    pid_list, qty_list = product_ids.tolist(), qtys.tolist()
+    carts = [pid_list[a:b] for a, b in zip(bounds, bounds[1:])]
+    orders = [dict(zip(pid_list[a:b], qty_list[a:b])) for a, b in zip(bounds, bounds[1:])]
+    stock = dict(enumerate(stock_arr.tolist()))
+
+    # 1) counts
+    expected, t_loop = timed(lambda: [count_cart_items(c) for c in carts])
+    (cart_idx, pids, counts), t_batch = timed(count_cart_items_batch, product_ids, offsets)
+    assert int(counts.sum()) == sum(sum(d.values()) for d in expected)
+    assert sum(map(len, expected)) == cart_idx.size
+    report("count_cart_items", t_loop, t_batch)
+    _, t_pack = timed(pack_carts, carts)
+    print(f"{'  pack_carts':<24} {t_pack:.3f}s")
+
+    # 2) fulfilment (orders are dicts, so duplicate product ids collapse;
+    #    pack them again for an identical input)
+    o_pids, o_qtys, o_offsets = pack_orders(orders)
+    vec = stock_vector(stock)
+    expected, t_loop = timed(lambda: [can_fulfill_order(stock, o) for o in orders])
+    mask, t_batch = timed(can_fulfill_orders_batch, vec, o_pids, o_qtys, o_offsets)
+    assert mask.tolist() == expected
+    report("can_fulfill_order", t_loop, t_batch)
+    _, t_pack = timed(pack_orders, orders)
+    print(f"{'  pack_orders':<24} {t_pack:.3f}s")
@@ -0,0 +1,80 @@
+"""
+Benchmark: shortest_path_grid() vs the pathfinding.py searches.
+
+Run: python bench_pathfinding.py [--size 4000] [--blocked 0.25] [--original-size 1000]
+Random grid with the corners kept free. The original tuple/set BFS is
+timed on a smaller grid (--original-size) since at 4k x 4k it needs
+several GB for its `seen` set. Peak memory (tracemalloc) is measured in a
+separate run on the small grid only, tracing slows pure Python a lot.
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from day3_dsa import shortest_path_grid
+from pathfinding import FlatGrid, astar, bfs, bidirectional_bfs, distance_field
+
+
+def make_grid(size, blocked, seed=0):
+    grid = (np.random.default_rng(seed).random((size, size)) < blocked).astype(np.uint8)
+    grid[0, 0] = grid[-1, -1] = 0
+    return grid
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def peak_mb(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def row(label, steps, elapsed, peak=None):
+    mem = f"  peak={peak:7.1f} MB" if peak is not None else ""
+    print(f"{label:<26} steps={steps:>6}  {elapsed:8.2f}s{mem}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=4000)
+    parser.add_argument("--blocked", type=float, default=0.25)
+    parser.add_argument("--original-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    small = make_grid(args.original_size, args.blocked)
+    print(f"-- {args.original_size}x{args.original_size}, {args.blocked:.0%} blocked")
+    rows = small.tolist()
+    steps, t = timed(shortest_path_grid, rows)
+    row("shortest_path_grid", steps, t, peak_mb(shortest_path_grid, rows))
+    g = FlatGrid.from_array(small)
+    corners = ([(0, 0)], [(args.original_size - 1, args.original_size - 1)])
+    for search in (bfs, bidirectional_bfs, astar):
+        (s, path), t = timed(search, g, *corners)
+        assert s == steps
+        row(search.__name__, s, t, peak_mb(search, g, *corners))
+
+    big = make_grid(args.size, args.blocked)
+    print(f"-- {args.size}x{args.size}, {args.blocked:.0%} blocked")
+    g = FlatGrid.from_array(big)
+    corners = ([(0, 0)], [(args.size - 1, args.size - 1)])
+    results = {}
+    for search in (bfs, bidirectional_bfs, astar):
+        (s, path), t = timed(search, g, *corners)
+        results[search.__name__] = s
+        row(search.__name__, s, t)
+    assert len(set(results.values())) == 1
+
+    docks = [(0, c) for c in range(0, args.size, args.size // 8)]
+    bays = [(args.size - 1, c) for c in range(0, args.size, 97)]
+    (s, path), t = timed(bidirectional_bfs, g, docks, bays)
+    row(f"bidirectional {len(docks)}->{len(bays)} cells", s, t)
+    _, t = timed(distance_field, g, docks)
+    row(f"distance_field {len(docks)} sources", -1, t)
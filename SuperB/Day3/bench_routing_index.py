@@ -0,0 +1,83 @@
+"""
+Benchmark: repeated routing on one layout with RoutingIndex.
+
+Run: python bench_routing_index.py [--size 2000] [--queries 1000] [--flips 100]
+  1) many targets from the top-left: shortest_path_grid() per query vs
+     one index build + O(1) lookups / O(path) path reads
+  2) cells flipping: set_cell() repair vs rebuilding the distance field
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from day3_dsa import shortest_path_grid
+from pathfinding import distance_field
+from routing_index import RoutingIndex
+
+
+def make_grid(size, blocked=0.25, seed=0):
+    grid = (np.random.default_rng(seed).random((size, size)) < blocked).astype(np.uint8)
+    grid[0, 0] = 0
+    return grid
+
+
+def original_to(rows, target):
+    # shortest_path_grid() only routes to the bottom-right corner, so crop
+    return shortest_path_grid([row[: target[1] + 1] for row in rows[: target[0] + 1]])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--flips", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    grid = make_grid(args.size)
+    free = [tuple(map(int, rc)) for rc in np.argwhere(grid == 0)]
+    targets = [free[rng.randrange(len(free))] for _ in range(args.queries)]
+
+    # 1) repeated queries from one start
+    t0 = time.perf_counter()
+    index = RoutingIndex(grid, [(0, 0)])
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    [index.distance((0, 0), t) for t in targets]
+    t_lookup = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for t in targets[:100]:
+        index.route((0, 0), t)
+    t_paths = (time.perf_counter() - t0) / 100
+
+    rows = grid.tolist()
+    sample = targets[:5]
+    t0 = time.perf_counter()
+    for t in sample:
+        original_to(rows, t)
+    t_orig = (time.perf_counter() - t0) / len(sample)
+
+    print(f"grid {args.size}x{args.size}, {args.queries} targets from (0, 0)")
+    print(f"  shortest_path_grid per query   {t_orig * 1e3:10.1f} ms  (cropped grid, avg of {len(sample)})")
+    print(f"  index build (once)             {t_build * 1e3:10.1f} ms")
+    print(f"  index distance per query       {t_lookup / args.queries * 1e6:10.1f} us")
+    print(f"  index route (path) per query   {t_paths * 1e3:10.1f} ms")
+
+    # 2) flips
+    hubs = [(0, 0), (0, args.size - 1), (args.size - 1, 0)]
+    index = RoutingIndex(grid, hubs)
+    cells = [(rng.randrange(args.size), rng.randrange(args.size)) for _ in range(args.flips)]
+    t0 = time.perf_counter()
+    for n, cell in enumerate(cells):
+        index.set_cell(cell, blocked=n % 2 == 0)
+    t_repair = (time.perf_counter() - t0) / args.flips
+    t0 = time.perf_counter()
+    for hub in hubs:
+        expected = distance_field(index.grid, [hub]).ravel()
+        assert np.array_equal(index.fields[hub], expected)
+    t_rebuild = time.perf_counter() - t0
+    print(f"{args.flips} cell flips, {len(hubs)} hubs")
+    print(f"  set_cell repair per flip       {t_repair * 1e3:10.1f} ms")
+    print(f"  full rebuild per flip          {t_rebuild * 1e3:10.1f} ms")
@@ -0,0 +1,73 @@
+"""
+Benchmark: many two-sum queries against one price list.
+
+Run: python bench_sum_index.py [--prices 2000] [--targets 5000]
+Compares per-target calls of day3_dsa.two_sum() and prep_20.two_sum()
+with SumIndex (pair table and complement-search paths, per target and
+batched). prep_20.two_sum is O(n^2), so it only runs on the first
+--prep-targets targets.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from day3_dsa import two_sum
+from sum_index import SumIndex
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from prep_20 import two_sum as prep_two_sum  # noqa: E402
+
+
+def per_query(fn, targets):
+    t0 = time.perf_counter()
+    result = fn(targets)
+    return result, (time.perf_counter() - t0) / len(targets)
+
+
+def row(label, seconds):
+    print(f"{label:<34} {seconds * 1e6:12.1f} us/query")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prices", type=int, default=2_000)
+    parser.add_argument("--targets", type=int, default=5_000)
+    parser.add_argument("--prep-targets", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    prices = [rng.randrange(100, 100_000) for _ in range(args.prices)]
+    # Half are real bundle totals, half random (mostly misses)
+    targets = [
+        rng.choice(prices) + rng.choice(prices) if n % 2 else rng.randrange(200, 200_000)
+        for n in range(args.targets)
+    ]
+    print(f"prices={args.prices:,}  targets={args.targets:,}")
+
+    expected, t = per_query(lambda ts: [two_sum(prices, x) for x in ts], targets)
+    row("day3_dsa.two_sum per target", t)
+    _, t = per_query(lambda ts: [prep_two_sum(prices, x) for x in ts], targets[: args.prep_targets])
+    row("prep_20.two_sum per target", t)
+
+    t0 = time.perf_counter()
+    index = SumIndex(prices)
+    index.two_sum_many(targets[:1])  # builds the pair table
+    print(f"{'SumIndex build + pair table':<34} {(time.perf_counter() - t0) * 1e3:12.1f} ms (once)")
+    batch, t = per_query(index.two_sum_many, targets)
+    assert [pair[0] >= 0 for pair in batch.tolist()] == [e is not None for e in expected]
+    row("SumIndex.two_sum_many (table)", t)
+
+    no_table = SumIndex(prices, max_pairs=0)
+    _, t = per_query(lambda ts: [no_table.two_sum(x) for x in ts], targets)
+    row("SumIndex.two_sum per target", t)
+    batch, t = per_query(no_table.two_sum_many, targets)
+    assert [pair[0] >= 0 for pair in batch.tolist()] == [e is not None for e in expected]
+    row("SumIndex.two_sum_many (no table)", t)
+    _, t = per_query(index.closest_pair_sums, targets)
+    row("SumIndex.closest_pair_sums", t)
+    _, t = per_query(lambda ts: [no_table.closest_sum(x, 2) for x in ts], targets)
+    row("SumIndex.closest_sum per target", t)
+    _, t = per_query(no_table.closest_pair_sums, targets)
+    row("closest_pair_sums (no table)", t)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Batched (NumPy) versions of the Day 3 cart/inventory helpers.
+#
+# Many carts/orders are packed into flat arrays + offsets (CSR layout):
+#   product_ids = [1,1,2, 3, 2,2]     offsets = [0, 3, 4, 6]
+#   -> cart 0 = [1,1,2], cart 1 = [3], cart 2 = [2,2]
+#
+# count_cart_items() / can_fulfill_order() in day3_dsa.py stay the scalar
+# path for a single cart or order.
+
+
+# ============================================================
+# Packing helpers (Python lists/dicts -> flat arrays)
+# ============================================================
+def pack_carts(carts: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """[[1,1,2],[3]] -> (product_ids, offsets) with len(offsets) == len(carts) + 1."""
+    lengths = np.fromiter((len(c) for c in carts), dtype=np.int64, count=len(carts))
+    offsets = np.zeros(len(carts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    product_ids = np.fromiter((pid for c in carts for pid in c), dtype=np.int64, count=int(offsets[-1]))
+    return product_ids, offsets
+
+
+def pack_orders(orders: List[Dict[int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """[{1: 2, 3: 5}, {2: 1}] -> (product_ids, qtys, offsets)."""
+    lengths = np.fromiter((len(o) for o in orders), dtype=np.int64, count=len(orders))
+    offsets = np.zeros(len(orders) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    n = int(offsets[-1])
+    product_ids = np.fromiter((pid for o in orders for pid in o), dtype=np.int64, count=n)
+    qtys = np.fromiter((q for o in orders for q in o.values()), dtype=np.int64, count=n)
+    return product_ids, qtys, offsets
+
+
+def stock_vector(stock: Dict[int, int]) -> np.ndarray:
+    """{product_id: qty} -> array where stock_vec[product_id] = qty (missing = 0)."""
+    size = max(stock, default=-1) + 1
+    vec = np.zeros(size, dtype=np.int64)
+    if stock:
+        vec[np.fromiter(stock.keys(), dtype=np.int64)] = np.fromiter(stock.values(), dtype=np.int64)
+    return vec
+
+
+def _segment_ids(offsets: np.ndarray) -> np.ndarray:
+    """offsets [0,3,4,6] -> [0,0,0,1,2,2] (which cart/order each element belongs to)."""
+    return np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+
+
+# ============================================================
+# Problem 1 (batch): product counts for many carts at once
+# ============================================================
+def count_cart_items_batch(
+    product_ids: np.ndarray, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (cart_index, product_id, count), sorted by cart then product.
+    One row per distinct (cart, product) pair, i.e. the flattened form of
+    [count_cart_items(cart) for cart in carts].
+
+    Uses one bincount over a combined (cart, product) key when that key
+    space is small enough, otherwise a sort-based unique.
+
+    Time: O(n + carts * products) with bincount, O(n log n) otherwise
+    Space: O(n)
+    """
+    product_ids = np.asarray(product_ids, dtype=np.int64)
+    n_carts = len(offsets) - 1
+    if product_ids.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    lo = int(product_ids.min())
+    span = int(product_ids.max()) - lo + 1
+    keys = _segment_ids(offsets) * span + (product_ids - lo)
+
+    key_space = n_carts * span
+    if key_space <= 4 * product_ids.size + 1024:
+        counts = np.bincount(keys, minlength=key_space)
+        keys = np.flatnonzero(counts)
+        counts = counts[keys]
+    else:
+        keys, counts = np.unique(keys, return_counts=True)
+
+    return keys // span, keys % span + lo, counts
+
+
+def items_per_cart_batch(offsets: np.ndarray) -> np.ndarray:
+    """Total number of items in each cart (just the segment lengths)."""
+    return np.diff(offsets)
+
+
+# ============================================================
+# Problem 7 (batch): fulfilment mask for many orders at once
+# ============================================================
+def can_fulfill_orders_batch(
+    stock_vec: np.ndarray, product_ids: np.ndarray, qtys: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """
+    stock_vec: stock_vec[product_id] = available quantity (see stock_vector)
+    Orders packed as (product_ids, qtys, offsets), one line per product.
+
+    Return a bool array: True where the whole order can be fulfilled from
+    the current stock (each order checked independently, like calling
+    can_fulfill_order() in a loop). Unknown product ids count as 0 stock.
+
+    Time: O(n) for n order lines
+    Space: O(n)
+    """
+    product_ids = np.asarray(product_ids, dtype=np.int64)
+    qtys = np.asarray(qtys, dtype=np.int64)
+    n_orders = len(offsets) - 1
+
+    known = (product_ids >= 0) & (product_ids < stock_vec.size)
+    available = np.zeros(product_ids.size, dtype=stock_vec.dtype)
+    available[known] = stock_vec[product_ids[known]]
+    short = qtys > available
+
+    # Number of short lines per order; empty orders get 0 => fulfillable
+    short_lines = np.bincount(_segment_ids(offsets)[short], minlength=n_orders)
+    return short_lines == 0
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    from day3_dsa import can_fulfill_order, count_cart_items
+
+    print("Running Day 3 batch tests...")
+
+    carts = [[1, 1, 2, 3, 3, 3], [], [7], [2, 2]]
+    cart_idx, pids, counts = count_cart_items_batch(*pack_carts(carts))
+    batched = [{} for _ in carts]
+    for c, p, n in zip(cart_idx.tolist(), pids.tolist(), counts.tolist()):
+        batched[c][p] = n
+    assert batched == [count_cart_items(c) for c in carts]
+    assert items_per_cart_batch(pack_carts(carts)[1]).tolist() == [6, 0, 1, 2]
+
+    # Sparse ids take the np.unique path
+    carts = [[10**9, 5], [5]]
+    cart_idx, pids, counts = count_cart_items_batch(*pack_carts(carts))
+    assert list(zip(cart_idx.tolist(), pids.tolist(), counts.tolist())) == [(0, 5, 1), (0, 10**9, 1), (1, 5, 1)]
+
+    stock = {1: 5, 2: 0, 3: 10}
+    orders = [{1: 2, 3: 5}, {2: 1}, {}, {9: 1}, {1: 5, 3: 11}]
+    mask = can_fulfill_orders_batch(stock_vector(stock), *pack_orders(orders))
+    assert mask.tolist() == [can_fulfill_order(stock, o) for o in orders]
+
+    rng = np.random.default_rng(0)
+    carts = [rng.integers(0, 50, rng.integers(0, 12)).tolist() for _ in range(2_000)]
+    cart_idx, pids, counts = count_cart_items_batch(*pack_carts(carts))
+    batched = [{} for _ in carts]
+    for c, p, n in zip(cart_idx.tolist(), pids.tolist(), counts.tolist()):
+        batched[c][p] = n
+    assert batched == [count_cart_items(c) for c in carts]
+
+    print("✅ All Day 3 batch tests passed!")
@@ -0,0 +1,324 @@
+from __future__ import annotations
+import heapq
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# Grid pathfinding on flat buffers.
+#
+# shortest_path_grid() in day3_dsa.py keeps (r, c, steps) tuples in a deque
+# and a set of (r, c) tuples, which costs ~100 bytes per visited cell. Here a
+# grid is one flat bool array (cell i = r * cols + c) and all state is flat
+# arrays too:
+#   - bfs / bidirectional_bfs expand a whole BFS level at once with NumPy
+#     (the frontier is an index array), so the Python overhead is per level,
+#     not per cell
+#   - astar walks cell by cell with heapq, over bytes/array('i') buffers
+#
+# 0 = free, 1 = blocked, moves are up/down/left/right, as in day3_dsa.py.
+# Every search takes several sources and several targets and returns
+# (steps, path) with path = [(r, c), ...] from a source to a target,
+# or (-1, []) when no target is reachable.
+
+Cell = Tuple[int, int]
+PathResult = Tuple[int, List[Cell]]
+
+
+class FlatGrid:
+    """A grid as a flat bool array of free cells."""
+
+    __slots__ = ("rows", "cols", "free")
+
+    def __init__(self, free: np.ndarray, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.free = free
+
+    @classmethod
+    def from_rows(cls, grid: Sequence[Sequence[int]]) -> "FlatGrid":
+        return cls.from_array(np.asarray(grid, dtype=np.uint8))
+
+    @classmethod
+    def from_array(cls, grid: np.ndarray) -> "FlatGrid":
+        rows, cols = grid.shape
+        return cls(np.ascontiguousarray(grid == 0).ravel(), rows, cols)
+
+    def index(self, cell: Cell) -> int:
+        r, c = cell
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise ValueError(f"cell {cell} is outside the grid")
+        return r * self.cols + c
+
+    def coords(self, i: int) -> Cell:
+        return divmod(int(i), self.cols)
+
+    def neighbors(self, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """All free neighbors of the cells in idx, as (neighbor, from) arrays."""
+        C, N = self.cols, self.free.size
+        col = idx % C
+        parts = (
+            (idx[idx >= C], -C),
+            (idx[idx < N - C], C),
+            (idx[col != 0], -1),
+            (idx[col != C - 1], 1),
+        )
+        src = np.concatenate([p for p, _ in parts])
+        nb = np.concatenate([p + d for p, d in parts])
+        ok = self.free[nb]
+        return nb[ok], src[ok]
+
+    def _indices(self, cells: Iterable[Cell]) -> np.ndarray:
+        idx = np.unique(np.fromiter((self.index(c) for c in cells), dtype=np.int64))
+        return idx[self.free[idx]]
+
+
+def _as_grid(grid) -> FlatGrid:
+    if isinstance(grid, FlatGrid):
+        return grid
+    if isinstance(grid, np.ndarray):
+        return FlatGrid.from_array(grid)
+    return FlatGrid.from_rows(grid)
+
+
+def _walk(grid: FlatGrid, parent, i: int) -> List[Cell]:
+    """Follow parent links back to a root (parent[root] == root)."""
+    path = [i]
+    while parent[i] != i:
+        i = int(parent[i])
+        path.append(i)
+    return [grid.coords(j) for j in reversed(path)]
+
+
+def _expand(grid: FlatGrid, frontier: np.ndarray, dist: np.ndarray, parent: np.ndarray, step: int) -> np.ndarray:
+    """One BFS level: mark unvisited neighbors of frontier, return them."""
+    nb, src = grid.neighbors(frontier)
+    new = dist[nb] < 0
+    nb, first = np.unique(nb[new], return_index=True)
+    dist[nb] = step
+    parent[nb] = src[new][first]
+    return nb
+
+
+# ============================================================
+# BFS (multi-source / multi-target)
+# ============================================================
+def bfs(grid, sources: Iterable[Cell], targets: Iterable[Cell]) -> PathResult:
+    """
+    Shortest path from any source to any target.
+
+    Time: O(R*C) cells, O(path length) NumPy calls
+    Space: 12 bytes per cell (int32 distance + int64 parent)
+    """
+    g = _as_grid(grid)
+    frontier = g._indices(sources)
+    is_target = np.zeros(g.free.size, dtype=bool)
+    is_target[g._indices(targets)] = True
+
+    dist = np.full(g.free.size, -1, dtype=np.int32)
+    parent = np.full(g.free.size, -1, dtype=np.int64)
+    dist[frontier] = 0
+    parent[frontier] = frontier
+
+    step = 0
+    while frontier.size:
+        hit = frontier[is_target[frontier]]
+        if hit.size:
+            return step, _walk(g, parent, int(hit[0]))
+        step += 1
+        frontier = _expand(g, frontier, dist, parent, step)
+    return -1, []
+
+
+def distance_field(grid, sources: Iterable[Cell]) -> np.ndarray:
+    """
+    BFS distance from the nearest source to every cell, shape (R, C),
+    -1 for blocked/unreachable cells.
+
+    Time: O(R*C)
+    Space: O(R*C)
+    """
+    g = _as_grid(grid)
+    frontier = g._indices(sources)
+    dist = np.full(g.free.size, -1, dtype=np.int32)
+    parent = np.empty(g.free.size, dtype=np.int64)  # unused, _expand writes it
+    dist[frontier] = 0
+
+    step = 0
+    while frontier.size:
+        step += 1
+        frontier = _expand(g, frontier, dist, parent, step)
+    return dist.reshape(g.rows, g.cols)
+
+
+# ============================================================
+# Bidirectional BFS
+# ============================================================
+def bidirectional_bfs(grid, sources: Iterable[Cell], targets: Iterable[Cell]) -> PathResult:
+    """
+    BFS from both ends, always growing the smaller frontier by one level.
+    When the searches meet, the best meeting cell of that level gives the
+    shortest path. Explores far fewer cells than bfs() on open grids.
+
+    Time: O(R*C) worst case
+    Space: 24 bytes per cell
+    """
+    g = _as_grid(grid)
+    fa, fb = g._indices(sources), g._indices(targets)
+    N = g.free.size
+    dist_a = np.full(N, -1, dtype=np.int32)
+    dist_b = np.full(N, -1, dtype=np.int32)
+    parent_a = np.full(N, -1, dtype=np.int64)
+    parent_b = np.full(N, -1, dtype=np.int64)
+    dist_a[fa], parent_a[fa] = 0, fa
+    dist_b[fb], parent_b[fb] = 0, fb
+
+    both = fa[dist_b[fa] == 0]
+    if both.size:
+        return 0, [g.coords(both[0])]
+
+    step_a = step_b = 0
+    while fa.size and fb.size:
+        if fa.size <= fb.size:
+            step_a += 1
+            fa = _expand(g, fa, dist_a, parent_a, step_a)
+            meet = fa[dist_b[fa] >= 0]
+        else:
+            step_b += 1
+            fb = _expand(g, fb, dist_b, parent_b, step_b)
+            meet = fb[dist_a[fb] >= 0]
+        if meet.size:
+            m = int(meet[np.argmin(dist_a[meet] + dist_b[meet])])
+            path = _walk(g, parent_a, m) + _walk(g, parent_b, m)[::-1][1:]
+            return len(path) - 1, path
+    return -1, []
+
+
+# ============================================================
+# A* (Manhattan heuristic)
+# ============================================================
+def astar(grid, sources: Iterable[Cell], targets: Iterable[Cell]) -> PathResult:
+    """
+    A* with h = Manhattan distance to the nearest target (admissible and
+    consistent for 4-way moves), ties broken towards lower h so open areas
+    go straight for the target.
+
+    Time: O(R*C log(R*C)) worst case, close to O(path) on open grids
+    Space: 8 bytes per cell + the open heap
+    """
+    g = _as_grid(grid)
+    C, N = g.cols, g.free.size
+    free = g.free.view(np.uint8).tobytes()
+    goals = [divmod(int(t), C) for t in g._indices(targets)]
+    if not goals:
+        return -1, []
+    is_goal = set(r * C + c for r, c in goals)
+
+    if len(goals) == 1:
+        (gr, gc), = goals
+
+        def h(i: int) -> int:
+            r, c = divmod(i, C)
+            return abs(r - gr) + abs(c - gc)
+    else:
+        def h(i: int) -> int:
+            r, c = divmod(i, C)
+            return min(abs(r - gr) + abs(c - gc) for gr, gc in goals)
+
+    best = array("i", [-1]) * N
+    parent = array("i", [-1]) * N
+    heap: List[Tuple[int, int, int, int]] = []
+    for s in g._indices(sources).tolist():
+        best[s] = 0
+        parent[s] = s
+        heap.append((h(s), h(s), 0, s))
+    heapq.heapify(heap)
+
+    push, pop = heapq.heappush, heapq.heappop
+    while heap:
+        _, _, d, i = pop(heap)
+        if d > best[i]:
+            continue  # stale entry
+        if i in is_goal:
+            return d, _walk(g, parent, i)
+        d += 1
+        c = i % C
+        for j in (i - C, i + C, i - 1 if c else -1, i + 1 if c != C - 1 else -1):
+            if 0 <= j < N and free[j] and (best[j] < 0 or d < best[j]):
+                best[j] = d
+                parent[j] = i
+                hj = h(j)
+                push(heap, (d + hj, hj, d, j))
+    return -1, []
+
+
+# ============================================================
+# Drop-in for day3_dsa.shortest_path_grid
+# ============================================================
+def shortest_path_grid_fast(grid: List[List[int]], path: bool = False):
+    """
+    Same contract as shortest_path_grid(): top-left to bottom-right,
+    returns steps or -1. With path=True returns (steps, path) instead.
+    """
+    if not grid or not grid[0]:
+        return (-1, []) if path else -1
+    g = FlatGrid.from_rows(grid)
+    steps, cells = bidirectional_bfs(g, [(0, 0)], [(g.rows - 1, g.cols - 1)])
+    return (steps, cells) if path else steps
+
+
+def is_valid_path(grid: FlatGrid, path: List[Cell]) -> bool:
+    """Every cell free and each move one step up/down/left/right."""
+    if not all(grid.free[grid.index(p)] for p in path):
+        return False
+    return all(abs(r1 - r2) + abs(c1 - c2) == 1 for (r1, c1), (r2, c2) in zip(path, path[1:]))
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    import random
+    from day3_dsa import shortest_path_grid
+
+    print("Running pathfinding tests...")
+
+    grid = [
+        [0, 0, 0],
+        [1, 1, 0],
+        [0, 0, 0],
+    ]
+    assert shortest_path_grid_fast(grid) == 4
+    assert shortest_path_grid_fast(grid, path=True) == (4, [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)])
+    assert shortest_path_grid_fast([[0, 1], [1, 0]]) == -1
+    assert shortest_path_grid_fast([[0]]) == 0
+
+    g = FlatGrid.from_rows(grid)
+    for search in (bfs, bidirectional_bfs, astar):
+        assert search(g, [(0, 0)], [(2, 2)])[0] == 4
+        # multi-source / multi-target: nearest pair wins
+        steps, path = search(g, [(0, 0), (2, 0)], [(2, 1), (0, 2)])
+        assert (steps, path) == (1, [(2, 0), (2, 1)])
+        assert search(g, [(0, 0)], [(1, 0)]) == (-1, [])  # blocked target
+
+    field = distance_field(g, [(0, 0)])
+    assert field.tolist() == [[0, 1, 2], [-1, -1, 3], [6, 5, 4]]
+
+    rng = random.Random(1)
+    for _ in range(300):
+        R, C = rng.randint(1, 12), rng.randint(1, 12)
+        rows = [[int(rng.random() < 0.3) for _ in range(C)] for _ in range(R)]
+        expected = shortest_path_grid(rows)
+        g = FlatGrid.from_rows(rows)
+        for search in (bfs, bidirectional_bfs, astar):
+            src, dst = [(0, 0)], [(R - 1, C - 1)]
+            if rows[0][0] or rows[R - 1][C - 1]:
+                assert search(g, src, dst) == (-1, [])
+                continue
+            steps, path = search(g, src, dst)
+            assert steps == expected, (search.__name__, rows)
+            if steps >= 0:
+                assert len(path) == steps + 1 and path[0] == (0, 0) and path[-1] == (R - 1, C - 1)
+                assert is_valid_path(g, path)
+
+    print("✅ All pathfinding tests passed!")
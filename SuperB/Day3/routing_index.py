@@ -0,0 +1,343 @@
+from __future__ import annotations
+import heapq
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pathfinding import Cell, FlatGrid, PathResult, _as_grid, bidirectional_bfs, distance_field
+
+# Repeated routing on one warehouse layout.
+#
+# shortest_path_grid() restarts a BFS for every query. A RoutingIndex runs
+# one BFS per hub cell (dock, packing station, the top-left start, ...) and
+# keeps the distance field, so "hub -> any cell" is an O(1) lookup and the
+# path is read back by walking down the field. Other pairs go through
+# bidirectional_bfs() and are memoized.
+#
+# When a few cells flip between blocked and free, set_cell() repairs each
+# field locally instead of redoing the BFS:
+#   - freeing a cell can only shorten distances: relax outwards from it
+#   - blocking a cell can only lengthen the distances of cells whose every
+#     shortest path went through it: find those, then re-settle just them
+#     from their unaffected border
+#
+# Indexes are shared per (layout hash, hubs) through index_for(). The hash is
+# an XOR of per-cell keys over blocked cells, so a flip updates it in O(1).
+
+MASK64 = (1 << 64) - 1
+MAX_ROUTES = 4096
+MAX_INDEXES = 8
+
+
+# -----------------------
+# Layout hash
+# -----------------------
+def _mix(x: int) -> int:
+    """splitmix64 finalizer: a well spread 64-bit key per cell index."""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def _mix_array(x: np.ndarray) -> np.ndarray:
+    x = x.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def layout_hash(grid) -> int:
+    """
+    Hash of the grid shape + blocked cells. Equal layouts hash equal.
+
+    Time: O(R*C) (vectorized)
+    """
+    g = _as_grid(grid)
+    blocked = np.flatnonzero(~g.free)
+    h = int(np.bitwise_xor.reduce(_mix_array(blocked))) if blocked.size else 0
+    return h ^ _mix((g.rows << 32) | g.cols | (1 << 63))
+
+
+# -----------------------
+# Incremental field repair (flat int32 fields, -1 = unreachable)
+# -----------------------
+def _neighbors(i: int, C: int, N: int) -> List[int]:
+    out = []
+    if i >= C:
+        out.append(i - C)
+    if i < N - C:
+        out.append(i + C)
+    c = i % C
+    if c:
+        out.append(i - 1)
+    if c != C - 1:
+        out.append(i + 1)
+    return out
+
+
+def _repair_opened(dist: np.ndarray, free: np.ndarray, i: int, C: int) -> None:
+    """Cell i just became free: relax distances outwards from it."""
+    N = free.size
+    reach = [int(dist[j]) for j in _neighbors(i, C, N) if dist[j] >= 0]
+    if not reach:
+        return  # still cut off from the hub
+    dist[i] = min(reach) + 1
+    queue = deque([i])
+    while queue:
+        v = queue.popleft()
+        d = int(dist[v]) + 1
+        for w in _neighbors(v, C, N):
+            if free[w] and (dist[w] < 0 or dist[w] > d):
+                dist[w] = d
+                queue.append(w)
+
+
+def _repair_blocked(dist: np.ndarray, free: np.ndarray, i: int, C: int) -> None:
+    """Cell i just became blocked: re-settle the cells that depended on it."""
+    N = free.size
+    if dist[i] < 0:
+        return
+
+    # Level by level: w (dist d+1) is affected when none of its neighbors at
+    # dist d is still a valid, unaffected parent. dist is left untouched
+    # until the affected set is complete.
+    affected = {i}
+    queue = deque([i])
+    while queue:
+        v = queue.popleft()
+        d = int(dist[v])
+        for w in _neighbors(v, C, N):
+            if w in affected or not free[w] or dist[w] != d + 1:
+                continue
+            if not any(dist[u] == d and free[u] and u not in affected for u in _neighbors(w, C, N)):
+                affected.add(w)
+                queue.append(w)
+
+    for v in affected:
+        dist[v] = -1
+    affected.discard(i)
+
+    # Re-settle from the unaffected border (Dijkstra over the affected region)
+    heap = []
+    for v in affected:
+        border = [int(dist[u]) for u in _neighbors(v, C, N) if u not in affected and dist[u] >= 0]
+        if border:
+            heap.append((min(border) + 1, v))
+    heapq.heapify(heap)
+    while heap:
+        d, v = heapq.heappop(heap)
+        if 0 <= dist[v] <= d:
+            continue
+        dist[v] = d
+        for w in _neighbors(v, C, N):
+            if w in affected and (dist[w] < 0 or dist[w] > d + 1):
+                heapq.heappush(heap, (d + 1, w))
+
+
+# ============================================================
+# Routing index
+# ============================================================
+class RoutingIndex:
+    """
+    Distance fields from a fixed set of hub cells over one layout.
+
+    Space: 4 bytes per cell per hub
+    """
+
+    def __init__(self, grid, hubs: Iterable[Cell], max_routes: int = MAX_ROUTES):
+        g = _as_grid(grid)
+        # Own copy: set_cell() mutates it
+        self.grid = FlatGrid(g.free.copy(), g.rows, g.cols)
+        self.hubs = list(dict.fromkeys(tuple(h) for h in hubs))
+        self.fields: Dict[Cell, np.ndarray] = {
+            hub: distance_field(self.grid, [hub]).ravel() for hub in self.hubs
+        }
+        self.layout_key = layout_hash(self.grid)
+        self.max_routes = max_routes
+        self._routes: OrderedDict = OrderedDict()
+
+    # -----------------------
+    # Queries
+    # -----------------------
+    def distance(self, hub: Cell, cell: Cell) -> int:
+        """Steps from hub to cell, -1 if unreachable. O(1)."""
+        return int(self.fields[hub][self.grid.index(cell)])
+
+    def nearest_hub(self, cell: Cell) -> Tuple[Optional[Cell], int]:
+        """(closest hub, steps) or (None, -1). O(hubs)."""
+        i = self.grid.index(cell)
+        best: Tuple[Optional[Cell], int] = (None, -1)
+        for hub, field in self.fields.items():
+            d = int(field[i])
+            if d >= 0 and (best[1] < 0 or d < best[1]):
+                best = (hub, d)
+        return best
+
+    def path_from_hub(self, hub: Cell, cell: Cell) -> PathResult:
+        """
+        Walk down the hub's field from cell back to the hub.
+
+        Time: O(path length)
+        """
+        field = self.fields[hub]
+        C, N = self.grid.cols, self.grid.free.size
+        i = self.grid.index(cell)
+        d = int(field[i])
+        if d < 0:
+            return -1, []
+        path = [i]
+        while d:
+            d -= 1
+            i = next(j for j in _neighbors(i, C, N) if field[j] == d)
+            path.append(i)
+        return len(path) - 1, [self.grid.coords(j) for j in reversed(path)]
+
+    def route(self, src: Cell, dst: Cell) -> PathResult:
+        """Shortest path src -> dst: from a field when either end is a hub, else memoized search."""
+        src, dst = tuple(src), tuple(dst)
+        if src in self.fields:
+            return self.path_from_hub(src, dst)
+        if dst in self.fields:
+            steps, path = self.path_from_hub(dst, src)
+            return steps, path[::-1]
+
+        key = (src, dst)
+        hit = self._routes.get(key)
+        if hit is not None:
+            self._routes.move_to_end(key)
+            return hit
+        result = bidirectional_bfs(self.grid, [src], [dst])
+        self._routes[key] = result
+        if len(self._routes) > self.max_routes:
+            self._routes.popitem(last=False)
+        return result
+
+    # -----------------------
+    # Incremental updates
+    # -----------------------
+    def set_cell(self, cell: Cell, blocked: bool) -> None:
+        """
+        Flip one cell and repair every field locally.
+
+        Time: O(cells whose distance changes) per hub, not O(R*C)
+        """
+        i = self.grid.index(cell)
+        free = self.grid.free
+        if free[i] == (not blocked):
+            return
+        free[i] = not blocked
+        self.layout_key ^= _mix(i)
+        self._routes.clear()
+
+        C = self.grid.cols
+        for hub, field in self.fields.items():
+            if hub == cell:
+                # The hub itself flipped: nothing to repair from
+                self.fields[hub] = distance_field(self.grid, [hub]).ravel()
+            elif blocked:
+                _repair_blocked(field, free, i, C)
+            else:
+                _repair_opened(field, free, i, C)
+
+    def set_cells(self, cells: Iterable[Cell], blocked: bool) -> None:
+        for cell in cells:
+            self.set_cell(cell, blocked)
+
+
+# -----------------------
+# Shared indexes, keyed by layout hash
+# -----------------------
+_INDEXES: "OrderedDict[Tuple[int, Tuple[Cell, ...]], RoutingIndex]" = OrderedDict()
+
+
+def index_for(grid, hubs: Iterable[Cell]) -> RoutingIndex:
+    """
+    Return the RoutingIndex for this layout + hubs, building it on first use.
+    Indexes flipped with set_cell() are found again under their new layout.
+    """
+    hubs = tuple(dict.fromkeys(tuple(h) for h in hubs))
+    key = (layout_hash(grid), hubs)
+    index = _INDEXES.get(key)
+    if index is not None and index.layout_key != key[0]:
+        # Flipped with set_cell() since it was stored: file it under its
+        # current layout and build a fresh one for this layout
+        del _INDEXES[key]
+        _INDEXES[(index.layout_key, hubs)] = index
+        index = None
+    if index is None:
+        for old_key, candidate in list(_INDEXES.items()):
+            if (candidate.layout_key, tuple(candidate.hubs)) == key:
+                index = _INDEXES.pop(old_key)
+                break
+        else:
+            index = RoutingIndex(grid, hubs)
+    _INDEXES[key] = index
+    _INDEXES.move_to_end(key)
+    if len(_INDEXES) > MAX_INDEXES:
+        _INDEXES.popitem(last=False)
+    return index
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    import random
+    from day3_dsa import shortest_path_grid
+    from pathfinding import is_valid_path
+
+    print("Running routing index tests...")
+
+    grid = [
+        [0, 0, 0],
+        [1, 1, 0],
+        [0, 0, 0],
+    ]
+    index = RoutingIndex(grid, [(0, 0)])
+    assert index.distance((0, 0), (2, 2)) == shortest_path_grid(grid) == 4
+    assert index.route((0, 0), (2, 0)) == (6, [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)])
+    assert index.route((2, 0), (0, 0))[1][0] == (2, 0)
+    assert index.route((2, 0), (0, 2))[0] == 4
+    assert index_for(grid, [(0, 0)]) is index_for(grid, [(0, 0)])
+
+    shared = index_for(grid, [(0, 0)])
+    shared.set_cell((1, 0), blocked=False)
+    assert shared.distance((0, 0), (2, 0)) == 2
+    # The original layout must not get the flipped index back
+    original = index_for(grid, [(0, 0)])
+    assert original is not shared and original.distance((0, 0), (2, 0)) == 6
+    opened = [[0, 0, 0], [0, 1, 0], [0, 0, 0]]
+    assert index_for(opened, [(0, 0)]) is shared
+
+    index.set_cell((1, 0), blocked=False)
+    assert index.distance((0, 0), (2, 0)) == 2
+    assert index.layout_key == layout_hash([[0, 0, 0], [0, 1, 0], [0, 0, 0]])
+    index.set_cell((1, 0), blocked=True)
+    assert index.distance((0, 0), (2, 0)) == 6
+    assert index.layout_key == layout_hash(grid)
+
+    # Random flips: repaired fields must match a fresh BFS
+    rng = random.Random(7)
+    for _ in range(40):
+        R, C = rng.randint(2, 25), rng.randint(2, 25)
+        cells = (np.array([[rng.random() < 0.3 for _ in range(C)] for _ in range(R)])).astype(np.uint8)
+        hubs = [(rng.randrange(R), rng.randrange(C)) for _ in range(3)]
+        index = RoutingIndex(cells, hubs)
+        for _ in range(30):
+            cell = (rng.randrange(R), rng.randrange(C))
+            index.set_cell(cell, blocked=rng.random() < 0.5)
+            for hub in index.hubs:
+                expected = distance_field(index.grid, [hub]).ravel()
+                assert np.array_equal(index.fields[hub], expected), (hub, cell)
+            assert index.layout_key == layout_hash(index.grid)
+
+        for hub in index.hubs:
+            target = (rng.randrange(R), rng.randrange(C))
+            steps, path = index.route(hub, target)
+            assert steps == bidirectional_bfs(index.grid, [hub], [target])[0]
+            if steps >= 0:
+                assert len(path) == steps + 1 and is_valid_path(index.grid, path)
+
+    print("✅ All routing index tests passed!")
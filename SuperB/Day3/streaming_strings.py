@@ -0,0 +1,305 @@
+from __future__ import annotations
+import codecs
+import mmap
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+# Streaming versions of first_unique_char() / longest_unique_substring().
+#
+# The day3_dsa.py versions need the whole string (and first_unique_char
+# passes over it twice via Counter). Here input arrives in chunks and the
+# state is bounded by the alphabet, not by the input length:
+#   - FirstUniqueTracker / LongestUniqueTracker: any text, one Python step
+#     per character, answer available after every feed()
+#   - ByteFirstUnique / ByteLongestUnique: bytes only (256 symbols), each
+#     chunk is processed with NumPy instead of a Python loop
+#   - read_chunks() maps a file with mmap and yields bytes (or decoded text)
+#     chunk by chunk, so multi-GB logs are never loaded whole
+#
+# Indices are global positions in the stream: characters for text,
+# byte offsets for bytes.
+
+Chunk = Union[str, bytes]
+CHUNK_SIZE = 1 << 22  # 4 MiB
+BLOCK = 1 << 15       # NumPy work is done per 32 KiB so temporaries stay in cache
+
+
+# ============================================================
+# Text (or any symbols): O(1) per character
+# ============================================================
+class FirstUniqueTracker:
+    """
+    First non-repeating character of everything fed so far.
+
+    Candidates (seen exactly once) sit in an OrderedDict in arrival order;
+    a repeat removes its candidate, so first_index() is the head. Unlike a
+    plain dict, OrderedDict keeps finding the head O(1) after many deletes.
+
+    Time: O(1) per character and per query
+    Space: O(k) for k distinct characters
+    """
+
+    def __init__(self):
+        self._candidates: "OrderedDict[object, int]" = OrderedDict()
+        self._repeated = set()
+        self.position = 0
+
+    def feed(self, chunk: Chunk) -> None:
+        candidates, repeated = self._candidates, self._repeated
+        pos = self.position
+        for ch in chunk:
+            if ch in repeated:
+                pass
+            elif ch in candidates:
+                del candidates[ch]
+                repeated.add(ch)
+            else:
+                candidates[ch] = pos
+            pos += 1
+        self.position = pos
+
+    def first_index(self) -> int:
+        """Index of the first unique character so far, or -1."""
+        for pos in self._candidates.values():
+            return pos
+        return -1
+
+    def first_char(self) -> Optional[object]:
+        for ch in self._candidates:
+            return ch
+        return None
+
+
+class LongestUniqueTracker:
+    """
+    Longest run without repeated characters, fed in chunks.
+
+    Time: O(1) per character
+    Space: O(k) for k distinct characters
+    """
+
+    def __init__(self):
+        self._last_seen = {}
+        self._left = 0
+        self.position = 0
+        self.best = 0
+        self.best_start = 0
+
+    def feed(self, chunk: Chunk) -> None:
+        last_seen = self._last_seen
+        left, best, best_start = self._left, self.best, self.best_start
+        pos = self.position
+        for ch in chunk:
+            prev = last_seen.get(ch, -1)
+            if prev >= left:
+                left = prev + 1
+            last_seen[ch] = pos
+            if pos - left + 1 > best:
+                best, best_start = pos - left + 1, left
+            pos += 1
+        self._left, self.best, self.best_start, self.position = left, best, best_start, pos
+
+
+# ============================================================
+# Bytes: vectorized per chunk
+# ============================================================
+class ByteFirstUnique:
+    """
+    First byte that occurs exactly once, per-chunk work done by NumPy:
+    counts with bincount; first offsets are only searched for byte values
+    not seen before, which happens at most 256 times per stream.
+
+    Space: two 256-entry arrays
+    """
+
+    def __init__(self):
+        self._counts = np.zeros(256, dtype=np.int64)
+        self._first = np.full(256, -1, dtype=np.int64)
+        self.position = 0
+
+    def feed(self, chunk: bytes) -> None:
+        a = np.frombuffer(chunk, dtype=np.uint8)
+        for start in range(0, a.size, BLOCK):
+            self._feed_block(a[start:start + BLOCK])
+
+    def _feed_block(self, a: np.ndarray) -> None:
+        counts = np.bincount(a, minlength=256)
+        for value in np.flatnonzero((counts > 0) & (self._first < 0)):
+            self._first[value] = self.position + int(np.argmax(a == value))
+        self._counts += counts
+        self.position += a.size
+
+    def first_index(self) -> int:
+        once = self._first[self._counts == 1]
+        return int(once.min()) if once.size else -1
+
+
+class ByteLongestUnique:
+    """
+    Longest run of distinct bytes. For each offset i, prev[i] is the last
+    offset holding the same byte (found with a stable sort by byte value),
+    and the window start is the running max of prev + 1.
+
+    Space: O(BLOCK) temporaries, 256-entry state between chunks
+    """
+
+    def __init__(self):
+        self._last = np.full(256, -1, dtype=np.int64)
+        self._left = 0
+        self.position = 0
+        self.best = 0
+        self.best_start = 0
+
+    def feed(self, chunk: bytes) -> None:
+        a = np.frombuffer(chunk, dtype=np.uint8)
+        for start in range(0, a.size, BLOCK):
+            self._feed_block(a[start:start + BLOCK])
+
+    def _feed_block(self, a: np.ndarray) -> None:
+        n = a.size
+        base = self.position
+        order = np.argsort(a, kind="stable")
+        sa = a[order]
+        same = np.empty(n, dtype=bool)
+        same[0] = False
+        np.equal(sa[1:], sa[:-1], out=same[1:])
+
+        prev = np.empty(n, dtype=np.int64)
+        prev_sorted = self._last[sa]
+        prev_sorted[1:][same[1:]] = order[:-1][same[1:]] + base
+        prev[order] = prev_sorted
+
+        is_last = np.empty(n, dtype=bool)
+        is_last[-1] = True
+        np.logical_not(same[1:], out=is_last[:-1])
+        self._last[sa[is_last]] = order[is_last] + base
+
+        left = np.maximum.accumulate(np.maximum(prev + 1, self._left))
+        lengths = np.arange(base, base + n) - left + 1
+        k = int(lengths.argmax())
+        if lengths[k] > self.best:
+            self.best, self.best_start = int(lengths[k]), int(left[k])
+        self._left = int(left[-1])
+        self.position = base + n
+
+
+# ============================================================
+# Sources
+# ============================================================
+def read_chunks(path: str, chunk_size: int = CHUNK_SIZE, encoding: Optional[str] = None) -> Iterator[Chunk]:
+    """
+    Yield a file's contents chunk by chunk through mmap (pages are mapped
+    on demand, nothing is read up front). bytes by default; with an
+    encoding, text decoded incrementally so multi-byte characters split
+    across chunks come out whole.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with mm:
+            decoder = codecs.getincrementaldecoder(encoding)() if encoding else None
+            for start in range(0, len(mm), chunk_size):
+                chunk = mm[start:start + chunk_size]
+                yield decoder.decode(chunk) if decoder else chunk
+            if decoder:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+
+
+def _tracker(kind: str, first_chunk: Chunk):
+    binary = isinstance(first_chunk, (bytes, bytearray, memoryview))
+    if kind == "first":
+        return ByteFirstUnique() if binary else FirstUniqueTracker()
+    return ByteLongestUnique() if binary else LongestUniqueTracker()
+
+
+def first_unique_char_stream(chunks: Iterable[Chunk]) -> int:
+    """first_unique_char() over a stream of str or bytes chunks."""
+    tracker = None
+    for chunk in chunks:
+        tracker = tracker or _tracker("first", chunk)
+        tracker.feed(chunk)
+    return tracker.first_index() if tracker else -1
+
+
+def longest_unique_substring_stream(chunks: Iterable[Chunk]) -> int:
+    """longest_unique_substring() over a stream of str or bytes chunks."""
+    tracker = None
+    for chunk in chunks:
+        tracker = tracker or _tracker("longest", chunk)
+        tracker.feed(chunk)
+    return tracker.best if tracker else 0
+
+
+def first_unique_in_file(path: str, encoding: Optional[str] = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Byte offset (or character index with an encoding) of the first unique symbol, or -1."""
+    return first_unique_char_stream(read_chunks(path, chunk_size, encoding))
+
+
+def longest_unique_in_file(path: str, encoding: Optional[str] = None, chunk_size: int = CHUNK_SIZE) -> int:
+    return longest_unique_substring_stream(read_chunks(path, chunk_size, encoding))
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    from day3_dsa import first_unique_char, longest_unique_substring
+
+    print("Running streaming string tests...")
+
+    def chunked(s, size):
+        return [s[i:i + size] for i in range(0, len(s), size)]
+
+    assert first_unique_char_stream(["leet", "code"]) == 0
+    assert first_unique_char_stream(["love", "leetcode"]) == 2
+    assert first_unique_char_stream(["aa", "bb"]) == -1
+    assert first_unique_char_stream([]) == -1
+    assert longest_unique_substring_stream(["abca", "bcbb"]) == 3
+    assert longest_unique_substring_stream([b"pww", b"kew"]) == 3
+
+    # Answer is available between chunks
+    t = FirstUniqueTracker()
+    t.feed("ab")
+    assert (t.first_index(), t.first_char()) == (0, "a")
+    t.feed("a")
+    assert (t.first_index(), t.first_char()) == (1, "b")
+    t.feed("b")
+    assert t.first_index() == -1
+
+    rng = random.Random(3)
+    for _ in range(300):
+        s = "".join(rng.choice("abcdefgh") for _ in range(rng.randint(0, 60)))
+        size = rng.randint(1, 9)
+        assert first_unique_char_stream(chunked(s, size)) == first_unique_char(s)
+        assert longest_unique_substring_stream(chunked(s, size)) == longest_unique_substring(s)
+        b = s.encode()
+        assert first_unique_char_stream(chunked(b, size)) == first_unique_char(s)
+        assert longest_unique_substring_stream(chunked(b, size)) == longest_unique_substring(s)
+        t = ByteLongestUnique()
+        for c in chunked(b, size):
+            t.feed(c)
+        assert len(set(b[t.best_start:t.best_start + t.best])) == t.best
+
+    # File modes, including a multi-byte character split across chunks
+    text = "ééab" + "xyz" * 1000 + "ab"
+    with tempfile.NamedTemporaryFile("wb", delete=False) as f:
+        f.write(text.encode("utf-8"))
+    try:
+        assert first_unique_in_file(f.name, encoding="utf-8", chunk_size=3) == first_unique_char(text)
+        assert longest_unique_in_file(f.name, encoding="utf-8", chunk_size=3) == longest_unique_substring(text)
+        as_bytes = text.encode("utf-8").decode("latin-1")  # one char per byte
+        assert first_unique_in_file(f.name, chunk_size=5) == first_unique_char(as_bytes) == -1
+        assert longest_unique_in_file(f.name, chunk_size=5) == longest_unique_substring(as_bytes)
+    finally:
+        os.unlink(f.name)
+
+    print("✅ All streaming string tests passed!")
@@ -0,0 +1,298 @@
+from __future__ import annotations
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Many two-sum / k-sum-closest queries against one value list.
+#
+# two_sum() in day3_dsa.py rebuilds its `seen` dict per call, and the one in
+# prep_20.py is O(n^2) (`in numbers` on a list). SumIndex sorts the values
+# once and answers queries from the sorted array:
+#   - a batch of targets goes through a sorted table of all pair sums (built
+#     lazily when n is small enough), so each target is one binary search
+#   - otherwise each target is one vectorized complement search:
+#     searchsorted(values, target - values), O(n log n) in NumPy; a batch
+#     searches a (targets x values) grid of complements, a chunk of
+#     targets at a time. Integer values spanning a small range look the
+#     complements up in a direct table instead (O(1) each)
+#   - closest_sum(target, k) finds the k distinct values whose sum is
+#     closest to target (k=2 is the bundle-pricing case)
+#
+# Results are indices into the original list, as in day3_dsa.two_sum(),
+# with i < j.
+
+MAX_PAIRS = 5_000_000  # pair-sum table above this size is not built
+GRID_CELLS = 1 << 14   # (targets x values) complements searched at once without the table
+LOOKUP_SPAN = 1 << 20  # widest integer value range given a direct lookup table
+
+
+class SumIndex:
+    def __init__(self, values: Sequence[float], max_pairs: int = MAX_PAIRS):
+        values = np.asarray(values)
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+        self.max_pairs = max_pairs
+        self._pairs: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._lookup: Optional[tuple] = None
+
+    def __len__(self) -> int:
+        return self.sorted.size
+
+    def _original(self, p: int, q: int) -> Tuple[int, int]:
+        i, j = int(self.order[p]), int(self.order[q])
+        return (i, j) if i < j else (j, i)
+
+    # -----------------------
+    # Pair-sum table
+    # -----------------------
+    @property
+    def has_pair_table(self) -> bool:
+        n = len(self)
+        return n * (n - 1) // 2 <= self.max_pairs
+
+    def _pair_table(self):
+        """(sums, p, q) over all sorted positions p < q, ordered by sum."""
+        if self._pairs is None:
+            p, q = np.triu_indices(len(self), 1)
+            sums = self.sorted[p] + self.sorted[q]
+            by_sum = np.argsort(sums, kind="stable")
+            self._pairs = (sums[by_sum], p[by_sum].astype(np.int32), q[by_sum].astype(np.int32))
+        return self._pairs
+
+    def _lookup_table(self) -> Optional[Tuple[int, np.ndarray]]:
+        """(lowest value, table) for integer values spanning < LOOKUP_SPAN, else None."""
+        if self._lookup is None:
+            s = self.sorted
+            self._lookup = ()
+            if s.size and s.dtype.kind in "iu" and int(s[-1]) - int(s[0]) < LOOKUP_SPAN:
+                # value - s[0] -> last sorted position holding it, -1 if absent
+                last = np.append(s[1:] != s[:-1], True)
+                table = np.full(int(s[-1]) - int(s[0]) + 1, -1, dtype=np.int64)
+                table[(s[last] - s[0]).astype(np.int64)] = np.flatnonzero(last)
+                self._lookup = (int(s[0]), table)
+        return self._lookup or None
+
+    # -----------------------
+    # Two-sum
+    # -----------------------
+    def two_sum(self, target) -> Optional[Tuple[int, int]]:
+        """
+        Indices (i, j), i < j, of two values adding up to target, or None.
+
+        Time: O(n log n) vectorized (O(n) with the lookup table), no Python
+              loop over the values
+        """
+        if len(self) < 2:
+            return None
+        found, p, q = self._complements(np.asarray([target]))
+        return self._original(int(p[0]), int(q[0])) if found[0] else None
+
+    def _complements(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        For each target, the first sorted position p with a partner q > p
+        summing to it: (found, p, q), one row of the complement grid per target.
+        """
+        s = self.sorted
+        comp = targets[:, None] - s
+        # Last sorted position holding comp (-1 if none); a pair needs it
+        # after p, which also handles duplicates (value == comp needs two copies)
+        lookup = self._lookup_table() if comp.dtype.kind in "iu" else None
+        if lookup is not None:
+            lo, table = lookup
+            idx = comp - lo
+            inside = (idx >= 0) & (idx < table.size)
+            q = np.where(inside, table[np.where(inside, idx, 0)], -1)
+        else:
+            q = np.searchsorted(s, comp.ravel(), side="right").reshape(comp.shape) - 1
+            q[s[np.maximum(q, 0)] != comp] = -1
+        ok = q > np.arange(s.size)
+        p = ok.argmax(axis=1)
+        return ok[np.arange(targets.size), p], p, q[np.arange(targets.size), p]
+
+    def two_sum_many(self, targets: Sequence[float]) -> np.ndarray:
+        """
+        two_sum() for every target: (m, 2) array of indices, -1 when no pair.
+
+        Time: O(m log n^2) with the pair table, else O(m n log n) (O(m n)
+              with the lookup table) in chunks of GRID_CELLS complements
+        """
+        targets = np.asarray(targets)
+        out = np.full((targets.size, 2), -1, dtype=np.int64)
+        if len(self) < 2:
+            return out
+
+        if self.has_pair_table:
+            sums, p, q = self._pair_table()
+            pos = np.searchsorted(sums, targets)
+            pos_c = np.minimum(pos, sums.size - 1)
+            hit = sums[pos_c] == targets
+            i, j = self.order[p[pos_c[hit]]], self.order[q[pos_c[hit]]]
+            out[hit, 0] = np.minimum(i, j)
+            out[hit, 1] = np.maximum(i, j)
+            return out
+
+        step = max(1, GRID_CELLS // len(self))
+        for start in range(0, targets.size, step):
+            found, p, q = self._complements(targets[start:start + step])
+            i, j = self.order[p[found]], self.order[q[found]]
+            rows = start + np.flatnonzero(found)
+            out[rows, 0] = np.minimum(i, j)
+            out[rows, 1] = np.maximum(i, j)
+        return out
+
+    # -----------------------
+    # k-sum closest
+    # -----------------------
+    def _closest_pair_in(self, lo: int, rem) -> Tuple[Optional[float], int, int]:
+        """Closest sum of two values at sorted positions >= lo: (sum, p, q)."""
+        if len(self) - lo < 2:
+            return None, -1, -1
+        sums, p, q = self._closest_pairs(lo, np.asarray([rem]))
+        return sums[0], int(p[0]), int(q[0])
+
+    def _closest_pairs(self, lo: int, rems: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        _closest_pair_in() for every rem at once: (sums, p, q), searched on
+        a (rems x values) grid. Needs at least two values at positions >= lo.
+        """
+        s = self.sorted[lo:]
+        n = s.size
+        idx = np.arange(n)
+        rows = np.arange(rems.size)
+        # For each p, the best partner q > p sits next to rem - s[p]
+        comp = rems[:, None] - s
+        pos = np.searchsorted(s, comp.ravel()).reshape(comp.shape)
+        best_err = np.full(rems.size, np.inf)
+        best_sum = np.zeros(rems.size, dtype=s.dtype)
+        best_p = np.zeros(rems.size, dtype=np.int64)
+        best_q = np.zeros(rems.size, dtype=np.int64)
+        for cand in (pos - 1, pos):
+            cand = np.clip(cand, idx + 1, n - 1)
+            sums = s + s[cand]
+            err = np.where(cand > idx, np.abs(sums - rems[:, None]), np.inf)
+            k = err.argmin(axis=1)
+            better = err[rows, k] < best_err
+            best_err[better] = err[rows, k][better]
+            best_sum[better] = sums[rows, k][better]
+            best_p[better] = k[better]
+            best_q[better] = cand[rows, k][better]
+        return best_sum, best_p + lo, best_q + lo
+
+    def closest_sum(self, target, k: int = 2) -> Tuple[Optional[float], Tuple[int, ...]]:
+        """
+        Sum of k distinct values closest to target, and their indices.
+        (None, ()) when there are fewer than k values.
+
+        Time: O(n^(k-2) * n log n)
+        """
+        if k < 2:
+            raise ValueError("k must be >= 2")
+        best = self._closest(target, k, 0)
+        if best[0] is None:
+            return None, ()
+        total, positions = best
+        return total.item(), tuple(sorted(int(self.order[p]) for p in positions))
+
+    def _closest(self, rem, k: int, lo: int):
+        if k == 2:
+            total, p, q = self._closest_pair_in(lo, rem)
+            return (total, (p, q)) if total is not None else (None, ())
+        best = (None, ())
+        for p in range(lo, len(self) - k + 1):
+            total, rest = self._closest(rem - self.sorted[p], k - 1, p + 1)
+            if total is None:
+                continue
+            total = total + self.sorted[p]
+            if best[0] is None or abs(total - rem) < abs(best[0] - rem):
+                best = (total, (p, *rest))
+                if total == rem:
+                    break
+        return best
+
+    def closest_pair_sums(self, targets: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        closest_sum(t, 2) for every target: (sums, (m, 2) indices).
+
+        Time: O(m log n^2) with the pair table, else O(m n log n) in chunks
+              of GRID_CELLS
+        """
+        targets = np.asarray(targets)
+        if len(self) < 2:
+            raise ValueError("need at least two values")
+        if not self.has_pair_table:
+            sums = np.empty(targets.size, dtype=self.sorted.dtype)
+            pairs = np.empty((targets.size, 2), dtype=np.int64)
+            step = max(1, GRID_CELLS // len(self))
+            for start in range(0, targets.size, step):
+                stop = start + step
+                sums[start:stop], p, q = self._closest_pairs(0, targets[start:stop])
+                i, j = self.order[p], self.order[q]
+                pairs[start:stop, 0] = np.minimum(i, j)
+                pairs[start:stop, 1] = np.maximum(i, j)
+            return sums, pairs
+
+        table, p, q = self._pair_table()
+        pos = np.searchsorted(table, targets)
+        below = np.maximum(pos - 1, 0)
+        above = np.minimum(pos, table.size - 1)
+        pick = np.where(np.abs(table[below] - targets) <= np.abs(table[above] - targets), below, above)
+        i, j = self.order[p[pick]], self.order[q[pick]]
+        return table[pick], np.stack([np.minimum(i, j), np.maximum(i, j)], axis=1)
+
+
+# ============================================================
+# Quick Tests (run this file directly)
+# ============================================================
+if __name__ == "__main__":
+    import itertools
+    import random
+    from day3_dsa import two_sum
+
+    print("Running sum index tests...")
+
+    index = SumIndex([2, 7, 11, 15])
+    assert index.two_sum(9) == (0, 1)
+    assert index.two_sum(4) is None  # 2 + 2 needs two 2s
+    assert SumIndex([3, 2, 4]).two_sum(6) == (1, 2)
+    assert SumIndex([3, 3]).two_sum(6) == (0, 1)
+    assert index.two_sum_many([9, 26, 4, 100]).tolist() == [[0, 1], [2, 3], [-1, -1], [-1, -1]]
+    assert index.closest_sum(19) == (18, (1, 2))
+    assert index.closest_sum(20, k=3) == (20, (0, 1, 2))
+    assert SumIndex([5]).two_sum(10) is None and SumIndex([5]).closest_sum(5) == (None, ())
+
+    GRID_CELLS = 60  # several target chunks per batch without the pair table
+    rng = random.Random(5)
+    for _ in range(200):
+        values = [rng.randint(-20, 40) for _ in range(rng.randint(0, 25))]
+        targets = [rng.randint(-30, 80) for _ in range(20)]
+        indexes = (SumIndex(values), SumIndex(values, max_pairs=0))
+        # Lookup table and searchsorted paths of the complement search
+        for ix in indexes + (SumIndex([float(v) for v in values], max_pairs=0),):
+            batch = ix.two_sum_many(targets)
+            for t, row in zip(targets, batch.tolist()):
+                found = ix.two_sum(t)
+                assert (found is None) == (two_sum(values, t) is None) == (row == [-1, -1])
+                for i, j in filter(None, (found, None if row[0] < 0 else tuple(row))):
+                    assert i < j and values[i] + values[j] == t
+
+        if len(values) < 2:
+            continue
+        for k in (2, 3):
+            if len(values) < k or len(values) > 14:
+                continue
+            for t in targets[:5]:
+                best = min(abs(sum(c) - t) for c in itertools.combinations(values, k))
+                total, idx = indexes[0].closest_sum(t, k)
+                assert abs(total - t) == best and total == sum(values[i] for i in idx)
+        for ix in indexes:
+            sums, pairs = ix.closest_pair_sums(targets)
+            for t, s, (i, j) in zip(targets, sums.tolist(), pairs.tolist()):
+                best = min(abs(a + b - t) for a, b in itertools.combinations(values, 2))
+                assert abs(s - t) == best and values[i] + values[j] == s and i < j
+        # Batched grid search picks the same pair as one closest_sum() per target
+        no_table = indexes[1]
+        sums, pairs = no_table.closest_pair_sums(targets)
+        expected = [no_table.closest_sum(t, 2) for t in targets]
+        assert [(s, tuple(p)) for s, p in zip(sums.tolist(), pairs.tolist())] == expected
+
+    print("✅ All sum index tests passed!")
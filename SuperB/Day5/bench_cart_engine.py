@@ -0,0 +1,80 @@
+"""
+Benchmark: pricing every cart, one cart at a time vs CartEngine.
+
+Run: python bench_cart_engine.py [--carts 1000000] [--lines 3] [--products 10000] [--changed 10]
+Times pricing all carts once (a loop over carts that walk their lines,
+like ShoppingCart before its running total, vs one gather + segment
+sum), then a promotion that changes --changed product prices: a full
+re-pricing vs the incremental reprice of affected carts only.
+oop.ShoppingCart is timed too for reference: it caches its total and
+only re-sums carts holding a repriced product.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from cart_engine import CartEngine
+
+from bench_shopping_cart import ListCart
+
+with contextlib.redirect_stdout(io.StringIO()):  # oop.py prints on import
+    from oop import Product, ShoppingCart
+
+
+def timed(label, fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<36} {time.perf_counter() - t0:8.3f}s")
+    return result
+
+
+def build_oop(cart_ids, product_idx, qty, prices, n_carts, cart_class):
+    products = [Product(f"p{i}", p) for i, p in enumerate(prices.tolist())]
+    carts = [cart_class() for _ in range(n_carts)]
+    for c, p, q in zip(cart_ids.tolist(), product_idx.tolist(), qty.tolist()):
+        carts[c].add_product(products[p], q)
+    return products, carts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carts", type=int, default=1_000_000)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--changed", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n_lines = args.carts * args.lines
+    cart_ids = np.repeat(np.arange(args.carts), args.lines)
+    product_idx = rng.integers(0, args.products, n_lines)
+    qty = rng.integers(1, 6, n_lines)
+    prices = rng.integers(10, 20_000, args.products).astype(np.float64)
+    print(f"carts={args.carts:,}  lines={n_lines:,}  products={args.products:,}")
+
+    products, carts = build_oop(cart_ids, product_idx, qty, prices, args.carts, ListCart)
+    cached_products, cached = build_oop(cart_ids, product_idx, qty, prices, args.carts, ShoppingCart)
+    expected = timed("list carts: total_cost() per cart", lambda: [c.total_cost() for c in carts])
+    assert np.allclose(timed("ShoppingCart (cached): total_cost()", lambda: [c.total_cost() for c in cached]),
+                       expected)
+    engine = timed("CartEngine: build + price all", CartEngine, cart_ids, product_idx, qty, prices)
+    assert np.allclose(engine.subtotals, expected)
+    timed("CartEngine.reprice_all", engine.reprice_all)
+
+    changed = rng.choice(args.products, args.changed, replace=False)
+    new_prices = prices[changed] * 0.8
+    print(f"\npromotion: {args.changed} products -20%")
+
+    def reprice(products, carts):
+        for p, price in zip(changed.tolist(), new_prices.tolist()):
+            products[p].price = price
+        return [c.total_cost() for c in carts]
+
+    expected = timed("list carts: reprice every cart", reprice, products, carts)
+    assert np.allclose(timed("ShoppingCart (cached): reprice", reprice, cached_products, cached), expected)
+    touched = timed("CartEngine.set_prices (incremental)", engine.set_prices, changed, new_prices)
+    print(f"{'':<36} {touched.size:,} carts repriced")
+    assert np.allclose(engine.subtotals, expected)
@@ -0,0 +1,39 @@
+"""
+Benchmark: lock strategies for concurrent checkouts (checkout_sim).
+
+Run: python bench_checkout_sim.py [--users 5000] [--products 500] [--latency 0.0002]
+                                  [--workers 64] [--concurrency 1000] [--stripes 16]
+Every strategy runs with both drivers on the same users and a fresh
+store. --latency is the simulated store write, spent holding the locks.
+"""
+import argparse
+
+from checkout_sim import STRATEGIES, StockStore, make_shop, run_asyncio, run_threads
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--stock", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0002)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--stripes", type=int, default=16)
+    args = parser.parse_args()
+
+    stock, users = make_shop(args.users, args.products, args.lines, args.stock)
+    print(f"users={args.users:,}  products={args.products}  lines={args.lines}  "
+          f"latency={args.latency * 1e3:g}ms  workers={args.workers}  concurrency={args.concurrency}")
+    print(f"{'driver':<8} {'strategy':<12} {'checkouts/s':>12} {'accepted':>9} {'rejected':>9} "
+          f"{'contended':>10} {'wait/checkout':>14}")
+    for driver in ("threads", "asyncio"):
+        for strategy in STRATEGIES:
+            store = StockStore(stock, strategy, stripes=args.stripes)
+            if driver == "threads":
+                m = run_threads(users, store, args.workers, args.latency)
+            else:
+                m = run_asyncio(users, store, args.concurrency, args.latency)
+            assert all(s >= 0 for s in store.stock) and m.checkouts == len(users)
+            print(f"{driver:<8} {strategy:<12} {m.throughput:12,.0f} {m.accepted:9,} {m.rejected:9,} "
+                  f"{m.contention:10.1%} {m.wait_time / m.checkouts * 1e3:12.3f}ms")
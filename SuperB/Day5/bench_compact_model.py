@@ -0,0 +1,89 @@
+"""
+Benchmark: Day5/oop.py classes vs compact_model, memory and speed.
+
+Run: python bench_compact_model.py [--carts 1000000] [--lines 3] [--products 1000]
+Builds the same carts with both models, then totals every cart.
+Memory is what tracemalloc sees still allocated after building (the
+catalog/product objects included), measured in a separate run from the
+timings since tracing slows allocation down.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import random
+import time
+import tracemalloc
+
+from compact_model import Catalog, CompactCart
+
+with contextlib.redirect_stdout(io.StringIO()):  # oop.py prints on import
+    from oop import Product, ShoppingCart
+
+
+def make_orders(carts, lines, products, seed=0):
+    rng = random.Random(seed)
+    return [[(rng.randrange(products), rng.randint(1, 5)) for _ in range(lines)] for _ in range(carts)]
+
+
+def build_oop(orders, prices):
+    catalog = [Product(f"p{i}", p) for i, p in enumerate(prices)]
+    carts = []
+    for lines in orders:
+        cart = ShoppingCart()
+        for idx, qty in lines:
+            cart.add_product(catalog[idx], qty)
+        carts.append(cart)
+    return carts
+
+
+def build_compact(orders, prices):
+    catalog = Catalog()
+    for i, p in enumerate(prices):
+        catalog.add(f"p{i}", p)
+    carts = []
+    for lines in orders:
+        cart = CompactCart(catalog)
+        for idx, qty in lines:
+            cart.add_product(idx, qty)
+        carts.append(cart)
+    return carts
+
+
+def measure(build, orders, prices):
+    gc.collect()
+    t0 = time.perf_counter()
+    carts = build(orders, prices)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    totals = [cart.total_cost() for cart in carts]
+    t_total = time.perf_counter() - t0
+    del carts
+    gc.collect()
+
+    tracemalloc.start()
+    carts = build(orders, prices)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del carts
+    return t_build, t_total, size, totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carts", type=int, default=1_000_000)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    prices = [rng.randint(10, 20_000) for _ in range(args.products)]
+    orders = make_orders(args.carts, args.lines, args.products)
+    print(f"carts={args.carts:,}  lines/cart={args.lines}  products={args.products:,}")
+    print(f"{'model':<14} {'build':>8} {'total all':>10} {'memory':>10} {'bytes/cart':>11}")
+    results = {}
+    for label, build in (("oop", build_oop), ("compact", build_compact)):
+        t_build, t_total, size, totals = measure(build, orders, prices)
+        results[label] = totals
+        print(f"{label:<14} {t_build:7.2f}s {t_total:9.3f}s {size / 2**20:8.1f}MB {size / args.carts:11.0f}")
+    assert results["oop"] == results["compact"]
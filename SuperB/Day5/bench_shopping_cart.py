@@ -0,0 +1,65 @@
+"""
+Benchmark: ShoppingCart before/after merging lines by product.
+
+Run: python bench_shopping_cart.py [--adds 200000] [--products 100] [--total-every 1000]
+One cart gets --adds add_product() calls over --products products, with
+total_cost() every --total-every adds. The old cart appends a line per
+add and walks all of them for every total; the new one keeps one line
+per product and a running total.
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+with contextlib.redirect_stdout(io.StringIO()):  # oop.py prints on import
+    from oop import CartItem, Product, ShoppingCart
+
+
+class ListCart:  # ShoppingCart before the product index
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def add_product(self, product, quantity):
+        self.items.append(CartItem(product, quantity))
+
+    def total_cost(self):
+        total = 0
+        for item in self.items:
+            total += item.total_price()
+        return total
+
+
+def run(cart, adds, total_every):
+    totals = []
+    for i, (product, qty) in enumerate(adds, 1):
+        cart.add_product(product, qty)
+        if i % total_every == 0:
+            totals.append(cart.total_cost())
+    return cart, totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--adds", type=int, default=200_000)
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--total-every", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    products = [Product(f"p{i}", rng.randint(10, 20_000)) for i in range(args.products)]
+    adds = [(rng.choice(products), rng.randint(1, 5)) for _ in range(args.adds)]
+    print(f"adds={args.adds:,}  products={args.products}  total every {args.total_every:,} adds")
+
+    results = {}
+    for label, cart in (("list cart (old)", ListCart()), ("indexed cart", ShoppingCart())):
+        t0 = time.perf_counter()
+        cart, totals = run(cart, adds, args.total_every)
+        elapsed = time.perf_counter() - t0
+        results[label] = totals
+        print(f"{label:<18} {elapsed:7.3f}s  {len(cart):>8,} lines")
+    assert results["list cart (old)"] == results["indexed cart"]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from compact_model import Catalog, CompactCart
+
+# Columnar pricing for many carts at once (ShoppingCart.total_cost() for
+# every cart, without a Python loop per cart or per line).
+#
+# All cart lines live in three arrays:
+#   cart_ids    = [0, 0, 1, 2, 2]
+#   product_idx = [4, 7, 4, 1, 9]
+#   qty         = [1, 2, 5, 1, 1]
+# and a cart's total is a gather + segment sum:
+#   subtotal[c] = sum(prices[product_idx] * qty over lines of c)
+# done with np.bincount(cart_ids, weights=...). Tax works like the
+# Product.tax_rate class variable in corey_repeat.py: one rate for every
+# product, optionally overridden per product.
+#
+# Price (or tax rate) changes only reprice the carts that contain a changed
+# product: lines are indexed by product and by cart (CSR, as in
+# Day3/day3_batch.py), and the affected carts are summed again from their
+# lines, so totals never drift the way repeated +=/- deltas would.
+
+TAX_RATE = 0.15  # corey_repeat.Product.tax_rate
+
+ArrayLike = Union[Sequence, np.ndarray]
+
+
+def _csr(keys: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(order, offsets): order[offsets[k]:offsets[k+1]] are the positions with key k."""
+    order = np.argsort(keys, kind="stable")
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=offsets[1:])
+    return order, offsets
+
+
+def _gather(order: np.ndarray, offsets: np.ndarray, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions for all `keys`, plus which entry of `keys` each one belongs to."""
+    starts = offsets[keys]
+    lengths = offsets[keys + 1] - starts
+    group = np.repeat(np.arange(keys.size, dtype=np.int64), lengths)
+    first = np.cumsum(lengths) - lengths
+    pos = np.arange(int(lengths.sum()), dtype=np.int64) - first[group] + starts[group]
+    return order[pos], group
+
+
+class CartEngine:
+    """
+    Totals for every cart, kept up to date under price/tax changes.
+
+    Time: O(lines) to build and price everything; a reprice costs
+          O(lines of the affected carts)
+    Space: O(lines + carts + products)
+    """
+
+    def __init__(self, cart_ids: ArrayLike, product_idx: ArrayLike, qty: ArrayLike,
+                 prices: ArrayLike, tax_rate: float = TAX_RATE,
+                 tax_rates: Optional[ArrayLike] = None, n_carts: Optional[int] = None):
+        self.cart_ids = np.asarray(cart_ids, dtype=np.int64)
+        self.product_idx = np.asarray(product_idx, dtype=np.int64)
+        self.qty = np.asarray(qty, dtype=np.int64)
+        if not self.cart_ids.shape == self.product_idx.shape == self.qty.shape:
+            raise ValueError("cart_ids, product_idx and qty must have the same length")
+        self.prices = np.array(prices, dtype=np.float64)
+        n_products = self.prices.size
+        if self.product_idx.size and not 0 <= self.product_idx.min() <= self.product_idx.max() < n_products:
+            raise IndexError("product index out of range")
+        self.tax_rates = (np.full(n_products, tax_rate, dtype=np.float64) if tax_rates is None
+                          else np.array(tax_rates, dtype=np.float64))
+        if self.tax_rates.size != n_products:
+            raise ValueError("tax_rates needs one rate per product")
+        if n_carts is None:
+            n_carts = int(self.cart_ids.max()) + 1 if self.cart_ids.size else 0
+        self.n_carts = n_carts
+
+        self._by_product = _csr(self.product_idx, n_products)
+        self._by_cart = _csr(self.cart_ids, n_carts)
+        self.reprice_all()
+
+    @classmethod
+    def from_compact_carts(cls, carts: Sequence[CompactCart], catalog: Optional[Catalog] = None,
+                           **kwargs) -> "CartEngine":
+        """Lines of compact_model carts (all from one Catalog); cart i keeps id i."""
+        if catalog is None:
+            catalog = carts[0].catalog if carts else Catalog()
+        lengths = np.fromiter((len(c) for c in carts), dtype=np.int64, count=len(carts))
+        lines = np.fromiter((v for c in carts for v in c.lines), dtype=np.int64, count=2 * int(lengths.sum()))
+        cart_ids = np.repeat(np.arange(len(carts), dtype=np.int64), lengths)
+        return cls(cart_ids, lines[0::2], lines[1::2], catalog.prices, n_carts=len(carts), **kwargs)
+
+    def _price(self, groups: np.ndarray, lines: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Segment sums of line amounts and line taxes, grouped by `groups`."""
+        products = self.product_idx[lines]
+        amounts = self.prices[products] * self.qty[lines]
+        subtotals = np.bincount(groups, weights=amounts, minlength=n)
+        taxes = np.bincount(groups, weights=amounts * self.tax_rates[products], minlength=n)
+        return subtotals, taxes
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self.subtotals + self.taxes
+
+    def cart_total(self, cart_id: int, with_tax: bool = True) -> float:
+        total = self.subtotals[cart_id]
+        return float(total + self.taxes[cart_id] if with_tax else total)
+
+    # -----------------------
+    # Incremental repricing
+    # -----------------------
+    def carts_with(self, products: Iterable[int]) -> np.ndarray:
+        """Sorted ids of the carts that contain any of `products`."""
+        products = np.unique(np.asarray(list(products), dtype=np.int64))
+        lines, _ = _gather(*self._by_product, products)
+        return np.unique(self.cart_ids[lines])
+
+    def _reprice(self, products: np.ndarray) -> np.ndarray:
+        carts = self.carts_with(products)
+        lines, group = _gather(*self._by_cart, carts)
+        self.subtotals[carts], self.taxes[carts] = self._price(group, lines, carts.size)
+        return carts
+
+    def set_prices(self, products: ArrayLike, prices: ArrayLike) -> np.ndarray:
+        """Change product prices; returns the ids of the carts that were repriced."""
+        products = np.asarray(products, dtype=np.int64)
+        self.prices[products] = prices
+        return self._reprice(products)
+
+    def set_tax_rates(self, products: ArrayLike, rates: ArrayLike) -> np.ndarray:
+        """Per-product tax overrides; returns the ids of the carts that were repriced."""
+        products = np.asarray(products, dtype=np.int64)
+        self.tax_rates[products] = rates
+        return self._reprice(products)
+
+    def set_tax_rate(self, rate: float) -> None:
+        """One rate for every product (like assigning Product.tax_rate); reprices all carts."""
+        self.tax_rates[:] = rate
+        self.reprice_all()
+
+    def reprice_all(self) -> None:
+        self.subtotals, self.taxes = self._price(self.cart_ids, np.arange(self.cart_ids.size), self.n_carts)
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+
+    print("Running cart engine tests...")
+
+    engine = CartEngine([0, 0, 1, 2, 2], [4, 7, 4, 1, 9], [1, 2, 5, 1, 1],
+                        prices=np.arange(10) * 10.0, tax_rate=0.0, n_carts=4)
+    assert engine.totals.tolist() == [180.0, 200.0, 100.0, 0.0]
+    assert engine.carts_with([4]).tolist() == [0, 1]
+    assert engine.set_prices([4], [1.0]).tolist() == [0, 1]
+    assert engine.totals.tolist() == [141.0, 5.0, 100.0, 0.0]
+    assert engine.set_tax_rates([9], [0.5]).tolist() == [2]
+    assert engine.cart_total(2) == 145.0 and engine.cart_total(2, with_tax=False) == 100.0
+    engine.set_tax_rate(0.15)
+    assert abs(engine.cart_total(1) - 5.75) < 1e-9
+
+    def reference(carts, prices, rates):
+        return [sum(prices[p] * q * (1 + rates[p]) for p, q in zip(c.products, c.quantities)) for c in carts]
+
+    rng = random.Random(0)
+    for _ in range(30):
+        catalog = Catalog()
+        for i in range(rng.randint(1, 40)):
+            catalog.add(f"p{i}", round(rng.uniform(1, 100), 2))
+        carts = []
+        for _ in range(rng.randint(0, 60)):
+            cart = CompactCart(catalog)
+            for _ in range(rng.randint(0, 6)):
+                cart.add_product(rng.randrange(len(catalog)), rng.randint(1, 4))
+            carts.append(cart)
+        engine = CartEngine.from_compact_carts(carts, catalog)
+        assert np.allclose(engine.subtotals, [c.total_cost() for c in carts])
+
+        prices, rates = list(catalog.prices), [TAX_RATE] * len(catalog)
+        for _ in range(10):
+            changed = rng.sample(range(len(catalog)), rng.randint(1, min(3, len(catalog))))
+            new = [round(rng.uniform(1, 100), 2) for _ in changed]
+            if rng.random() < 0.3:
+                engine.set_tax_rates(changed, [0.0] * len(changed))
+                for p in changed:
+                    rates[p] = 0.0
+            else:
+                touched = set(engine.set_prices(changed, new).tolist())
+                assert touched == {i for i, c in enumerate(carts) if set(c.products) & set(changed)}
+                for p, price in zip(changed, new):
+                    prices[p] = price
+            assert np.allclose(engine.totals, reference(carts, prices, rates))
+
+    empty = CartEngine.from_compact_carts([])
+    assert empty.totals.size == 0
+
+    print("✅ All cart engine tests passed!")
@@ -0,0 +1,263 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+with contextlib.redirect_stdout(io.StringIO()):  # oop.py prints on import
+    from oop import Product, User
+
+# Concurrent checkout simulation for the Day5 shop model.
+#
+# Many User objects check out at once against one shared StockStore. A
+# checkout takes every line of the user's cart or nothing: it locks the
+# stock of all products in the cart, checks that each line fits, then
+# takes the quantities. Locks are always acquired in lock-index order, so
+# two carts with the same products can never deadlock.
+#
+# Lock strategies (what a lock protects):
+#   "global"       one lock for the whole store
+#   "per_product"  one lock per product (finest)
+#   "striped"      `stripes` locks, product i uses lock i % stripes
+#
+# Drivers: run_threads() (thread pool, time.sleep as the store latency)
+# and run_asyncio() (one task per user, asyncio.sleep as the latency).
+# The latency is spent while the locks are held, as a write to a real
+# stock API would be, which is where the strategies differ.
+#
+# Metrics: throughput, accepted/rejected checkouts, and contention (lock
+# acquisitions that had to wait, and the total time spent waiting).
+
+STRATEGIES = ("global", "per_product", "striped")
+
+Lines = List[Tuple[int, int]]  # (product index, quantity)
+
+
+@dataclass
+class Metrics:
+    driver: str
+    strategy: str
+    checkouts: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    acquisitions: int = 0
+    contended: int = 0
+    wait_time: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Checkouts per second."""
+        return self.checkouts / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def contention(self) -> float:
+        """Share of lock acquisitions that had to wait."""
+        return self.contended / self.acquisitions if self.acquisitions else 0.0
+
+    def add(self, ok: bool, acquisitions: int, contended: int, waited: float) -> None:
+        self.checkouts += 1
+        self.accepted += ok
+        self.rejected += not ok
+        self.acquisitions += acquisitions
+        self.contended += contended
+        self.wait_time += waited
+
+
+class StockStore:
+    """
+    Shared stock per Product, guarded by the chosen lock strategy.
+    Products are numbered in the order given; carts are reserved by index.
+    """
+
+    def __init__(self, stock: Dict[Product, int], strategy: str = "per_product", stripes: int = 16):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        self.products = list(stock)
+        self.index = {p: i for i, p in enumerate(self.products)}
+        self.stock = list(stock.values())
+        self.initial = list(self.stock)
+        self.strategy = strategy
+        if strategy == "global":
+            self.n_locks = 1
+        elif strategy == "striped":
+            self.n_locks = max(1, min(stripes, len(self.products)))
+        else:
+            self.n_locks = len(self.products)
+        self._locks = [threading.Lock() for _ in range(self.n_locks)]
+        self._async_locks: List[asyncio.Lock] = []
+
+    def lines_of(self, user: User) -> Lines:
+        return [(self.index[item.product], item.quantity) for item in user.cart.items]
+
+    def _lock_ids(self, lines: Lines) -> List[int]:
+        if self.n_locks == 1:
+            return [0]
+        return sorted({idx % self.n_locks for idx, _ in lines})
+
+    def _take(self, lines: Lines) -> bool:
+        """All or nothing; the caller holds the locks of every line."""
+        stock = self.stock
+        if any(stock[idx] < qty for idx, qty in lines):
+            return False
+        for idx, qty in lines:
+            stock[idx] -= qty
+        return True
+
+    def reserve(self, lines: Lines, latency: float = 0.0) -> Tuple[bool, int, int, float]:
+        """(accepted, locks taken, locks that had to wait, seconds waited)."""
+        held = []
+        contended = 0
+        waited = 0.0
+        try:
+            for lock_id in self._lock_ids(lines):
+                lock = self._locks[lock_id]
+                if not lock.acquire(blocking=False):
+                    contended += 1
+                    t0 = time.perf_counter()
+                    lock.acquire()
+                    waited += time.perf_counter() - t0
+                held.append(lock)
+            ok = self._take(lines)
+            if latency:
+                time.sleep(latency)
+            return ok, len(held), contended, waited
+        finally:
+            for lock in reversed(held):
+                lock.release()
+
+    async def reserve_async(self, lines: Lines, latency: float = 0.0) -> Tuple[bool, int, int, float]:
+        if not self._async_locks:  # asyncio locks belong to the running loop
+            self._async_locks = [asyncio.Lock() for _ in range(self.n_locks)]
+        held = []
+        contended = 0
+        waited = 0.0
+        try:
+            for lock_id in self._lock_ids(lines):
+                lock = self._async_locks[lock_id]
+                if lock.locked():
+                    contended += 1
+                    t0 = time.perf_counter()
+                    await lock.acquire()
+                    waited += time.perf_counter() - t0
+                else:
+                    await lock.acquire()
+                held.append(lock)
+            ok = self._take(lines)
+            await asyncio.sleep(latency)
+            return ok, len(held), contended, waited
+        finally:
+            for lock in reversed(held):
+                lock.release()
+
+    def sold(self) -> List[int]:
+        return [a - b for a, b in zip(self.initial, self.stock)]
+
+
+# -----------------------
+# Drivers
+# -----------------------
+def run_threads(users: Sequence[User], store: StockStore, workers: int = 32, latency: float = 0.0) -> Metrics:
+    metrics = Metrics("threads", store.strategy)
+    merge = threading.Lock()
+
+    def checkout(user: User) -> bool:
+        ok, taken, contended, waited = store.reserve(store.lines_of(user), latency)
+        with merge:
+            metrics.add(ok, taken, contended, waited)
+        return ok
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(checkout, users))
+    metrics.elapsed = time.perf_counter() - t0
+    return metrics
+
+
+def run_asyncio(users: Sequence[User], store: StockStore, concurrency: int = 1000, latency: float = 0.0) -> Metrics:
+    metrics = Metrics("asyncio", store.strategy)
+
+    async def main():
+        store._async_locks = []
+        gate = asyncio.Semaphore(concurrency)
+
+        async def checkout(user: User):
+            async with gate:
+                ok, taken, contended, waited = await store.reserve_async(store.lines_of(user), latency)
+            metrics.add(ok, taken, contended, waited)  # single thread: no lock needed
+
+        await asyncio.gather(*(checkout(u) for u in users))
+
+    t0 = time.perf_counter()
+    asyncio.run(main())
+    metrics.elapsed = time.perf_counter() - t0
+    return metrics
+
+
+def make_shop(n_users: int, n_products: int, lines: int = 3, stock: int = 50,
+              seed: int = 0) -> Tuple[Dict[Product, int], List[User]]:
+    """Products with `stock` units each, and users with `lines` random cart lines."""
+    rng = random.Random(seed)
+    products = [Product(f"p{i}", rng.randint(10, 20_000)) for i in range(n_products)]
+    users = []
+    for u in range(n_users):
+        user = User(f"user{u}")
+        for product in rng.sample(products, min(lines, n_products)):
+            user.add_to_cart(product, rng.randint(1, 3))
+        users.append(user)
+    return {p: stock for p in products}, users
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    print("Running checkout simulator tests...")
+
+    stock, users = make_shop(400, 12, lines=3, stock=40, seed=1)
+    for strategy in STRATEGIES:
+        for run in (lambda s: run_threads(users, s, workers=16, latency=0.0002),
+                    lambda s: run_asyncio(users, s, concurrency=64, latency=0.0002)):
+            store = StockStore(stock, strategy, stripes=4)
+            metrics = run(store)
+            assert metrics.checkouts == len(users) == metrics.accepted + metrics.rejected
+            # Stock is scarce: some carts are turned away, nothing is oversold
+            assert metrics.rejected > 0 and metrics.accepted > 0
+            assert all(s >= 0 for s in store.stock)
+
+    # Exact accounting: every accepted cart is in `sold`, nothing else is
+    stock, users = make_shop(300, 8, lines=2, stock=30, seed=2)
+    store = StockStore(stock, "per_product")
+    results = []
+    lock = threading.Lock()
+
+    def checkout(user):
+        ok = store.reserve(store.lines_of(user))[0]
+        with lock:
+            results.append((user, ok))
+
+    with ThreadPoolExecutor(16) as pool:
+        list(pool.map(checkout, users))
+    sold = [0] * len(store.products)
+    for user, ok in results:
+        if ok:
+            for idx, qty in store.lines_of(user):
+                sold[idx] += qty
+    assert sold == store.sold()
+
+    # Plenty of stock: everyone checks out
+    stock, users = make_shop(200, 50, stock=10_000, seed=3)
+    m = run_threads(users, StockStore(stock, "global"), workers=8)
+    assert m.accepted == 200 and m.acquisitions == 200
+
+    try:
+        StockStore(stock, "optimistic")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown strategy must be rejected")
+
+    print("✅ All checkout simulator tests passed!")
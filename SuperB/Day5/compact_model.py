@@ -0,0 +1,174 @@
+from __future__ import annotations
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+# Memory-lean version of the Day5/oop.py shop model, for simulations that
+# keep millions of carts alive.
+#
+# oop.py gives every Product, CartItem and cart its own __dict__, and a cart
+# is a list of CartItem objects that total_cost() walks with a method call
+# per item. Here:
+#   - Product, CartItem and User use __slots__ (no per-instance dict)
+#   - a Catalog numbers the products and keeps their prices in one
+#     array('d'); carts refer to products by index
+#   - a CompactCart is one flat array of (product index, quantity) pairs
+#     plus a running total updated on every add, so total_cost() is O(1)
+# Prices are read when a product is added; later catalog price changes do
+# not reprice existing carts (see the columnar engine for bulk repricing).
+
+
+class Product:
+    __slots__ = ("name", "price")
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+    def __str__(self):
+        return f"{self.name} - R{self.price}"
+
+
+class CartItem:
+    __slots__ = ("product", "quantity")
+
+    def __init__(self, product, quantity):
+        self.product = product
+        self.quantity = quantity
+
+    def total_price(self):
+        return self.product.price * self.quantity
+
+
+class Catalog:
+    """Products by index; prices in a flat array('d')."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.prices = array("d")
+        self._index = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, price: float) -> int:
+        """Register a product (or update its price) and return its index."""
+        idx = self._index.get(name)
+        if idx is None:
+            idx = self._index[name] = len(self.names)
+            self.names.append(name)
+            self.prices.append(price)
+        else:
+            self.prices[idx] = price
+        return idx
+
+    def index_of(self, product: Union[int, str, Product]) -> int:
+        if isinstance(product, int):
+            if not 0 <= product < len(self.names):
+                raise IndexError(f"no product {product}")
+            return product
+        name = product if isinstance(product, str) else product.name
+        if isinstance(product, Product) and name not in self._index:
+            return self.add(name, product.price)
+        return self._index[name]
+
+    def product(self, idx: int) -> Product:
+        return Product(self.names[idx], self.prices[idx])
+
+
+class CompactCart:
+    """
+    Cart lines in one array('i'): index0, qty0, index1, qty1, ...
+    (one array instead of two saves an object per cart).
+
+    Time: add_product O(1) amortized, total_cost O(1)
+    Space: 8 bytes per line + one small object
+    """
+
+    __slots__ = ("catalog", "lines", "total")
+
+    def __init__(self, catalog: Catalog):
+        self.catalog = catalog
+        self.lines = array("i")
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.lines) // 2
+
+    @property
+    def products(self) -> array:
+        return self.lines[0::2]
+
+    @property
+    def quantities(self) -> array:
+        return self.lines[1::2]
+
+    def add_product(self, product: Union[int, str, Product], quantity: int) -> None:
+        idx = self.catalog.index_of(product)
+        self.lines.extend((idx, quantity))
+        self.total += self.catalog.prices[idx] * quantity
+
+    def total_cost(self) -> float:
+        return self.total
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        names = self.catalog.names
+        for idx, qty in zip(self.products, self.quantities):
+            yield names[idx], qty
+
+    def show_cart(self):
+        for name, qty in self.items():
+            print(f"{name} x{qty}")
+
+
+class User:
+    __slots__ = ("username", "cart")
+
+    def __init__(self, username, catalog: Catalog):
+        self.username = username
+        self.cart = CompactCart(catalog)
+
+    def add_to_cart(self, product, quantity):
+        self.cart.add_product(product, quantity)
+
+    def checkout(self):
+        total = self.cart.total_cost()
+        print(f"{self.username} checked out. Total: R{total:g}")
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+
+    print("Running compact model tests...")
+
+    catalog = Catalog()
+    user = User("Collin", catalog)
+    user.add_to_cart(Product("Laptop", 15000), 1)
+    user.add_to_cart(Product("Keyboard", 800), 1)
+    assert user.cart.total_cost() == 15800
+    assert list(user.cart.items()) == [("Laptop", 1), ("Keyboard", 1)]
+    assert catalog.index_of("Keyboard") == 1 and str(catalog.product(0)) == "Laptop - R15000.0"
+    assert not hasattr(user.cart, "__dict__") and not hasattr(Product("x", 1), "__dict__")
+
+    rng = random.Random(0)
+    prices = [round(rng.uniform(1, 500), 2) for _ in range(50)]
+    for i, p in enumerate(prices):
+        assert catalog.add(f"p{i}", p) == i + 2
+    for _ in range(200):
+        cart = CompactCart(catalog)
+        expected = 0.0
+        for _ in range(rng.randint(0, 20)):
+            idx, qty = rng.randrange(2, len(catalog)), rng.randint(1, 5)
+            cart.add_product(idx, qty)
+            expected += catalog.prices[idx] * qty
+        assert abs(cart.total_cost() - expected) < 1e-6
+        assert len(cart) == len(list(cart.items())) == len(cart.products) == len(cart.quantities)
+
+    try:
+        CompactCart(catalog).add_product(len(catalog), 1)
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("unknown product index must be rejected")
+
+    print("✅ All compact model tests passed!")
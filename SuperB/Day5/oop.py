@@ -1,18 +1,33 @@
+from collections import namedtuple
+import weakref
+
+
 class Product:
     def __init__(self, name, price):
         self.name = name
-        self.price = price
+        self._price = price
+        # Carts holding this product; a price change marks only their totals stale
+        self._carts = weakref.WeakSet()
+
+    @property
+    def price(self):
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        self._price = value
+        for cart in self._carts:
+            cart._stale = True
     
     def __str__(self):
         return f"{self.name} - R{self.price}"
     
 
 
-class CartItem:
-    def __init__(self, product, quantity):
-        self.product = product
-        self.quantity = quantity
-    
+# Immutable: change quantities through the cart, which keeps its total in step
+class CartItem(namedtuple("CartItem", "product quantity")):
+    __slots__ = ()
+
     def total_price(self):
         return self.product.price * self.quantity
 
@@ -23,23 +38,87 @@ class CartItem:
 
 
 
+# The cart keeps one quantity per product in a dict (insertion order is the
+# display order), so adding a product again merges the quantity instead of
+# adding a line, and update/remove are O(1). The total is kept as a running
+# sum on every change; it is only recomputed after the price of a product
+# in this cart changed.
 class ShoppingCart:
     def __init__(self):
-        self.items = []
+        self._items = {}  # product -> quantity
+        self._total = 0
+        self._stale = False
+
+    @property
+    def items(self):
+        """A snapshot of the lines as immutable CartItems."""
+        return tuple(CartItem(p, q) for p, q in self._items.items())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, product):
+        return product in self._items
+
+    def quantity_of(self, product):
+        return self._items.get(product, 0)
 
     def add_product(self, product, quantity):
-        item = CartItem(product, quantity)
-        self.items.append(item)
+        if quantity < 1:
+            raise ValueError("quantity must be >= 1 (use update_quantity/remove_product to lower it)")
+        held = self._items.get(product)
+        if held is None:
+            product._carts.add(self)
+            held = 0
+        self._items[product] = held + quantity
+        self._total += product.price * quantity
+
+    def update_quantity(self, product, quantity):
+        """Set a product's quantity; 0 or less removes it."""
+        if quantity <= 0:
+            self.remove_product(product)
+            return
+        held = self._items.get(product)
+        if held is None:
+            self.add_product(product, quantity)
+            return
+        self._total += product.price * (quantity - held)
+        self._items[product] = quantity
+
+    def remove_product(self, product):
+        """Remove a product's line; does nothing if it is not in the cart."""
+        held = self._items.pop(product, None)
+        if held is not None:
+            product._carts.discard(self)
+            self._total -= product.price * held
+            if not self._items:
+                self._total = 0  # drop any float rounding left over
+
+    def add_products(self, pairs):
+        """Add many (product, quantity) pairs; each quantity must be >= 1."""
+        for product, quantity in pairs:
+            self.add_product(product, quantity)
+
+    def remove_products(self, products):
+        for product in products:
+            self.remove_product(product)
+
+    def clear(self):
+        for product in self._items:
+            product._carts.discard(self)
+        self._items.clear()
+        self._total = 0
+        self._stale = False
 
     def total_cost(self):
-        total = 0
-        for item in self.items:
-            total += item.total_price()
-        return total
+        if self._stale:
+            self._total = sum(p.price * q for p, q in self._items.items())
+            self._stale = False
+        return self._total
     
     def show_cart(self):
-        for item in self.items:
-            print(f"{item.product.name} x{item.quantity}")
+        for product, quantity in self._items.items():
+            print(f"{product.name} x{quantity}")
 
 class User:
     def __init__(self, username):
@@ -65,3 +144,83 @@ user.cart.show_cart()
 
 user.checkout()
 
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+
+    print("Running shopping cart tests...")
+
+    cart = ShoppingCart()
+    mouse = Product("Mouse", 250)
+    for _ in range(1000):
+        cart.add_product(mouse, 1)
+    assert len(cart) == 1 and cart.quantity_of(mouse) == 1000 and cart.total_cost() == 250_000
+
+    for bad in (0, -3):
+        try:
+            cart.add_product(mouse, bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("add_product needs a positive quantity")
+    assert cart.quantity_of(mouse) == 1000 and cart.total_cost() == 250_000
+
+    cart.add_products([(laptop, 2), (keyboard, 1), (laptop, 1)])
+    assert [(i.product.name, i.quantity) for i in cart.items] == [("Mouse", 1000), ("Laptop", 3), ("Keyboard", 1)]
+    cart.update_quantity(mouse, 2)
+    assert cart.total_cost() == 2 * 250 + 3 * 15000 + 800
+    cart.update_quantity(keyboard, 0)
+    cart.remove_products([laptop, keyboard])
+    assert keyboard not in cart and cart.total_cost() == 500
+
+    other = ShoppingCart()
+    other.add_product(laptop, 1)
+    other.total_cost()
+    mouse.price = 300  # price changes reach cached totals
+    assert cart.total_cost() == 600
+    assert not other._stale  # carts without the product keep their total
+    laptop.price = 14000
+    assert other._stale and other.total_cost() == 14000
+    laptop.price = 15000
+
+    line = cart.items[0]
+    try:
+        line.quantity = 7  # lines are snapshots; quantities go through the cart
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("CartItem must be immutable")
+    assert line.total_price() == 600 and cart.quantity_of(mouse) == 2
+    cart.remove_product(mouse)
+    assert cart not in mouse._carts
+    mouse.price = 250
+    assert not cart._stale
+    cart.clear()
+    assert cart.total_cost() == 0 and len(cart) == 0
+
+    rng = random.Random(0)
+    products = [Product(f"p{i}", rng.randint(1, 1000)) for i in range(20)]
+    cart = ShoppingCart()
+    expected = {}
+    for _ in range(2000):
+        p, q = rng.choice(products), rng.randint(-2, 5)
+        op = rng.random()
+        if op < 0.5:
+            cart.add_product(p, max(q, 1))
+            expected[p] = expected.get(p, 0) + max(q, 1)
+        elif op < 0.8:
+            cart.update_quantity(p, q)
+            if q <= 0:
+                expected.pop(p, None)
+            else:
+                expected[p] = q
+        elif op < 0.95:
+            cart.remove_product(p)
+            expected.pop(p, None)
+        else:
+            p.price = rng.randint(1, 1000)
+        assert cart.total_cost() == sum(p.price * q for p, q in expected.items())
+        assert {i.product: i.quantity for i in cart.items} == expected
+
+    print("✅ All shopping cart tests passed!")
@@ -0,0 +1,241 @@
+# Bulk anagram grouping (retry.py q1 at scale).
+#
+# retry.anagrams() keys every word with "".join(sorted(word)): a sort and a
+# new string per word, in a Python loop. Here words are grouped in batches:
+#   - the key is a letter-count signature: for a lowercase a-z word shorter
+#     than 16 letters every count fits in 4 bits, so the 26 counts pack into
+#     two uint64s, computed for the whole batch with NumPy (a byte table
+#     lookup + one segment sum per word, no sorting inside words)
+#   - a stable lexsort on the two keys puts each group's words next to each
+#     other, in input order
+#   - other words (capitals, digits, non-ASCII, 16+ letters) keep the sorted
+#     key; they can only be anagrams of each other, so both key kinds never
+#     meet in one group
+# Groups come out in order of first appearance, words in input order, i.e.
+# the same lists as retry.anagrams().
+#
+# Input can stream (iterables, files) and be sharded across processes;
+# per-batch results merge by key.
+#
+# The cyclic GC is paused while grouping: every batch allocates one list per
+# group, which triggers full collections that walk all the words collected
+# so far (about 2x slower at 10M words). Nothing here creates cycles.
+
+import gc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+BATCH_SIZE = 1 << 20
+MAX_PACKED_LEN = 15  # a letter count of 16 would carry into the next nibble
+
+Group = Tuple[Hashable, List[str]]
+
+
+def signature(word: str) -> Hashable:
+    """The grouping key of one word (same keys as the batch path)."""
+    if 0 < len(word) <= MAX_PACKED_LEN and word.isascii() and word.isalpha() and word.islower():
+        lo = hi = 0
+        for ch in word:
+            c = ord(ch) - 97
+            if c < 16:
+                lo += 1 << (4 * c)
+            else:
+                hi += 1 << (4 * (c - 16))
+        return (lo, hi)
+    return "".join(sorted(word))
+
+
+def _byte_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-byte nibble increments for the lo/hi keys, and which bytes are not a-z."""
+    c = np.arange(256) - 97
+    letter = (c >= 0) & (c < 26)
+    one = np.left_shift(np.uint64(1), ((c & 15) * 4).astype(np.uint64))
+    lo = np.where(letter & (c < 16), one, np.uint64(0))
+    hi = np.where(letter & (c >= 16), one, np.uint64(0))
+    return lo, hi, ~letter
+
+
+_LO, _HI, _BAD = _byte_tables()
+
+
+def _packed_keys(words: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(lo, hi, ok): packed count keys for a batch; ok marks words the packing covers."""
+    n = len(words)
+    lens = np.fromiter(map(len, words), dtype=np.int64, count=n)
+    raw = "".join(words).encode("utf-8", "surrogatepass")
+    if len(raw) != int(lens.sum()):
+        # Non-ASCII somewhere: byte offsets no longer match characters
+        ok = np.fromiter((w.isascii() for w in words), dtype=bool, count=n)
+        raw = "".join(w if a else "" for w, a in zip(words, ok)).encode()
+        lens = np.where(ok, lens, 0)
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    lo, hi, bad = _LO[buf], _HI[buf], _BAD[buf]
+
+    ok = (lens > 0) & (lens <= MAX_PACKED_LEN)
+    starts = np.zeros(n, dtype=np.int64)
+    np.cumsum(lens[:-1], out=starts[1:])
+    k_lo = np.zeros(n, dtype=np.uint64)
+    k_hi = np.zeros(n, dtype=np.uint64)
+    has = lens > 0
+    if buf.size:
+        # reduceat needs in-range starts; empty words are filtered via `has`
+        s = starts[has]
+        k_lo[has] = np.add.reduceat(lo, s)
+        k_hi[has] = np.add.reduceat(hi, s)
+        ok[has] &= np.add.reduceat(bad, s) == 0
+    return k_lo, k_hi, ok
+
+
+def group_batch(words: Sequence[str]) -> List[Group]:
+    """
+    Group one batch: [(key, words), ...] in order of first appearance.
+
+    Time: O(total letters) for the keys + O(n log n) for the sort
+    """
+    words = list(words)
+    if not words:
+        return []
+    k_lo, k_hi, ok = _packed_keys(words)
+
+    groups: List[Tuple[int, Hashable, List[str]]] = []  # (first index, key, words)
+    fast = np.flatnonzero(ok)
+    if fast.size:
+        order = fast[np.lexsort((k_hi[fast], k_lo[fast]))]
+        s_lo, s_hi = k_lo[order], k_hi[order]
+        cut = np.flatnonzero((s_lo[1:] != s_lo[:-1]) | (s_hi[1:] != s_hi[:-1])) + 1
+        bounds = [0, *cut.tolist(), order.size]
+        ordered = order.tolist()
+        ws = [words[i] for i in ordered]
+        keys = zip(s_lo[bounds[:-1]].tolist(), s_hi[bounds[:-1]].tolist())
+        for a, b, key in zip(bounds, bounds[1:], keys):
+            groups.append((ordered[a], key, ws[a:b]))
+
+    slow: Dict[str, Tuple[int, List[str]]] = {}
+    for i in np.flatnonzero(~ok).tolist():
+        word = words[i]
+        key = "".join(sorted(word))
+        if key in slow:
+            slow[key][1].append(word)
+        else:
+            slow[key] = (i, [word])
+    groups.extend((first, key, ws) for key, (first, ws) in slow.items())
+
+    groups.sort(key=lambda g: g[0])
+    return [(key, ws) for _, key, ws in groups]
+
+
+class AnagramGrouper:
+    """Accumulates groups over many batches, merging by key."""
+
+    def __init__(self):
+        self._groups: Dict[Hashable, List[str]] = {}
+
+    def add(self, words: Sequence[str]) -> None:
+        self.merge(group_batch(words))
+
+    def merge(self, groups: Iterable[Group]) -> None:
+        mine = self._groups
+        for key, ws in groups:
+            if key in mine:
+                mine[key].extend(ws)
+            else:
+                mine[key] = ws
+
+    def groups(self) -> List[List[str]]:
+        return list(self._groups.values())
+
+
+@contextmanager
+def _gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _batches(words: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    it = iter(words)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def group_anagrams(words: Iterable[str], batch_size: int = BATCH_SIZE) -> List[List[str]]:
+    """Same result as retry.anagrams(words); words may be any iterable."""
+    grouper = AnagramGrouper()
+    with _gc_paused():
+        for batch in _batches(words, batch_size):
+            grouper.add(batch)
+    return grouper.groups()
+
+
+def iter_file_words(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """Whitespace-separated words of a file, read line by line."""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            yield from line.split()
+
+
+def group_anagrams_file(path: str, batch_size: int = BATCH_SIZE, encoding: str = "utf-8") -> List[List[str]]:
+    return group_anagrams(iter_file_words(path, encoding), batch_size)
+
+
+def group_anagrams_sharded(words: Iterable[str], workers: int, batch_size: int = BATCH_SIZE) -> List[List[str]]:
+    """
+    Batches are grouped in a process pool and merged here in input order,
+    so the result matches group_anagrams(). Pays off when the per-word
+    work outweighs sending words to and from the workers.
+    """
+    grouper = AnagramGrouper()
+    with ProcessPoolExecutor(workers) as pool, _gc_paused():
+        for groups in pool.map(group_batch, _batches(words, batch_size)):
+            grouper.merge(groups)
+    return grouper.groups()
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+    import string
+
+    def anagrams(ls):  # retry.anagrams (retry.py prints on import)
+        ans = {}
+        for i in ls:
+            ow = "".join(sorted(i))
+            if ow in ans:
+                ans[ow].append(i)
+            else:
+                ans[ow] = [i]
+        return [v for v in ans.values()]
+
+    print("Running anagram grouping tests...")
+
+    words = ["eat", "tea", "tan", "ate", "nat", "bat"]
+    assert group_anagrams(words) == anagrams(words) == [["eat", "tea", "ate"], ["tan", "nat"], ["bat"]]
+    assert group_anagrams([]) == []
+    mixed = ["", "Tea", "eaT", "zzzzzzzzzzzzzzzzz", "zzzzzzzzzzzzzzzzz", "über", "rüeb", "ab1", "1ba", "", "ba", "ab"]
+    assert group_anagrams(mixed, batch_size=3) == anagrams(mixed)
+    assert signature("listen") == signature("silent") != signature("enlist" + "s")
+
+    rng = random.Random(0)
+    alphabet = string.ascii_lowercase[:6] + "Zé"
+    for _ in range(200):
+        ws = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 18))) for _ in range(rng.randint(0, 80))]
+        expected = anagrams(ws)
+        assert group_anagrams(ws) == expected
+        assert group_anagrams(ws, batch_size=7) == expected
+        for key, group in group_batch(ws):
+            assert all(signature(w) == key for w in group)
+
+    assert group_anagrams_sharded(words * 3, workers=2, batch_size=4) == anagrams(words * 3)
+
+    print("✅ All anagram grouping tests passed!")
@@ -0,0 +1,59 @@
+"""
+Benchmark: retry.anagrams() vs anagram_groups at 10M words.
+
+Run: python bench_anagrams.py [--words 10000000] [--workers N]
+Words are 3-10 random letters from an 8-letter alphabet, so most of them
+have anagrams. Also times the streaming file path.
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from anagram_groups import group_anagrams, group_anagrams_file, group_anagrams_sharded
+
+with contextlib.redirect_stdout(io.StringIO()):  # retry.py prints on import
+    from retry import anagrams
+
+
+def make_words(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lens = rng.integers(3, 11, n)
+    letters = rng.integers(ord("a"), ord("a") + 8, int(lens.sum()), dtype=np.uint8)
+    gaps = np.cumsum(lens)[:-1]
+    buf = np.insert(letters, gaps, ord(" "))
+    return buf.tobytes().decode().split()
+
+
+def timed(label, fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    print(f"{label:<32} {time.perf_counter() - t0:7.2f}s")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    words = make_words(args.words)
+    print(f"words={len(words):,}  cpus={os.cpu_count()}")
+    expected = timed("retry.anagrams", anagrams, words)
+    print(f"{'':<32} {len(expected):,} groups")
+    assert timed("group_anagrams", group_anagrams, words) == expected
+    if args.workers > 1:
+        assert timed(f"group_anagrams_sharded x{args.workers}", group_anagrams_sharded, words, args.workers) == expected
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.txt")
+        with open(path, "w") as f:
+            for start in range(0, len(words), 100_000):
+                f.write(" ".join(words[start:start + 100_000]) + "\n")
+        del words
+        assert timed("group_anagrams_file", group_anagrams_file, path) == expected
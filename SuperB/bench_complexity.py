@@ -0,0 +1,329 @@
+"""
+Complexity benchmarks for every function in Day3/day3_dsa.py and prep_20.py
+(plus the prep_20_iter.py rewrites).
+
+    python bench_complexity.py                     # check against baselines
+    python bench_complexity.py --update-baselines  # re-record bench_baselines.json
+    python bench_complexity.py --only two_sum
+    python bench_complexity.py --case prep.add --json  # one case, machine-readable
+
+Each function runs at growing input sizes (five doublings, small enough
+that the working set stays in CPU cache, so the fit sees the algorithm
+and not the memory hierarchy). Each size is timed best-of-REPEATS with
+the cyclic GC off, as timeit does. From the timings we fit the log-log
+slope (time ~ n^slope), then fail when:
+  - the slope is more than SLOPE_TOLERANCE above the exponent of the
+    documented Big-O (e.g. O(n) measured at n^1.5), or
+  - the time at the largest size regressed past the stored baseline.
+Baselines are stored relative to a fixed calibration loop, so they carry
+over between machines of different speed. The loop runs right next to
+each measurement (interleaved, median of REPEATS pairs), so drift over a
+long run cancels out. A case that fails is measured again in a fresh
+subprocess and only counts as FAIL if it fails there too.
+
+The documented Big-O comes from the "Time: O(...)" line of the docstring
+when there is one (day3_dsa.py), otherwise from the table below. Functions
+known to miss their target are marked `known` and reported as XFAIL; if one
+starts passing it is reported as XPASS so the mark can be removed.
+Exit code 1 on any FAIL.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import random
+import re
+import statistics
+import string
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, "Day3"))
+
+import day3_dsa  # noqa: E402
+import prep_20  # noqa: E402
+import prep_20_iter  # noqa: E402
+
+BASELINES = os.path.join(BASE_DIR, "bench_baselines.json")
+
+# Expected log-log slope per class. A log factor adds ~0.1 over a 16x size
+# range, below the noise, so n log n is checked as n; the tolerance catches
+# O(n) -> O(n^1.5) or worse.
+SLOPES = {"1": 0.0, "log n": 0.0, "n": 1.0, "n log n": 1.0, "n^2": 2.0, "n^3": 3.0}
+FIT_CLASSES = ("1", "n", "n^2", "n^3")
+SLOPE_TOLERANCE = 0.3
+REGRESSION_TOLERANCE = 0.5  # 50% slower than baseline
+MIN_SECONDS = 0.05          # per measurement, repeats small inputs
+REPEATS = 5                 # interleaved (calibration, case) pairs at the largest size
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable
+    make: Callable[[int], tuple]  # n -> args
+    sizes: List[int]
+    big_o: Optional[str] = None   # None: read from the docstring
+    known: str = ""               # why it currently misses big_o
+    mutates: bool = False         # fresh copy of the args per call
+
+
+# -----------------------
+# Inputs
+# -----------------------
+rng = random.Random(0)
+
+
+def ints(n, hi=None):
+    return [rng.randrange(hi or n * 4) for _ in range(n)]
+
+
+def text(n, alphabet=string.ascii_lowercase):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def doubling(start, steps=5):
+    return [start * 2 ** k for k in range(steps)]
+
+
+def no_pair(n):
+    # Worst case for two_sum: only even values, odd target
+    return [2 * x for x in ints(n)], 1
+
+
+def grid(n):
+    side = int(math.isqrt(n))
+    return ([[0] * side for _ in range(side)],)
+
+
+def missing(n):
+    nums = list(range(1, n + 2))
+    nums.remove(n)  # missing near the end: full probe
+    return (nums,)
+
+
+CASES: List[Case] = [
+    # Day3/day3_dsa.py
+    Case("count_cart_items", day3_dsa.count_cart_items, lambda n: (ints(n, 100),), doubling(1_000)),
+    Case("first_unique_char", day3_dsa.first_unique_char, lambda n: (text(n) + text(n),), doubling(1_000)),
+    Case("two_sum", day3_dsa.two_sum, no_pair, doubling(1_000)),
+    Case("remove_duplicates_sorted", day3_dsa.remove_duplicates_sorted,
+         lambda n: (sorted(ints(n, n // 2)),), doubling(1_000), mutates=True),
+    Case("is_valid_parentheses", day3_dsa.is_valid_parentheses,
+         lambda n: ("([{" * (n // 6) + "}])" * (n // 6),), doubling(1_000)),
+    Case("longest_unique_substring", day3_dsa.longest_unique_substring, lambda n: (text(n),), doubling(1_000)),
+    Case("can_fulfill_order", day3_dsa.can_fulfill_order,
+         lambda n: ({i: 10 for i in range(n)}, {i: 1 for i in range(n)}), doubling(1_000)),
+    Case("shortest_path_grid", day3_dsa.shortest_path_grid, grid, doubling(1_000)),
+    # prep_20.py
+    Case("prep.reverse_string", prep_20.reverse_string, lambda n: (text(n),), doubling(20_000), "n"),
+    Case("prep.find_duplicates", prep_20.find_duplicates, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.count_vowels", prep_20.count_vowels, lambda n: (text(n),), doubling(1_000), "n"),
+    Case("prep.find_max", prep_20.find_max, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.remove_duplicate", prep_20.remove_duplicate, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.fizz_buzz", prep_20.fizz_buzz, lambda n: (n,), doubling(500), "n"),
+    Case("prep.find_duplicate", prep_20.find_duplicate, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.check_palindrome", prep_20.check_palindrome,
+         lambda n: ("a" * n,), doubling(20_000), "n"),
+    Case("prep.add", prep_20.add, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.count_characters", prep_20.count_characters, lambda n: (text(n),), doubling(1_000), "n"),
+    Case("prep.two_sum", prep_20.two_sum, no_pair, doubling(250), "n",
+         known="`target - x in numbers` scans the list: O(n^2)"),
+    Case("prep.second_largest", prep_20.second_largest, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.merge", prep_20.merge, lambda n: (ints(n), ints(n)), doubling(500), "n", mutates=True),
+    Case("prep.remove_even", prep_20.remove_even, lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("prep.missing_number", prep_20.missing_number, missing, doubling(1_000), "n"),
+    Case("prep.sort_words", prep_20.sort_words, lambda n: ([text(8) for _ in range(n)],),
+         doubling(1_000), "n log n"),
+    Case("prep.longest", prep_20.longest, lambda n: (" ".join(text(8) for _ in range(n)),),
+         doubling(1_000), "n"),
+    Case("prep.flatten", prep_20.flatten, lambda n: ([[1, 2], 3] * (n // 3),), doubling(1_000), "n"),
+    Case("prep.occurrences_count", prep_20.occurrences_count, lambda n: (ints(n, 10), 3),
+         doubling(1_000), "n"),
+    Case("prep.common_elements", prep_20.common_elements, lambda n: (ints(n), ints(n)), doubling(250), "n",
+         known="`i in list2` scans the list: O(n*m)"),
+    Case("prep.cart_total", prep_20.cart_total, lambda n: ([{"price": 1.5}] * n,), doubling(1_000), "n"),
+    # prep_20_iter.py (consumed with list())
+    Case("iter.common_elements", lambda a, b: list(prep_20_iter.common_elements(a, b)),
+         lambda n: (ints(n), ints(n)), doubling(1_000), "n"),
+    Case("iter.find_duplicate", lambda a: list(prep_20_iter.find_duplicate(a)),
+         lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("iter.remove_duplicate", lambda a: list(prep_20_iter.remove_duplicate(a)),
+         lambda n: (ints(n),), doubling(1_000), "n"),
+    Case("iter.flatten", lambda a: list(prep_20_iter.flatten(a)),
+         lambda n: ([[1, [2, [3]]], 4] * (n // 4),), doubling(1_000), "n"),
+]
+
+
+# -----------------------
+# Measuring
+# -----------------------
+def documented_big_o(case: Case) -> str:
+    if case.big_o:
+        return case.big_o
+    doc = case.fn.__doc__ or ""
+    m = re.search(r"Time:\s*O\(([^)]*)\)", doc)
+    if not m:
+        raise ValueError(f"{case.name}: no big_o given and no 'Time: O(...)' in the docstring")
+    expr = m.group(1).replace(" ", "")
+    # One input dimension grows with n in our generators (m, R*C, ... too)
+    return {"1": "1", "n": "n", "m": "n", "R*C": "n", "k": "n", "nlogn": "n log n", "n^2": "n^2"}[expr]
+
+
+def _mean_call(case: Case, args: tuple, sink: io.StringIO) -> float:
+    """Seconds per call, repeating small calls up to MIN_SECONDS."""
+    calls, elapsed = 0, 0.0
+    while elapsed < MIN_SECONDS:
+        call_args = tuple(list(a) if isinstance(a, list) else a for a in args) if case.mutates else args
+        with contextlib.redirect_stdout(sink):
+            t0 = time.perf_counter()
+            case.fn(*call_args)
+            elapsed += time.perf_counter() - t0
+        calls += 1
+        sink.seek(0)
+        sink.truncate()
+    return elapsed / calls
+
+
+def time_call(case: Case, args: tuple) -> float:
+    """Best seconds per call over REPEATS measurements, with the cyclic GC off (as timeit does)."""
+    sink = io.StringIO()
+    gc.disable()
+    try:
+        return min(_mean_call(case, args, sink) for _ in range(REPEATS))
+    finally:
+        gc.enable()
+
+
+def relative_time(case: Case, args: tuple) -> float:
+    """Median of case time / calibration time, each pair measured back to back."""
+    sink = io.StringIO()
+    ratios = []
+    for _ in range(REPEATS):
+        unit = _calibration_loop()
+        ratios.append(_mean_call(case, args, sink) / unit)
+    return statistics.median(ratios)
+
+
+def fit(sizes: List[int], seconds: List[float]) -> Dict[str, float]:
+    """Least-squares log-log slope and the complexity class closest to it."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in seconds]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+    fitted = min(FIT_CLASSES, key=lambda c: abs(SLOPES[c] - slope))
+    return {"slope": round(slope, 3), "fitted": fitted}
+
+
+def _calibration_loop() -> float:
+    """Seconds for a fixed pure-Python loop; timings are stored relative to it."""
+    t0 = time.perf_counter()
+    total = 0
+    for i in range(200_000):
+        total += i & 7
+    return time.perf_counter() - t0
+
+
+def calibrate() -> float:
+    return min(_calibration_loop() for _ in range(5))
+
+
+def run(case: Case) -> Dict:
+    gc.collect()  # garbage from earlier cases must not be collected on this one's clock
+    rng.seed(case.name)  # same inputs in a full run and in run_isolated()
+    inputs = [(n, case.make(n)) for n in case.sizes]
+    seconds = [time_call(case, args) for _, args in inputs]
+    result = fit(case.sizes, seconds)
+    result.update(
+        big_o=documented_big_o(case),
+        relative=round(relative_time(case, inputs[-1][1]), 4),
+        seconds=[round(s, 7) for s in seconds],
+    )
+    return result
+
+
+def run_isolated(case: Case) -> Dict:
+    """run(case) in a fresh interpreter, away from the heap and caches of a long run."""
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--case", case.name, "--json"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def judge(case: Case, result: Dict, baseline: Optional[Dict]) -> List[str]:
+    problems = []
+    limit = SLOPES[result["big_o"]] + SLOPE_TOLERANCE
+    if result["slope"] > limit:
+        problems.append(f"slope {result['slope']:.2f} > {limit:g}: scales like O({result['fitted']}), "
+                        f"documented O({result['big_o']})")
+    if baseline and result["relative"] > baseline["relative"] * (1 + REGRESSION_TOLERANCE):
+        problems.append(f"{result['relative'] / baseline['relative']:.2f}x slower than baseline")
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update-baselines", action="store_true")
+    parser.add_argument("--only", help="substring of the case names to run")
+    parser.add_argument("--case", help="exact name of a single case to run")
+    parser.add_argument("--json", action="store_true", help="print the --case result as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        if not args.case:
+            parser.error("--json needs --case")
+        case = next((c for c in CASES if c.name == args.case), None)
+        if case is None:
+            parser.error(f"unknown case: {args.case}")
+        print(json.dumps(run(case)))
+        sys.exit(0)
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines = json.load(f)
+
+    print(f"calibration loop: {calibrate() * 1e3:.2f} ms")
+    print(f"{'function':<28} {'doc':>10} {'slope':>6} {'expected':>11} {'max n':>9} {'time':>10}  status")
+
+    failed = 0
+    for case in CASES:
+        if args.only and args.only not in case.name:
+            continue
+        if args.case and case.name != args.case:
+            continue
+        result = run(case)
+        baseline = None if args.update_baselines else baselines.get(case.name)
+        problems = judge(case, result, baseline)
+        if problems and not case.known and not args.update_baselines:
+            # Confirm in a fresh process before calling it a regression
+            result = run_isolated(case)
+            problems = judge(case, result, baseline)
+        if case.known:
+            status = f"XFAIL ({case.known})" if problems else "XPASS (remove the known mark)"
+        elif problems:
+            status = "FAIL: " + "; ".join(problems)
+            failed += 1
+        else:
+            status = "ok"
+        exponent = SLOPES[result["big_o"]]
+        expect = f"{exponent:g} (<={exponent + SLOPE_TOLERANCE:g})"
+        print(
+            f"{case.name:<28} {'O(' + result['big_o'] + ')':>10} {result['slope']:6.2f} {expect:>11} "
+            f"{case.sizes[-1]:9,} {result['seconds'][-1] * 1e3:8.2f}ms  {status}"
+        )
+        if args.update_baselines:
+            baselines[case.name] = {k: result[k] for k in ("big_o", "slope", "relative")}
+
+    if args.update_baselines:
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baselines written to {os.path.relpath(BASELINES)}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,94 @@
+"""
+Benchmark: first non-repeating character, old retry.nonr() vs the linear one.
+
+Run: python bench_nonr.py [--chars 1000000] [--max-quadratic 20000]
+Worst case input: every character repeats except one at the very end, for
+text (mixed ASCII / CJK / emoji, so the str is 4 bytes per char) and bytes.
+Also feeds the same input in chunks through the streaming trackers from
+Day3/streaming_strings.py. The old O(n^2) version only runs up to
+--max-quadratic characters; bigger sizes print an n^2 estimate.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Day3"))
+from streaming_strings import ByteFirstUnique, FirstUniqueTracker  # noqa: E402
+
+with contextlib.redirect_stdout(io.StringIO()):  # retry.py prints on import
+    from retry import nonr  # noqa: E402
+
+CHUNK = 1 << 16
+
+
+def nonr_quadratic(word):  # retry.nonr before the rewrite
+    for i in word:
+        if word.count(i) == 1:
+            return i
+
+
+def make_text(n, seed=0):
+    rng = random.Random(seed)
+    alphabet = [chr(c) for c in range(0x61, 0x7B)] + [chr(c) for c in range(0x4E00, 0x4E00 + 2000)]
+    alphabet += [chr(c) for c in range(0x1F600, 0x1F650)]
+    half = [rng.choice(alphabet) for _ in range((n - 1) // 2)]
+    chars = half + half + half[:n - 1 - 2 * len(half)]
+    rng.shuffle(chars)
+    return "".join(chars) + "\U0001F680"
+
+
+def make_bytes(n, seed=0):
+    rng = random.Random(seed)
+    half = bytes(rng.randrange(255) for _ in range((n - 1) // 2))  # 0..254, 255 stays unique
+    data = bytearray(half + half + half[:n - 1 - 2 * len(half)])
+    rng.shuffle(data)
+    return bytes(data) + b"\xff"
+
+
+def timed(label, fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<34} {time.perf_counter() - t0:9.4f}s")
+    return result
+
+
+def streamed(tracker, data):
+    for start in range(0, len(data), CHUNK):
+        tracker.feed(data[start:start + CHUNK])
+    return tracker
+
+
+def run(label, data, max_quadratic):
+    print(f"\n{label}: {len(data):,} chars")
+    expected = timed("retry.nonr (linear)", nonr, data)
+
+    small = data[-max_quadratic:]
+    t0 = time.perf_counter()
+    assert nonr_quadratic(small) == nonr(small)
+    elapsed = time.perf_counter() - t0
+    if len(small) == len(data):
+        print(f"{'old retry.nonr (quadratic)':<34} {elapsed:9.4f}s")
+    else:
+        estimate = elapsed * (len(data) / len(small)) ** 2
+        print(f"{'old retry.nonr (quadratic)':<34} ~{estimate:8.0f}s  (n^2 from {len(small):,} chars: {elapsed:.3f}s)")
+
+    if isinstance(data, str):
+        tracker = timed("FirstUniqueTracker, 64K chunks", streamed, FirstUniqueTracker(), data)
+        assert tracker.first_char() == expected
+    else:
+        tracker = timed("ByteFirstUnique, 64K chunks", streamed, ByteFirstUnique(), data)
+        assert data[tracker.first_index()] == expected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chars", type=int, default=1_000_000)
+    parser.add_argument("--max-quadratic", type=int, default=20_000)
+    args = parser.parse_args()
+
+    run("text", make_text(args.chars), args.max_quadratic)
+    run("bytes", make_bytes(args.chars), args.max_quadratic)
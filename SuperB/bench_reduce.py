@@ -0,0 +1,63 @@
+"""
+Benchmark: prep_20 reductions vs prep_20_reduce.
+
+Run: python bench_reduce.py [--n 50000000] [--list-n 5000000] [--workers N]
+prep_20's find_max/second_largest/add/missing_number make four Python
+passes over a list (timed on --list-n values, reported per element);
+prep_20_reduce does all four in one chunked NumPy pass over a memmapped
+file of --n int64 values (written to a temp dir, ~8 bytes per value).
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import prep_20
+from prep_20_reduce import reduce_array, reduce_file
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def row(label, seconds, n):
+    print(f"{label:<38} {seconds:8.2f}s  {n / seconds / 1e6:8.1f} M values/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=50_000_000)
+    parser.add_argument("--list-n", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    nums = rng.permutation(np.arange(1, args.list_n + 2))[1:]  # one missing
+    as_list = np.sort(nums).tolist()  # prep_20.missing_number needs sorted input
+
+    def prep_all(values):
+        return (prep_20.find_max(values), prep_20.second_largest(values),
+                prep_20.add(values), prep_20.missing_number(values))
+
+    expected, t = timed(prep_all, as_list)
+    row(f"prep_20 x4 passes, list of {args.list_n:,}", t, args.list_n)
+    stats, t = timed(reduce_array, nums)
+    assert (stats.max, stats.second_largest, stats.total) == expected[:3]
+    assert stats.missing_number == expected[3]
+    row(f"reduce_array, {args.list_n:,}", t, args.list_n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "values.i64")
+        block = 10_000_000
+        with open(path, "wb") as f:
+            for start in range(1, args.n + 1, block):
+                np.arange(start, min(start + block, args.n + 1), dtype=np.int64).tofile(f)
+        print(f"file: {args.n:,} int64 ({os.path.getsize(path) / 2**20:,.0f} MiB), cpus={os.cpu_count()}")
+        for workers in sorted({1, args.workers}):
+            stats, t = timed(reduce_file, path, workers=workers)
+            assert stats.max == args.n and stats.total == args.n * (args.n + 1) // 2
+            row(f"reduce_file workers={workers}", t, args.n)
@@ -0,0 +1,80 @@
+"""
+Benchmark: zig_zag.func() vs zig_zag_codec on MB-sized inputs.
+
+Run: python bench_zig_zag.py [--mb 4] [--rows 5] [--batch 200000] [--max-quadratic 200000]
+Times encode/decode of one big text (mixed ASCII / non-ASCII) and of
+bytes, the chunked ZigZagEncoder, and encode_many() over many short
+strings against calling func() per string. func() copies a whole row on
+every append (O(n^2)), so on big inputs it only runs on the first
+--max-quadratic characters and prints an n^2 estimate.
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from zig_zag_codec import ZigZagEncoder, decode, decode_many, encode, encode_many
+
+with contextlib.redirect_stdout(io.StringIO()):  # zig_zag.py prints on import
+    from zig_zag import func
+
+CHUNK = 1 << 16
+
+
+def make_text(n, seed=0):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz é中"
+    return "".join(rng.choices(alphabet, k=n))
+
+
+def timed(label, fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<34} {time.perf_counter() - t0:8.3f}s")
+    return result
+
+
+def streamed(data, rows):
+    encoder = ZigZagEncoder(rows)
+    for start in range(0, len(data), CHUNK):
+        encoder.feed(data[start:start + CHUNK])
+    return encoder.finish()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, default=4)
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=200_000)
+    parser.add_argument("--max-quadratic", type=int, default=200_000)
+    args = parser.parse_args()
+    rows = args.rows
+
+    text = make_text(int(args.mb * 1_000_000))
+    print(f"text: {len(text):,} chars, rows={rows}")
+    head = text[:args.max_quadratic]
+    t0 = time.perf_counter()
+    assert func(head, rows) == encode(head, rows)
+    elapsed = time.perf_counter() - t0
+    if len(head) == len(text):
+        print(f"{'zig_zag.func':<34} {elapsed:8.3f}s")
+    else:
+        estimate = elapsed * (len(text) / len(head)) ** 2
+        print(f"{'zig_zag.func':<34} ~{estimate:7.0f}s  (n^2 from {len(head):,} chars: {elapsed:.3f}s)")
+    expected = timed("encode", encode, text, rows)
+    assert timed("decode", decode, expected, rows) == text
+    assert timed("ZigZagEncoder, 64K chunks", streamed, text, rows) == expected
+
+    data = text.encode()
+    print(f"\nbytes: {len(data):,} bytes, rows={rows}")
+    encoded = timed("encode", encode, data, rows)
+    assert timed("decode", decode, encoded, rows) == data
+    assert timed("ZigZagEncoder, 64K chunks", streamed, data, rows) == encoded
+
+    rng = random.Random(1)
+    batch = [make_text(rng.randint(8, 40), seed=i) for i in range(args.batch)]
+    print(f"\nbatch: {len(batch):,} strings of 8-40 chars, rows={rows}")
+    expected = timed("[func(s) for s in batch]", lambda: [func(s, rows) for s in batch])
+    assert timed("encode_many", encode_many, batch, rows) == expected
+    assert timed("decode_many", decode_many, expected, rows) == batch
@@ -104,13 +104,19 @@ def two_sum(numbers:list, target:int)-> tuple:
 
 # 11. Find Second Largest Number
 def second_largest(numbers:list)->int:
-    largest = numbers[0]
-    s_largest = numbers[0]
-    for number in numbers:
+    rest = iter(numbers)
+    try:
+        largest = next(rest)
+    except StopIteration:
+        raise IndexError("second_largest() of an empty list") from None
+    s_largest = None
+    for number in rest:
         if number >largest:
             s_largest = largest
             largest = number
-    return s_largest
+        elif s_largest is None or number > s_largest:
+            s_largest = number
+    return largest if s_largest is None else s_largest
 
 # 12. Merge Two Lists
 def merge(list1:list, list2:list)->list:
@@ -0,0 +1,180 @@
+# Lazy, linear-time companions to the list utilities in prep_20.py.
+#
+# Same names and same results as prep_20 (list(f(...)) == prep_20.f(...)),
+# but:
+#   - they yield instead of building lists, so inputs can be generators,
+#     file lines, ... bigger than memory
+#   - membership tests use sets, so nothing is O(n*m)
+#   - merge() does not touch its inputs (prep_20.merge extends list1)
+#   - flatten() handles any depth with an explicit stack, no recursion
+# NumPy arrays take a vectorized path and get an array back.
+# Memory is O(distinct values) where a function has to remember what it saw.
+
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # pure Python only
+    np = None
+
+
+def _is_array(x) -> bool:
+    return np is not None and isinstance(x, np.ndarray)
+
+
+# 2. Find Duplicates (each duplicated value once)
+def find_duplicates(nums):
+    """Yield each value that occurs more than once, when it first repeats."""
+    if _is_array(nums):
+        values, counts = np.unique(nums, return_counts=True)
+        return values[counts > 1]
+    return _find_duplicates(nums)
+
+
+def _find_duplicates(nums):
+    seen = set()
+    reported = set()
+    for n in nums:
+        if n in seen:
+            if n not in reported:
+                reported.add(n)
+                yield n
+        else:
+            seen.add(n)
+
+
+# 4. Remove Duplicates From List
+def remove_duplicate(numbers):
+    """Yield values in first-seen order, skipping repeats."""
+    if _is_array(numbers):
+        _, first = np.unique(numbers, return_index=True)
+        return numbers[np.sort(first)]
+    return _remove_duplicate(numbers)
+
+
+def _remove_duplicate(numbers):
+    seen = set()
+    for number in numbers:
+        if number not in seen:
+            seen.add(number)
+            yield number
+
+
+# 6. Find Duplicates (every repeat)
+def find_duplicate(numbers):
+    """Yield every occurrence after the first, in input order."""
+    if _is_array(numbers):
+        _, first = np.unique(numbers, return_index=True)
+        repeat = np.ones(numbers.size, dtype=bool)
+        repeat[first] = False
+        return numbers[repeat]
+    return _find_duplicate(numbers)
+
+
+def _find_duplicate(numbers):
+    seen = set()
+    for number in numbers:
+        if number in seen:
+            yield number
+        else:
+            seen.add(number)
+
+
+# 12. Merge Two Lists
+def merge(*iterables):
+    """Chain the inputs without copying or mutating them."""
+    if iterables and all(_is_array(x) for x in iterables):
+        return np.concatenate(iterables)
+    return chain.from_iterable(iterables)
+
+
+# 17. Flatten Nested List
+def flatten(nums):
+    """
+    Yield the leaves of an arbitrarily nested structure, depth first.
+    Strings and bytes are leaves, not sequences of characters.
+    """
+    if _is_array(nums):
+        return nums.ravel()
+    return _flatten(nums)
+
+
+def _flatten(nums):
+    stack = [iter(nums)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (str, bytes)) or not hasattr(item, "__iter__"):
+                yield item
+            else:
+                stack.append(iter(item))
+                break
+        else:
+            stack.pop()
+
+
+# 18. Count Occurrences
+def occurrences_count(nums, target) -> int:
+    if _is_array(nums):
+        return int(np.count_nonzero(nums == target))
+    return sum(1 for i in nums if i == target)
+
+
+# 19. Find Common Elements Between Lists
+def common_elements(list1, list2):
+    """
+    Yield items of list1 that also appear in list2 (duplicates in list1
+    kept, like prep_20). list2 is read once into a set; list1 can stream.
+    """
+    if _is_array(list1) and _is_array(list2):
+        return list1[np.isin(list1, list2)]
+    lookup = set(list2)
+    return (i for i in list1 if i in lookup)
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+    import prep_20
+
+    print("Running prep_20_iter tests...")
+
+    rng = random.Random(0)
+    for _ in range(200):
+        a = [rng.randrange(20) for _ in range(rng.randrange(40))]
+        b = [rng.randrange(20) for _ in range(rng.randrange(40))]
+
+        assert sorted(find_duplicates(iter(a))) == sorted(prep_20.find_duplicates(a))
+        assert list(find_duplicate(iter(a))) == prep_20.find_duplicate(a)
+        assert list(remove_duplicate(iter(a))) == prep_20.remove_duplicate(a)
+        assert list(common_elements(iter(a), b)) == prep_20.common_elements(a, b)
+        assert occurrences_count(iter(a), 3) == prep_20.occurrences_count(a, 3)
+        assert list(merge(a, b)) == prep_20.merge(list(a), b)
+
+        if np is not None:
+            x, y = np.array(a, dtype=np.int64), np.array(b, dtype=np.int64)
+            assert sorted(find_duplicates(x).tolist()) == sorted(prep_20.find_duplicates(a))
+            assert find_duplicate(x).tolist() == prep_20.find_duplicate(a)
+            assert remove_duplicate(x).tolist() == prep_20.remove_duplicate(a)
+            assert common_elements(x, y).tolist() == prep_20.common_elements(a, b)
+            assert occurrences_count(x, 3) == prep_20.occurrences_count(a, 3)
+            assert merge(x, y).tolist() == a + b
+
+    # merge leaves its inputs alone
+    a = [1, 2]
+    assert list(merge(a, [3])) == [1, 2, 3] and a == [1, 2]
+
+    nested = [1, [2, 3], 4]
+    assert list(flatten(nested)) == prep_20.flatten(nested) == [1, 2, 3, 4]
+    assert list(flatten([1, [2, [3, [4, ("x", b"y")]]], [], [[5]]])) == [1, 2, 3, 4, "x", b"y", 5]
+
+    deep = [0]
+    for i in range(1, 50_000):  # far past the recursion limit
+        deep = [deep, i]
+    assert list(flatten(deep)) == list(range(50_000))
+
+    # Streams: nothing is materialized
+    big = (i % 1000 for i in range(10**6))
+    first = next(iter(find_duplicate(big)))
+    assert first == 0
+
+    print("✅ All prep_20_iter tests passed!")
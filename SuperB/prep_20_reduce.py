@@ -0,0 +1,251 @@
+# Chunked, parallel versions of the prep_20.py reductions:
+# find_max, second_largest, add (sum) and missing_number.
+#
+# One pass computes all of them at once. Each chunk is reduced with NumPy
+# into a small ChunkStats (count, sum, top two, XOR), and partial results
+# merge in any order, so chunks can come from:
+#   - an in-memory array (threads: NumPy releases the GIL in reductions)
+#   - a binary file through np.memmap (processes: each worker maps its own
+#     byte range, nothing is pickled but the file name and offsets)
+# Only one chunk per worker is resident at a time, so files larger than RAM
+# work.
+#
+# missing_number: for numbers 1..n+1 with one missing (any order),
+#   missing = XOR(1..n+1) ^ XOR(values), cross-checked with the sum.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20   # elements per chunk
+TASK_CHUNKS = 16       # chunks handed to a worker at once
+
+
+class ChunkStats(NamedTuple):
+    count: int
+    total: float
+    top2: Tuple            # up to two largest values, largest first
+    xor: Optional[int]     # None for float data
+
+    @property
+    def max(self):
+        if not self.top2:
+            raise IndexError("max() of no values")
+        return self.top2[0]
+
+    @property
+    def second_largest(self):
+        """Second largest value counting duplicates ([5, 5, 3] -> 5); the max for one value."""
+        if not self.top2:
+            raise IndexError("second_largest() of no values")
+        return self.top2[-1]
+
+    @property
+    def missing_number(self) -> Optional[int]:
+        """
+        The one number missing from 1..count+1, or None when the values are
+        exactly 1..count (as prep_20.missing_number returns None then).
+        Raises ValueError when the values are not such a sequence.
+        """
+        if self.xor is None:
+            raise ValueError("missing_number needs integer data")
+        n = self.count + 1
+        by_xor = _xor_upto(n) ^ self.xor
+        by_sum = n * (n + 1) // 2 - self.total
+        if by_xor != by_sum or not 1 <= by_xor <= n:
+            raise ValueError("values are not 1..n with one number missing")
+        return None if by_xor == n else by_xor
+
+
+EMPTY = ChunkStats(0, 0, (), 0)
+
+
+def _xor_upto(n: int) -> int:
+    """1 ^ 2 ^ ... ^ n in O(1)."""
+    return (n, 1, n + 1, 0)[n % 4]
+
+
+def _int_sum(a: np.ndarray) -> int:
+    """
+    Exact sum of an integer chunk as a Python int. 64-bit values are summed
+    as 32-bit halves, so the int64 accumulators cannot wrap for chunks of
+    fewer than 2**31 values (uint64 is read as int64, then corrected by 2**64
+    for every value >= 2**63).
+    """
+    if a.dtype.itemsize < 8:
+        return int(a.sum(dtype=np.int64))
+    v = a.view(np.int64)
+    total = (int((v >> 32).sum()) << 32) + int((v & 0xFFFFFFFF).sum())
+    if a.dtype.kind == "u":
+        total += int(np.count_nonzero(v < 0)) << 64
+    return total
+
+
+def chunk_stats(a: np.ndarray) -> ChunkStats:
+    """Reduce one chunk. Sums are returned as Python ints, so merging never overflows."""
+    if not a.size:
+        return ChunkStats(0, 0, (), 0 if a.dtype.kind in "iu" else None)
+    if a.size >= 2:
+        top = np.partition(a, a.size - 2)[-2:]
+        top2 = (top[1].item(), top[0].item())
+    else:
+        top2 = (a[0].item(),)
+    if a.dtype.kind in "iu":
+        return ChunkStats(int(a.size), _int_sum(a), top2, int(np.bitwise_xor.reduce(a)))
+    return ChunkStats(int(a.size), float(a.sum(dtype=np.float64)), top2, None)
+
+
+def merge_stats(a: ChunkStats, b: ChunkStats) -> ChunkStats:
+    xor = None if a.xor is None or b.xor is None else a.xor ^ b.xor
+    return ChunkStats(
+        a.count + b.count,
+        a.total + b.total,
+        tuple(sorted(a.top2 + b.top2, reverse=True)[:2]),
+        xor,
+    )
+
+
+def _reduce_range(a: np.ndarray, start: int, stop: int, chunk_size: int) -> ChunkStats:
+    stats = EMPTY if a.dtype.kind in "iu" else EMPTY._replace(xor=None)
+    for i in range(start, stop, chunk_size):
+        stats = merge_stats(stats, chunk_stats(a[i:min(i + chunk_size, stop)]))
+    return stats
+
+
+def _tasks(n: int, chunk_size: int) -> List[Tuple[int, int]]:
+    step = chunk_size * TASK_CHUNKS
+    return [(i, min(i + step, n)) for i in range(0, n, step)] or [(0, 0)]
+
+
+def _merge_all(parts) -> ChunkStats:
+    parts = list(parts)
+    stats = parts[0]
+    for part in parts[1:]:
+        stats = merge_stats(stats, part)
+    return stats
+
+
+# -----------------------
+# Sources
+# -----------------------
+def reduce_array(values, chunk_size: int = CHUNK_SIZE, workers: int = 1) -> ChunkStats:
+    """
+    Reduce an array (or list) in chunks; workers > 1 uses threads.
+
+    Time: O(n), one pass
+    Space: O(chunk) per worker
+    """
+    a = np.asarray(values)
+    tasks = _tasks(a.size, chunk_size)
+    if workers <= 1 or len(tasks) == 1:
+        return _merge_all(_reduce_range(a, start, stop, chunk_size) for start, stop in tasks)
+    with ThreadPoolExecutor(workers) as pool:
+        return _merge_all(pool.map(lambda t: _reduce_range(a, t[0], t[1], chunk_size), tasks))
+
+
+def _reduce_file_range(path: str, dtype: str, start: int, stop: int, chunk_size: int) -> ChunkStats:
+    a = np.memmap(path, dtype=dtype, mode="r")
+    return _reduce_range(a, start, stop, chunk_size)
+
+
+def reduce_file(path: str, dtype: str = "int64", chunk_size: int = CHUNK_SIZE,
+                workers: Optional[int] = None) -> ChunkStats:
+    """
+    Reduce a raw binary file of `dtype` values through np.memmap.
+    workers defaults to the CPU count; 1 stays in this process.
+    """
+    n = os.path.getsize(path) // np.dtype(dtype).itemsize
+    if n == 0:
+        return chunk_stats(np.empty(0, dtype=dtype))
+    tasks = _tasks(n, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) == 1:
+        return _merge_all(_reduce_file_range(path, dtype, start, stop, chunk_size) for start, stop in tasks)
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_reduce_file_range, path, dtype, start, stop, chunk_size) for start, stop in tasks]
+        return _merge_all(f.result() for f in futures)
+
+
+# -----------------------
+# prep_20-style helpers
+# -----------------------
+def find_max(values, **kwargs):
+    return reduce_array(values, **kwargs).max
+
+
+def second_largest(values, **kwargs):
+    return reduce_array(values, **kwargs).second_largest
+
+
+def add(values, **kwargs):
+    return reduce_array(values, **kwargs).total
+
+
+def missing_number(values, **kwargs) -> Optional[int]:
+    return reduce_array(values, **kwargs).missing_number
+
+
+# Quick Tests (run this file directly)
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import prep_20
+
+    print("Running prep_20_reduce tests...")
+
+    assert prep_20.second_largest([5, 1, 3]) == second_largest([5, 1, 3]) == 3  # max first
+    assert second_largest([5, 5, 3]) == 5 and second_largest([7]) == 7
+
+    rng = random.Random(0)
+    for _ in range(100):
+        nums = [rng.randint(-10**6, 10**6) for _ in range(rng.randint(1, 3000))]
+        for kwargs in ({}, {"chunk_size": 7}, {"chunk_size": 5, "workers": 3}):
+            assert find_max(nums, **kwargs) == prep_20.find_max(nums)
+            assert second_largest(nums, **kwargs) == prep_20.second_largest(nums)
+            assert add(nums, **kwargs) == prep_20.add(nums)
+
+        n = rng.randint(1, 3000)
+        seq = list(range(1, n + 2))
+        gone = seq.pop(rng.randrange(len(seq)))
+        expected = prep_20.missing_number(seq)
+        rng.shuffle(seq)  # order does not matter here
+        assert missing_number(seq, chunk_size=64) == expected == (None if gone == n + 1 else gone)
+
+    assert add([0.5, 0.25]) == 0.75
+    # 64-bit sums are exact, where an int64 accumulator would wrap
+    big = [2**63 - 1, 2**63 - 2, -(2**63), 5]
+    assert add(np.array(big, dtype=np.int64), chunk_size=3) == sum(big)
+    huge = [2**64 - 1] * 1000 + [2**63, 7]
+    assert add(np.array(huge, dtype=np.uint64)) == sum(huge)
+    assert add(np.array([-5, 3], dtype=np.int8)) == -2
+    for fn in (prep_20.second_largest, second_largest, find_max):
+        try:
+            fn([])
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("empty input must raise IndexError")
+    try:
+        missing_number([1, 1, 4])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("duplicates must be rejected")
+
+    # Files, in-process and with a process pool
+    values = np.arange(1, 200_001, dtype=np.int64)
+    values = np.delete(values, 12_345)
+    np.random.default_rng(1).shuffle(values)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/values.i64"
+        values.tofile(path)
+        for workers in (1, 2):
+            stats = reduce_file(path, chunk_size=4096, workers=workers)
+            assert stats.max == 200_000 and stats.second_largest == 199_999
+            assert stats.total == int(values.sum()) and stats.missing_number == 12_346
+        open(f"{tmp}/empty", "wb").close()
+        assert reduce_file(f"{tmp}/empty").count == 0
+
+    print("✅ All prep_20_reduce tests passed!")
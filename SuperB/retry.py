@@ -1,3 +1,5 @@
+from collections import Counter
+
 #q1
 def anagrams(ls):
     ans = {}
@@ -13,10 +15,11 @@ def anagrams(ls):
 print(anagrams(["eat", "tea", "tan", "ate", "nat", "bat"]))
 
 #q2
+# O(n): count once, then the first character counted once
 def nonr(word):
-
+    counts = Counter(word)
     for i in word:
-        if word.count(i) == 1:
+        if counts[i] == 1:
             return i
 
 print(nonr("superbalist"))
@@ -15,7 +15,6 @@ def func(s, num_row):
         #reverse directions at top or botton
         if current_row == 0 or current_row == num_row -1:
             going_down = not going_down
-        print(going_down)
 
         current_row += 1 if going_down else -1
 